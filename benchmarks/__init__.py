@@ -0,0 +1,9 @@
+"""
+    benchmarks
+    ~~~~~~~~~~~
+
+    Time and memory benchmarks of pyexcel, see README.rst
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
@@ -0,0 +1,141 @@
+"""
+    benchmarks
+    ~~~~~~~~~~~
+
+    Command line of the benchmark suite
+
+    Measure and save the results::
+
+        python -m benchmarks run --sizes small,medium -o results.json
+
+    Compare them with a baseline, e.g. the results of a release::
+
+        python -m benchmarks compare baseline.json results.json
+
+    Time 'import pyexcel' with and without the plugin manifest::
+
+        python -m benchmarks imports
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import sys
+import json
+import argparse
+
+from . import data, cases, measure
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    run = commands.add_parser("run", help="measure the benchmark cases")
+    run.add_argument(
+        "--shapes",
+        default=",".join(sorted(data.SHAPES)),
+        help="comma separated shapes of %s" % sorted(data.SHAPES),
+    )
+    run.add_argument(
+        "--sizes",
+        default="small",
+        help="comma separated sizes of %s" % sorted(data.SIZES),
+    )
+    run.add_argument(
+        "--cases",
+        default="",
+        help="comma separated cases of %s. all by default"
+        % list(cases.CASES),
+    )
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("-o", "--output", help="json file. stdout by default")
+
+    compare = commands.add_parser(
+        "compare", help="compare the results with a baseline"
+    )
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slow down or memory growth that fails. 0.1 is 10%%",
+    )
+
+    imports = commands.add_parser(
+        "imports", help="time 'import pyexcel' with and without manifest"
+    )
+    imports.add_argument("--repeat", type=int, default=10)
+
+    options = parser.parse_args(argv)
+    if options.command == "run":
+        return _run(options)
+    if options.command == "imports":
+        return _imports(options)
+    return _compare(options)
+
+
+def _run(options):
+    shapes = _split(options.shapes)
+    sizes = _split(options.sizes)
+    names = _split(options.cases)
+    for values, known in (
+        (shapes, data.SHAPES),
+        (sizes, data.SIZES),
+        (names, cases.CASES),
+    ):
+        unknown = [value for value in values if value not in known]
+        if unknown:
+            sys.stderr.write("Unknown: %s\n" % ", ".join(unknown))
+            return 2
+    results = measure.run_cases(shapes, sizes, names, options.repeat)
+    if options.output:
+        measure.dump(results, options.output)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    return 0
+
+
+def _imports(options):
+    timings = measure.import_times(options.repeat)
+    for way in ("scan", "manifest"):
+        sys.stdout.write("%-10s %.4fs\n" % (way, timings[way]))
+    return 0
+
+
+def _compare(options):
+    comparisons = measure.compare(
+        measure.load(options.baseline),
+        measure.load(options.current),
+        options.threshold,
+    )
+    template = "%-20s %-8s %-8s %8s %8s %s\n"
+    sys.stdout.write(
+        template % ("case", "shape", "size", "time", "memory", "")
+    )
+    regressions = 0
+    for key, time_ratio, memory_ratio, regressed in comparisons:
+        if regressed:
+            regressions += 1
+        sys.stdout.write(
+            template
+            % (
+                key
+                + (
+                    "%.2fx" % time_ratio,
+                    "%.2fx" % memory_ratio,
+                    "REGRESSED" if regressed else "",
+                )
+            )
+        )
+    return 1 if regressions else 0
+
+
+def _split(values):
+    return [value for value in values.split(",") if value]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
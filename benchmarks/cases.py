@@ -0,0 +1,187 @@
+"""
+    benchmarks.cases
+    ~~~~~~~~~~~~~~~~~
+
+    What is measured
+
+    Each case is a function of an array which returns a pair of
+    functions: setup, whose time is not measured, and run, which
+    takes what setup returns and is measured.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import copy
+from collections import OrderedDict
+
+import pyexcel as pe
+from pyexcel.internal.sheets import Matrix
+
+CASES = OrderedDict()
+
+
+def case(name):
+    """Register a benchmark case by its name"""
+
+    def register(function):
+        CASES[name] = function
+        return function
+
+    return register
+
+
+def _csv(array):
+    return pe.save_as(array=array, dest_file_type="csv").getvalue()
+
+
+@case("get_sheet")
+def get_sheet(array):
+    content = _csv(array)
+
+    def run(_):
+        pe.get_sheet(file_type="csv", file_content=content)
+
+    return _nothing, run
+
+
+@case("get_sheet_named")
+def get_sheet_named(array):
+    content = _csv(array)
+
+    def run(_):
+        pe.get_sheet(
+            file_type="csv", file_content=content, name_columns_by_row=0
+        )
+
+    return _nothing, run
+
+
+@case("get_array")
+def get_array(array):
+    content = _csv(array)
+
+    def run(_):
+        pe.get_array(file_type="csv", file_content=content)
+
+    return _nothing, run
+
+
+@case("iget_records")
+def iget_records(array):
+    content = _csv(array)
+
+    def run(_):
+        for _ in pe.iget_records(file_type="csv", file_content=content):
+            pass
+        pe.free_resources()
+
+    return _nothing, run
+
+
+@case("iget_records_typed")
+def iget_records_typed(array):
+    content = _csv(array)
+
+    def run(_):
+        records = pe.iget_records(
+            file_type="csv", file_content=content, schema="infer"
+        )
+        for _ in records:
+            pass
+        pe.free_resources()
+
+    return _nothing, run
+
+
+@case("save_as")
+def save_as(array):
+    def run(_):
+        pe.save_as(array=array, dest_file_type="csv")
+
+    return _nothing, run
+
+
+@case("isave_as")
+def isave_as(array):
+    def run(_):
+        pe.isave_as(array=iter(array), dest_file_type="csv")
+        pe.free_resources()
+
+    return _nothing, run
+
+
+@case("sheet")
+def sheet(array):
+    def run(an_array):
+        pe.Sheet(an_array)
+
+    return _copy(array), run
+
+
+@case("transpose")
+def transpose(array):
+    def run(matrix):
+        matrix.transpose()
+        # a transpose is lazy until the rows are asked for
+        matrix.get_internal_array()
+
+    return _matrix(array), run
+
+
+@case("format")
+def format_cells(array):
+    def run(matrix):
+        matrix.format(str)
+
+    return _matrix(array), run
+
+
+@case("map")
+def map_cells(array):
+    def run(matrix):
+        matrix.map(lambda value: value)
+
+    return _matrix(array), run
+
+
+@case("to_records")
+def to_records(array):
+    def setup():
+        return pe.Sheet(copy.deepcopy(array), name_columns_by_row=0)
+
+    def run(a_sheet):
+        for _ in a_sheet.to_records():
+            pass
+
+    return setup, run
+
+
+@case("book")
+def book(array):
+    def setup():
+        return OrderedDict(
+            ("sheet %d" % index, copy.deepcopy(array)) for index in range(3)
+        )
+
+    def run(sheets):
+        pe.Book(sheets)
+
+    return setup, run
+
+
+def _nothing():
+    return None
+
+
+def _copy(array):
+    def setup():
+        return copy.deepcopy(array)
+
+    return setup
+
+
+def _matrix(array):
+    def setup():
+        return Matrix(copy.deepcopy(array))
+
+    return setup
@@ -0,0 +1,101 @@
+"""
+    benchmarks.data
+    ~~~~~~~~~~~~~~~~
+
+    Synthetic sheets of several shapes and sizes
+
+    The data is made by a seeded random generator, hence every run
+    sees the same sheets.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import random
+import datetime
+
+SEED = 20201008
+
+# rows of a narrow sheet. the other shapes keep a similar cell count
+SIZES = {"small": 1000, "medium": 10000, "large": 100000}
+
+NARROW_COLUMNS = 5
+WIDE_COLUMNS = 200
+RAGGED_COLUMNS = 20
+
+
+def make_array(shape, size):
+    """A two dimensional array whose first row is the header
+
+    :param str shape: 'narrow', 'wide', 'ragged' or 'typed'
+    :param str size: 'small', 'medium' or 'large'
+    """
+    rows = SIZES[size]
+    generator = random.Random(SEED)
+    return SHAPES[shape](generator, rows)
+
+
+def narrow(generator, rows):
+    """A few columns of short strings and integers"""
+    header = ["column %d" % index for index in range(NARROW_COLUMNS)]
+    array = [header]
+    for _ in range(rows):
+        array.append(
+            [
+                _word(generator) if index % 2 else generator.randint(0, 9999)
+                for index in range(NARROW_COLUMNS)
+            ]
+        )
+    return array
+
+
+def wide(generator, rows):
+    """Many columns of integers"""
+    header = ["column %d" % index for index in range(WIDE_COLUMNS)]
+    array = [header]
+    for _ in range(max(1, rows * NARROW_COLUMNS // WIDE_COLUMNS)):
+        array.append(
+            [generator.randint(0, 9999) for _ in range(WIDE_COLUMNS)]
+        )
+    return array
+
+
+def ragged(generator, rows):
+    """Rows of different lengths, with empty cells"""
+    header = ["column %d" % index for index in range(RAGGED_COLUMNS)]
+    array = [header]
+    for _ in range(rows // 2):
+        length = generator.randint(1, RAGGED_COLUMNS)
+        array.append(
+            [
+                "" if generator.random() < 0.2 else _word(generator)
+                for _ in range(length)
+            ]
+        )
+    return array
+
+
+def typed(generator, rows):
+    """A column per type: integer, float, boolean, date and string"""
+    array = [["integer", "float", "boolean", "date", "string"]]
+    start = datetime.date(2000, 1, 1)
+    for _ in range(rows):
+        array.append(
+            [
+                generator.randint(-99999, 99999),
+                round(generator.uniform(-1000, 1000), 3),
+                generator.random() < 0.5,
+                start + datetime.timedelta(days=generator.randint(0, 9000)),
+                _word(generator),
+            ]
+        )
+    return array
+
+
+SHAPES = {"narrow": narrow, "wide": wide, "ragged": ragged, "typed": typed}
+
+
+def _word(generator):
+    return "".join(
+        generator.choice("abcdefghijklmnopqrstuvwxyz")
+        for _ in range(generator.randint(3, 10))
+    )
@@ -0,0 +1,192 @@
+"""
+    benchmarks.measure
+    ~~~~~~~~~~~~~~~~~~~
+
+    Time and peak memory of the benchmark cases
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import gc
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+
+import pyexcel as pe
+
+from . import data, cases
+
+
+def measure(setup, run, repeat):
+    """Time a run a number of times, then trace its peak memory
+
+    The memory is traced in a run of its own because tracing slows
+    down the code being traced.
+
+    :returns: a dictionary of the best and the median seconds and
+              the peak bytes allocated during a run
+    """
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    timings.sort()
+    return {
+        "best": timings[0],
+        "median": timings[len(timings) // 2],
+        "peak_memory": peak,
+    }
+
+
+def run_cases(shapes, sizes, names=None, repeat=5, progress=sys.stderr):
+    """Measure the cases on the synthetic sheets
+
+    :param list names: the cases to measure. all by default
+    :returns: a dictionary which can be saved as json
+    """
+    results = []
+    for size in sizes:
+        for shape in shapes:
+            array = data.make_array(shape, size)
+            for name, a_case in cases.CASES.items():
+                if names and name not in names:
+                    continue
+                setup, run = a_case(array)
+                result = measure(setup, run, repeat)
+                result.update(
+                    case=name,
+                    shape=shape,
+                    size=size,
+                    rows=len(array),
+                    repeat=repeat,
+                )
+                results.append(result)
+                if progress is not None:
+                    progress.write(
+                        "%s %s %s: %.4fs %dKB\n"
+                        % (
+                            name,
+                            shape,
+                            size,
+                            result["median"],
+                            result["peak_memory"] // 1024,
+                        )
+                    )
+    return {
+        "pyexcel": pe.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+IMPORT_PYEXCEL = (
+    "import time; start = time.perf_counter(); import pyexcel; "
+    "print(time.perf_counter() - start)"
+)
+BUILD_MANIFEST = (
+    "from pyexcel.internal.manifest import build_manifest; build_manifest()"
+)
+
+
+def import_times(repeat=10):
+    """Time 'import pyexcel' in new interpreters
+
+    It is timed with the plugins found by a scan of sys.path and with
+    the plugins listed in an up to date manifest.
+
+    :returns: a dictionary of the median seconds of each way
+    """
+    from pyexcel.internal.manifest import MANIFEST_ENVIRONMENT_VARIABLE
+
+    folder = tempfile.mkdtemp()
+    try:
+        manifest_file = os.path.join(folder, "plugins.json")
+        timings = {}
+        for way, value in (("scan", ""), ("manifest", manifest_file)):
+            environment = dict(os.environ)
+            environment[MANIFEST_ENVIRONMENT_VARIABLE] = value
+            if value:
+                _run(BUILD_MANIFEST, environment)
+            # the first import warms the caches of the file system
+            _time_import(environment)
+            seconds = sorted(
+                _time_import(environment) for _ in range(repeat)
+            )
+            timings[way] = seconds[len(seconds) // 2]
+        return timings
+    finally:
+        shutil.rmtree(folder)
+
+
+def _time_import(environment):
+    return float(_run(IMPORT_PYEXCEL, environment))
+
+
+def _run(code, environment):
+    return subprocess.check_output(
+        [sys.executable, "-c", code], env=environment
+    )
+
+
+def compare(baseline, current, threshold=0.1):
+    """Match the results of two runs
+
+    :param float threshold: the relative increase of the median time
+                            or the peak memory which is a regression
+    :returns: a list of (key, time ratio, memory ratio, regressed)
+    """
+    baseline_results = dict(
+        (_key(result), result) for result in baseline["results"]
+    )
+    comparisons = []
+    for result in current["results"]:
+        before = baseline_results.get(_key(result))
+        if before is None:
+            continue
+        time_ratio = _ratio(result["median"], before["median"])
+        memory_ratio = _ratio(result["peak_memory"], before["peak_memory"])
+        regressed = (
+            time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+        )
+        comparisons.append(
+            (_key(result), time_ratio, memory_ratio, regressed)
+        )
+    return comparisons
+
+
+def load(file_name):
+    with open(file_name) as results:
+        return json.load(results)
+
+
+def dump(results, file_name):
+    with open(file_name, "w") as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+
+
+def _key(result):
+    return (result["case"], result["shape"], result["size"])
+
+
+def _ratio(now, before):
+    if before == 0:
+        return 1.0 if now == 0 else float("inf")
+    return float(now) / before
@@ -0,0 +1,90 @@
+"""
+pyexcel_async_server.py
+:copyright: (c) 2014-2020 by Onni Software Ltd.
+:license: New BSD License, see LICENSE for more details
+
+This shows how to handle excel file upload in an asyncio web server.
+The files are parsed and rendered in an executor, hence the event loop
+keeps serving other requests. In order to evaluate it, please install
+aiohttp::
+
+    pip install aiohttp
+    python pyexcel_async_server.py
+
+Then visit http://localhost:8080/upload
+"""
+import pyexcel as pe
+
+from aiohttp import web
+
+UPLOAD_FORM = """
+<form method="post" enctype="multipart/form-data">
+  <input type="file" name="excel">
+  <input type="submit" value="Upload">
+</form>
+"""
+
+data = [
+    ["REVIEW_DATE", "AUTHOR", "ISBN", "DISCOUNTED_PRICE"],
+    ["1985/01/21", "Douglas Adams", '0345391802', 5.95],
+    ["1990/01/12", "Douglas Hofstadter", '0465026567', 9.95],
+    ["1998/07/15", "Timothy \"The Parser\" Campbell", '0968411304', 18.99],
+    ["1999/12/03", "Richard Friedman", '0060630353', 5.95],
+    ["2004/10/04", "Randel Helms", '0879755725', 4.50]
+]
+
+
+async def upload_form(request):
+    return web.Response(text=UPLOAD_FORM, content_type="text/html")
+
+
+async def upload(request):
+    reader = await request.multipart()
+    field = await reader.next()
+    extension = field.filename.split(".")[-1]
+    # the uploaded part is read by chunks of the async stream
+    sheet = await pe.aget_sheet(
+        file_stream=field, file_type=extension, name_columns_by_row=0
+    )
+    return web.json_response({"result": sheet.dict})
+
+
+async def upload_records(request):
+    reader = await request.multipart()
+    field = await reader.next()
+    extension = field.filename.split(".")[-1]
+    count = 0
+    # a large file is parsed a thousand rows at a time
+    async for record in pe.aiget_records(
+        file_stream=field, file_type=extension
+    ):
+        count += 1
+    return web.json_response({"records": count})
+
+
+async def download(request):
+    response = web.StreamResponse(
+        headers={
+            "Content-Disposition": "attachment; filename=export.csv",
+            "Content-Type": "text/csv",
+        }
+    )
+    await response.prepare(request)
+    content = await pe.asave_as(array=data, dest_file_type="csv")
+    await response.write(content.getvalue().encode("utf-8"))
+    return response
+
+
+app = web.Application()
+app.add_routes(
+    [
+        web.get("/upload", upload_form),
+        web.post("/upload", upload),
+        web.post("/upload/records", upload_records),
+        web.get("/download", download),
+    ]
+)
+
+
+if __name__ == "__main__":
+    web.run_app(app)
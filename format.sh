@@ -1,3 +1,4 @@
-isort $(find pyexcel -name "*.py"|xargs echo) $(find tests -name "*.py"|xargs echo)
+isort $(find pyexcel -name "*.py"|xargs echo) $(find tests -name "*.py"|xargs echo) $(find benchmarks -name "*.py"|xargs echo)
 black -l 79 pyexcel
 black -l 79 tests
+black -l 79 benchmarks
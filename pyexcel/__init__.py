@@ -12,16 +12,22 @@
 from .book import Book
 from .core import (
     save_as,
+    asave_as,
     get_book,
     get_dict,
     isave_as,
+    aget_book,
     get_array,
     get_sheet,
     iget_book,
+    aget_sheet,
     iget_array,
+    iget_sheet,
+    aiget_array,
     get_records,
     iget_records,
     save_book_as,
+    aiget_records,
     get_book_dict,
     isave_book_as,
 )
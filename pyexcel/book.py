@@ -8,6 +8,7 @@
     :license: New BSD License, see LICENSE for more details
 """
 from pyexcel import _compact as compact
+from pyexcel import constants as constants
 from pyexcel.sheet import Sheet
 from pyexcel.internal.meta import BookMeta
 from pyexcel.internal.common import SheetIterator
@@ -147,30 +148,30 @@ class Book(BookMeta):
             book3 = book1 + book2
             book3 = book1 + book2["Sheet 1"]
 
+        The sheets of book3 share the data of those of book1 and
+        book2 until either changes.
         """
         content = {}
-        current_dict = self.to_dict()
-        for k in current_dict.keys():
-            new_key = k
-            if len(current_dict.keys()) == 1:
-                new_key = "%s_%s" % (self.filename, k)
-            content[new_key] = current_dict[k]
+        for sheet in self:
+            new_key = sheet.name
+            if self.number_of_sheets() == 1:
+                new_key = "%s_%s" % (self.filename, sheet.name)
+            content[new_key] = share_book_sheet(sheet, new_key)
         if isinstance(other, Book):
-            other_dict = other.to_dict()
-            for key in other_dict.keys():
-                new_key = key
-                if len(other_dict.keys()) == 1:
+            for sheet in other:
+                new_key = sheet.name
+                if other.number_of_sheets() == 1:
                     new_key = other.filename
                 if new_key in content:
                     uid = local_uuid()
-                    new_key = "%s_%s" % (key, uid)
-                content[new_key] = other_dict[key]
+                    new_key = "%s_%s" % (sheet.name, uid)
+                content[new_key] = share_book_sheet(sheet, new_key)
         elif isinstance(other, Sheet):
             new_key = other.name
             if new_key in content:
                 uid = local_uuid()
                 new_key = "%s_%s" % (other.name, uid)
-            content[new_key] = other.array
+            content[new_key] = share_book_sheet(other, new_key)
         else:
             raise TypeError
         output = Book()
@@ -196,13 +197,15 @@ class Book(BookMeta):
                 if new_key in self.__name_array:
                     uid = local_uuid()
                     new_key = "%s_%s" % (name, uid)
-                self.__sheets[new_key] = Sheet(other[name].array, new_key)
+                self.__sheets[new_key] = share_book_sheet(
+                    other[name], new_key
+                )
         elif isinstance(other, Sheet):
             new_key = other.name
             if new_key in self.__name_array:
                 uid = local_uuid()
                 new_key = "%s_%s" % (other.name, uid)
-            self.__sheets[new_key] = Sheet(other.array, new_key)
+            self.__sheets[new_key] = share_book_sheet(other, new_key)
         else:
             raise TypeError
         self.__name_array = list(self.__sheets.keys())
@@ -215,6 +218,36 @@ class Book(BookMeta):
             the_dict.update({sheet.name: sheet.array})
         return the_dict
 
+    def to_numpy(self, dtype=None):
+        """Convert the book to a dictionary of numpy arrays"""
+        the_dict = compact.OrderedDict()
+        for sheet in self:
+            the_dict[sheet.name] = sheet.to_numpy(dtype=dtype)
+        return the_dict
+
+    @classmethod
+    def from_numpy(cls, arrays, storage=constants.ROW_STORAGE):
+        """Make a book of a dictionary of numpy arrays"""
+        sheets = compact.OrderedDict()
+        for name, array in arrays.items():
+            sheets[name] = Sheet.from_numpy(array, name=name, storage=storage)
+        return cls(sheets)
+
+    def to_arrow(self):
+        """Convert the book to a dictionary of arrow record batches"""
+        the_dict = compact.OrderedDict()
+        for sheet in self:
+            the_dict[sheet.name] = sheet.to_arrow()
+        return the_dict
+
+    @classmethod
+    def from_arrow(cls, batches, storage=constants.ROW_STORAGE):
+        """Make a book of a dictionary of arrow record batches or tables"""
+        sheets = compact.OrderedDict()
+        for name, batch in batches.items():
+            sheets[name] = Sheet.from_arrow(batch, name=name, storage=storage)
+        return cls(sheets)
+
 
 def to_book(bookstream):
     """Convert a bookstream to Book"""
@@ -228,6 +261,27 @@ def to_book(bookstream):
         )
 
 
+def share_sheet(matrix, name):
+    """A new sheet sharing the data of a matrix until either changes
+
+    Names of columns and rows, if any, are left out
+    """
+    sheet = Sheet(name=name)
+    sheet._borrow(matrix)
+    return sheet
+
+
+def share_book_sheet(sheet, name):
+    """A new sheet of the array of a sheet, as kept in a book
+
+    A sheet with named columns or rows has its names in the array,
+    hence gets copied. Other sheets share their data.
+    """
+    if len(sheet.colnames) > 0 or len(sheet.rownames) > 0:
+        return Sheet([list(row) for row in sheet.to_array()], name)
+    return share_sheet(sheet, name)
+
+
 def local_uuid():
     """create home made uuid"""
     global LOCAL_UUID
@@ -0,0 +1,224 @@
+"""
+    pyexcel.cache
+    ~~~~~~~~~~~~~~~~~~~
+
+    A cache of parsed files on disk
+
+    A file read with a cache directory, given by the cache_dir keyword
+    or by :func:`set_cache_dir`, is parsed once. Its sheets are saved
+    in the directory, in the binary format of pickle, and loaded from
+    there for as long as the file keeps its size and its modification
+    time and is read with the same keywords. Once the entries take
+    more than the cache size, those used least recently are removed.
+
+    Example::
+
+        >>> import pyexcel as pe
+        >>> from pyexcel import cache
+        >>> cache.set_cache_dir("/var/cache/pyexcel")  # doctest: +SKIP
+        >>> sheet = pe.get_sheet(file_name="lookup.xlsx")  # doctest: +SKIP
+
+    An entry may refer to no classes but those of dates and decimals,
+    hence loading one runs no code of others who can write in the
+    directory.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import os
+import pickle
+import hashlib
+import tempfile
+
+from pyexcel._compact import OrderedDict
+
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+# bumped whenever the entries change their layout
+FORMAT_VERSION = 1
+ENTRY_SUFFIX = ".pxc"
+PLAIN_TYPES = (str, bytes, int, float, bool, type(None))
+SAFE_CLASSES = set(
+    [
+        ("datetime", "date"),
+        ("datetime", "datetime"),
+        ("datetime", "time"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+        ("decimal", "Decimal"),
+    ]
+)
+MESSAGE_UNSAFE_CLASS = "%s.%s is not allowed in a cache entry"
+
+_CACHE_DIR = None
+_CACHE_SIZE = DEFAULT_CACHE_SIZE
+
+
+def set_cache_dir(cache_dir, cache_size=DEFAULT_CACHE_SIZE):
+    """Cache the files read from now on in the directory
+
+    :param cache_dir: the directory, which is made if missing. None
+                      turns the cache off
+    :param int cache_size: the bytes the entries may take
+    """
+    global _CACHE_DIR, _CACHE_SIZE
+    _CACHE_DIR = cache_dir
+    _CACHE_SIZE = cache_size
+
+
+def get_cache(cache_dir=None, cache_size=None):
+    """The cache in the given directory, else in the one set
+
+    :returns: a :class:`ParseCache`, or None if no directory is given
+              nor set
+    """
+    if cache_dir is None:
+        cache_dir = _CACHE_DIR
+    if cache_dir is None:
+        return None
+    if cache_size is None:
+        cache_size = _CACHE_SIZE
+    return ParseCache(cache_dir, cache_size)
+
+
+class ParseCache(object):
+    """Parsed files, saved as entries of a directory
+
+    Each entry is a file named after the hash of what it depends on.
+    Its modification time tells when it was used last.
+    """
+
+    def __init__(self, cache_dir, cache_size=DEFAULT_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+
+    def parse_file(self, parser, file_name, **keywords):
+        """Parse the file by the parser, unless it is in the cache
+
+        On demand or not, the file is read in full, so as to save it.
+        Keywords other than text, numbers and their lists, e.g.
+        functions, cannot tell if an entry was made with them, hence
+        the file is parsed as usual.
+        """
+        plain_keywords = dict(keywords)
+        plain_keywords.pop("on_demand", None)
+        key = self.key(parser, file_name, plain_keywords)
+        if key is None:
+            return parser.parse_file(file_name, **keywords)
+        sheets = self.load(key)
+        if sheets is None:
+            sheets = parser.parse_file(file_name, **plain_keywords)
+            self.save(key, sheets)
+        return sheets
+
+    def key(self, parser, file_name, keywords):
+        """A hash of the path, the size and the modification time of
+        the file, the parser and the keywords
+
+        :returns: None if any keyword is not plain
+        """
+        if not all(_is_plain(value) for value in keywords.values()):
+            return None
+        path = os.path.abspath(file_name)
+        stat = os.stat(path)
+        identity = (
+            FORMAT_VERSION,
+            path,
+            stat.st_size,
+            stat.st_mtime_ns,
+            "%s.%s" % (parser.__class__.__module__, parser.__class__.__name__),
+            sorted(keywords.items()),
+        )
+        return hashlib.sha256(repr(identity).encode("utf-8")).hexdigest()
+
+    def load(self, key):
+        """The sheets of an entry, or None if there is none
+
+        An entry which cannot be read is removed
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as entry:
+                pairs = _SafeUnpickler(entry).load()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            _remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # removed by another process in the meantime
+            pass
+        return OrderedDict(pairs)
+
+    def save(self, key, sheets):
+        """Save the sheets as an entry, then make room for it
+
+        Sheets larger than the cache are not saved.
+        """
+        pairs = [(name, list(rows)) for name, rows in sheets.items()]
+        try:
+            content = pickle.dumps(pairs, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if len(content) > self.cache_size:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # written aside and renamed, lest a reader sees half an entry
+        handle, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(handle, "wb") as entry:
+                entry.write(content)
+            os.replace(temp_path, self._entry_path(key))
+        except OSError:
+            _remove(temp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """Remove the entries used least recently beyond the cache size"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(ENTRY_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.cache_size:
+                break
+            _remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove all entries"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(ENTRY_SUFFIX):
+                _remove(entry.path)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ENTRY_SUFFIX)
+
+
+class _SafeUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if (module, name) not in SAFE_CLASSES:
+            raise pickle.UnpicklingError(MESSAGE_UNSAFE_CLASS % (module, name))
+        return pickle.Unpickler.find_class(self, module, name)
+
+
+def _is_plain(value):
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    return isinstance(value, PLAIN_TYPES)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
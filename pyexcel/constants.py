@@ -46,6 +46,23 @@ MESSAGE_NOT_IMPLEMENTED_02 = (
     "Confused! What do you want to put as column names"
 )
 MESSAGE_READONLY = "This attribute is readonly"
+MESSAGE_UNKNOWN_STORAGE = (
+    "Unknown storage '%s'. Please use 'row' or 'columnar'"
+)
+MESSAGE_UNKNOWN_SCHEMA = (
+    "schema should be 'infer' or a dictionary of column names and types"
+)
+MESSAGE_UNKNOWN_EXECUTOR = (
+    "Unknown executor '%s'. Please use 'thread' or 'process'"
+)
+MESSAGE_UNKNOWN_INDEX = "Unknown index '%s'. Please use 'hash' or 'sorted'"
+MESSAGE_UNKNOWN_OPERATOR = (
+    "Unknown operator '%s'. Please use '==', '!=', '<', '<=', '>' or '>='"
+)
+MESSAGE_UNKNOWN_JOIN = "Unknown join '%s'. Please use 'inner' or 'left'"
+MESSAGE_MISSING_LIBRARY = "Please install '%s' to convert from or to it"
+MESSAGE_NO_MATCHING_TABLE = "No table is given for the sheet '%s'"
+MESSAGE_NOT_TWO_DIMENSIONAL = "A one or two dimensional array is expected"
 MESSAGE_ERROR_NO_HANDLER = "No suitable plugins imported or installed"
 MESSAGE_UNKNOWN_IO_OPERATION = "Internal error: an illegal source action"
 MESSAGE_UPGRADE = "Please upgrade the plugin '%s' according to \
@@ -98,8 +115,43 @@ VALID_SHEET_PARAMETERS = [
     "rownames",
     "transpose_before",
     "transpose_after",
+    "storage",
 ]
 
+# storages of sheet data
+ROW_STORAGE = "row"
+COLUMNAR_STORAGE = "columnar"
+STORAGES = (ROW_STORAGE, COLUMNAR_STORAGE)
+
+# schema of typed records
+INFER_SCHEMA = "infer"
+DEFAULT_SAMPLE_SIZE = 100
+
+# pools of workers
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+
+# rows read at a time by the async iterators
+DEFAULT_ASYNC_CHUNK_SIZE = 1000
+
+# metadata of the arrow record batches of sheets
+ARROW_METADATA_KEY = b"pyexcel"
+
+# rows and columns shown by repr() of a sheet
+DEFAULT_PREVIEW_ROWS = 60
+DEFAULT_PREVIEW_COLUMNS = 20
+
+# partitions of rows
+DEFAULT_MAX_BUFFERED_ROWS = 100000
+
+# indexes of column values
+HASH_INDEX = "hash"
+SORTED_INDEX = "sorted"
+RANGE_OPERATORS = ("<", "<=", ">", ">=")
+INNER_JOIN = "inner"
+LEFT_JOIN = "left"
+JOINS = (INNER_JOIN, LEFT_JOIN)
+
 
 # for sources
 # targets
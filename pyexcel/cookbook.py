@@ -8,15 +8,28 @@
     :license: New BSD License, see LICENSE for more details
 """
 import os
+import re
+from itertools import chain
 
 from pyexcel.book import Book
-from pyexcel.core import save_as, get_book, get_sheet
+from pyexcel.core import save_as, get_book, get_sheet, iget_array
 from pyexcel._compact import OrderedDict
-from pyexcel.constants import MESSAGE_WARNING
+from pyexcel.constants import (
+    DEFAULT_NA,
+    THREAD_EXECUTOR,
+    MESSAGE_WARNING,
+    DEFAULT_MAX_BUFFERED_ROWS,
+)
+from pyexcel.internal import parallel as parallel
+from pyexcel.internal import garbagecollector as gc
+from pyexcel.internal.partition import RowPartitioner
+from pyexcel.internal.generators import SheetStream
 
 DEFAULT_OUT_FILE = "pyexcel_merged.csv"
 DEFAULT_OUT_XLS_FILE = "merged.xls"
 OUT_FILE_FORMATTER = "pyexcel_%s"
+# characters of a key which cannot be in a file name on some platform
+UNSAFE_FILE_NAME_CHARACTERS = re.compile(r'[\x00-\x1f\\/:*?"<>|]')
 
 
 def update_columns(infilename, column_dicts, outfilename=None):
@@ -121,30 +134,53 @@ def merge_two_readers(reader1, reader2, outfilename=DEFAULT_OUT_FILE):
     merge_readers(reader_array, outfilename)
 
 
-def merge_csv_to_a_book(filelist, outfilename=DEFAULT_OUT_XLS_FILE):
+def merge_csv_to_a_book(
+    filelist,
+    outfilename=DEFAULT_OUT_XLS_FILE,
+    workers=None,
+    executor=THREAD_EXECUTOR,
+):
     """merge a list of csv files into a excel book
 
     :param list filelist: a list of accessible file path
     :param str outfilename: save the sheet as
+    :param int workers: the number of files to be read at the same time
+    :param str executor: 'thread' or 'process'
     """
     merged = Book()
-    for file_name in filelist:
-        sheet = get_sheet(file_name=file_name)
+    sheets = parallel.get_sheets(
+        [dict(file_name=file_name) for file_name in filelist],
+        workers,
+        executor,
+    )
+    for file_name, sheet in zip(filelist, sheets):
         _, tail = os.path.split(file_name)
         sheet.name = tail
         merged += sheet
     merged.save_as(outfilename)
 
 
-def merge_all_to_a_book(filelist, outfilename=DEFAULT_OUT_XLS_FILE):
+def merge_all_to_a_book(
+    filelist,
+    outfilename=DEFAULT_OUT_XLS_FILE,
+    workers=None,
+    executor=THREAD_EXECUTOR,
+):
     """merge a list of excel files into a excel book
 
     :param list filelist: a list of accessible file path
     :param str outfilename: save the sheet as
+    :param int workers: the number of files to be read at the same time
+    :param str executor: 'thread' or 'process'
     """
     merged = Book()
-    for file_name in filelist:
-        merged += get_book(file_name=file_name)
+    books = parallel.get_books(
+        [dict(file_name=file_name) for file_name in filelist],
+        workers,
+        executor,
+    )
+    for book in books:
+        merged += book
     merged.save_as(outfilename)
 
 
@@ -164,6 +200,73 @@ def split_a_book(file_name, outfilename=None):
         sheet.save_as(filename)
 
 
+def split_a_sheet_by_column(
+    file_name,
+    column_index_or_name,
+    outfilename=None,
+    file_type=None,
+    header=True,
+    max_buffered_rows=DEFAULT_MAX_BUFFERED_ROWS,
+    **keywords
+):
+    """Split the rows of a file by the values of a column
+
+    The file is read row by row and each row goes to the output of
+    its value in the column. At most max_buffered_rows rows are kept
+    in memory, the others wait in a temporary file, hence it works
+    for files of any size.
+
+    :param str file_name: an accessible file name
+    :param column_index_or_name: the column of the keys, which can
+                                 be a name if the file has a header
+    :param str outfilename: save the rows of each key in the folder
+                            of outfilename, as '<key>_<its base name>'.
+                            Characters of the key which cannot be in a
+                            file name, e.g. '/', become '_'
+    :param str file_type: the file type of the memory streams to be
+                          returned when there is no outfilename
+    :param bool header: whether the first row is the header, which is
+                        then written to each output
+    :param int max_buffered_rows: the maximum number of rows to be
+                                  kept in memory
+    :returns: an ordered dictionary of keys and their output file
+              names, or their memory streams
+    """
+    if outfilename is None and file_type is None:
+        outfilename = file_name
+    with gc.collecting() as opened:
+        rows = iter(iget_array(file_name=file_name, **keywords))
+    partitioner = RowPartitioner(max_buffered_rows=max_buffered_rows)
+    outputs = OrderedDict()
+    try:
+        headers = []
+        column_index = column_index_or_name
+        if header:
+            headers = [next(rows, [])]
+            if isinstance(column_index_or_name, str):
+                column_index = headers[0].index(column_index_or_name)
+        for row in rows:
+            key = DEFAULT_NA
+            if column_index < len(row):
+                key = row[column_index]
+            partitioner.add(key, row)
+        gc.close(opened)
+        used_names = set()
+        for key in partitioner.keys():
+            sheet = SheetStream(
+                str(key), chain(headers, partitioner.rows(key))
+            )
+            if outfilename:
+                outputs[key] = _key_file_name(key, outfilename, used_names)
+                sheet.save_as(outputs[key])
+            else:
+                outputs[key] = sheet.save_to_memory(file_type)
+    finally:
+        partitioner.close()
+        gc.close(opened)
+    return outputs
+
+
 def extract_a_sheet_from_a_book(file_name, sheetname, outfilename=None):
     """Extract a sheet from a excel book
 
@@ -179,3 +282,20 @@ def extract_a_sheet_from_a_book(file_name, sheetname, outfilename=None):
     sheet = book[sheetname]
     file_name = "%s_%s" % (sheetname, saveas)
     sheet.save_as(file_name)
+
+
+def _key_file_name(key, outfilename, used_names):
+    """'<key>_<base name>' in the folder of outfilename
+
+    Keys which are alike once made safe get a number, e.g. 'a_b' and
+    'a/b' are saved as 'a_b_<base name>' and 'a_b-2_<base name>'
+    """
+    folder, base_name = os.path.split(outfilename)
+    prefix = UNSAFE_FILE_NAME_CHARACTERS.sub("_", str(key))
+    name = prefix
+    count = 1
+    while name in used_names:
+        count += 1
+        name = "%s-%d" % (prefix, count)
+    used_names.add(name)
+    return os.path.join(folder, "%s_%s" % (name, base_name))
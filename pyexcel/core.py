@@ -8,6 +8,7 @@
     :license: New BSD License
 """
 import re
+from functools import partial
 
 from pyexcel import constants as constants
 from pyexcel import docstrings as docs
@@ -15,6 +16,9 @@ from pyexcel.book import Book, to_book
 from pyexcel.sheet import Sheet
 from pyexcel._compact import OrderedDict, append_doc, zip_longest
 from pyexcel.internal import core as sources
+from pyexcel.internal import records as records
+from pyexcel.internal import parallel as parallel
+from pyexcel.internal import asynchronous as asynchronous
 
 from pyexcel_io import manager as manager
 
@@ -40,10 +44,16 @@ def get_sheet(**keywords):
 
 
 @append_doc(docs.GET_BOOK)
-def get_book(**keywords):
+def get_book(workers=None, executor=constants.THREAD_EXECUTOR, **keywords):
     """
     Get an instance of :class:`Book` from an excel source
+
+    With more than one workers, the sheets are built concurrently by a
+    pool of threads, or read by a pool of processes when executor is
+    'process'. The latter needs a file or a file content as the source.
     """
+    if workers is not None and workers > 1:
+        return parallel.get_book(workers, executor, **keywords)
     book_stream = sources.get_book_stream(**keywords)
     book = Book(
         book_stream.to_dict(),
@@ -192,8 +202,29 @@ def iget_array(**keywords):
     return sheet_stream.payload
 
 
+@append_doc(docs.IGET_SHEET)
+def iget_sheet(header=False, **keywords):
+    """
+    Obtain a sheet stream from an excel source, read as it is used
+
+    Its rows are transformed lazily by filter, map, map_rows,
+    project, rename, skip and limit, and are read when the stream
+    is iterated or saved, by its save_as or by
+    isave_as(sheet_stream=...). When header is True, the first row
+    names the columns.
+    """
+    sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
+    sheet_stream.header = header
+    return sheet_stream
+
+
 @append_doc(docs.IGET_RECORDS)
-def iget_records(custom_headers=None, **keywords):
+def iget_records(
+    custom_headers=None,
+    schema=None,
+    sample_size=constants.DEFAULT_SAMPLE_SIZE,
+    **keywords
+):
     """
     Obtain a generator of a list of records from an excel source
 
@@ -201,27 +232,47 @@ def iget_records(custom_headers=None, **keywords):
     footprint but requires the headers to be in the first row. And the
     data matrix should be of equal length. It should consume less memory
     and should work well with large files.
+
+    When schema is given, the records are namedtuples instead of
+    dictionaries and the values are coerced to the column types.
+    schema can be 'infer', in which case the column types are inferred
+    from the first sample_size rows, or a dictionary of column names
+    and types.
     """
     sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
+    if schema is not None:
+        typed_records = records.iget_typed_records(
+            sheet_stream.payload,
+            schema,
+            sample_size=sample_size,
+            headers=custom_headers,
+        )
+        for record in typed_records:
+            yield record
+        return
     headers = None
     for row_index, row in enumerate(sheet_stream.payload):
         if row_index == 0:
             headers = row
-        else:
             if custom_headers:
-                # custom order
-                tmp_dict = dict(
-                    zip_longest(headers, row, fillvalue=constants.DEFAULT_NA)
-                )
-                ordered_dict = OrderedDict()
-                for name in custom_headers:
-                    ordered_dict[name] = tmp_dict[name]
-                yield ordered_dict
-            else:
-                # default order
-                yield OrderedDict(
-                    zip_longest(headers, row, fillvalue=constants.DEFAULT_NA)
+                positions = dict(
+                    (name, index) for index, name in enumerate(headers)
                 )
+        elif custom_headers:
+            # custom order
+            ordered_dict = OrderedDict()
+            for name in custom_headers:
+                index = positions[name]
+                if index < len(row):
+                    ordered_dict[name] = row[index]
+                else:
+                    ordered_dict[name] = constants.DEFAULT_NA
+            yield ordered_dict
+        else:
+            # default order
+            yield OrderedDict(
+                zip_longest(headers, row, fillvalue=constants.DEFAULT_NA)
+            )
 
 
 @append_doc(docs.GET_BOOK_DICT)
@@ -236,6 +287,111 @@ def get_book_dict(**keywords):
     return book.to_dict()
 
 
+@append_doc(docs.GET_SHEET)
+async def aget_sheet(pool=None, **keywords):
+    """
+    Get an instance of :class:`Sheet` without blocking the event loop
+
+    It takes the parameters of :meth:`~pyexcel.get_sheet`, which runs
+    in pool, an executor, or the default executor of the loop. The
+    file_stream can be an async stream, whose read is a coroutine.
+    """
+    keywords = await asynchronous.read_async_source(keywords)
+    return await asynchronous.run(get_sheet, pool, **keywords)
+
+
+@append_doc(docs.GET_BOOK)
+async def aget_book(pool=None, **keywords):
+    """
+    Get an instance of :class:`Book` without blocking the event loop
+
+    It takes the parameters of :meth:`~pyexcel.get_book`, which runs
+    in pool, an executor, or the default executor of the loop. The
+    file_stream can be an async stream, whose read is a coroutine.
+    """
+    keywords = await asynchronous.read_async_source(keywords)
+    return await asynchronous.run(get_book, pool, **keywords)
+
+
+@append_doc(docs.SAVE_AS)
+async def asave_as(pool=None, **keywords):
+    """
+    Save a sheet from a data source to another one without blocking
+    the event loop
+
+    It takes the parameters of :meth:`~pyexcel.save_as`, which runs in
+    pool, an executor, or the default executor of the loop. The
+    file_stream and the dest_file_stream can be async streams. The
+    latter is written after the sheet is rendered in memory.
+    """
+    keywords = await asynchronous.read_async_source(keywords)
+    sink = keywords.get("dest_file_stream")
+    if not asynchronous.is_async_sink(sink):
+        return await asynchronous.run(save_as, pool, **keywords)
+    keywords.pop("dest_file_stream")
+    io = await asynchronous.run(save_as, pool, **keywords)
+    await asynchronous.write_async_sink(sink, io.getvalue())
+    return sink
+
+
+@append_doc(docs.IGET_ARRAY)
+async def aiget_array(
+    chunk_size=constants.DEFAULT_ASYNC_CHUNK_SIZE, pool=None, **keywords
+):
+    """
+    Obtain an async generator of the rows of an excel source
+
+    It is similar to :meth:`pyexcel.iget_array` but it reads chunk_size
+    rows at a time in pool, an executor, or the default executor of
+    the loop. The file is closed when the generator is done.
+    """
+    keywords = await asynchronous.read_async_source(keywords)
+    rows = asynchronous.iterate(
+        partial(iget_array, **keywords), chunk_size, pool
+    )
+    try:
+        async for row in rows:
+            yield row
+    finally:
+        await rows.aclose()
+
+
+@append_doc(docs.IGET_RECORDS)
+async def aiget_records(
+    custom_headers=None,
+    schema=None,
+    sample_size=constants.DEFAULT_SAMPLE_SIZE,
+    chunk_size=constants.DEFAULT_ASYNC_CHUNK_SIZE,
+    pool=None,
+    **keywords
+):
+    """
+    Obtain an async generator of the records of an excel source
+
+    It is similar to :meth:`pyexcel.iget_records` but it reads
+    chunk_size records at a time in pool, an executor, or the default
+    executor of the loop. The file is closed when the generator is
+    done.
+    """
+    keywords = await asynchronous.read_async_source(keywords)
+    a_records = asynchronous.iterate(
+        partial(
+            iget_records,
+            custom_headers=custom_headers,
+            schema=schema,
+            sample_size=sample_size,
+            **keywords
+        ),
+        chunk_size,
+        pool,
+    )
+    try:
+        async for record in a_records:
+            yield record
+    finally:
+        await a_records.aclose()
+
+
 def get_io_type(file_type):
     """
     Return the io stream types, string or bytes
@@ -17,6 +17,7 @@ from .core import (
     GET_SHEET,
     IGET_BOOK,
     IGET_ARRAY,
+    IGET_SHEET,
     GET_RECORDS,
     IGET_RECORDS,
     SAVE_BOOK_AS,
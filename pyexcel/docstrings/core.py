@@ -83,7 +83,7 @@ file             dest_file_name, dest_sheet_name,
 memory           dest_file_type, dest_content,
                  dest_sheet_name, keywords with prefix 'dest'
 sql              dest_session, dest_tables,
-                 dest_table_init_func, dest_mapdict
+                 dest_table_init_func, dest_mapdict, dest_batch_size
 django model     dest_models, dest_initializers,
                  dest_mapdict, dest_batch_size
 ================ ============================================
@@ -96,6 +96,8 @@ GET_ARRAY = __GET_SHEET__
 
 IGET_ARRAY = __GET_SHEET__ + I_NOTE
 
+IGET_SHEET = __GET_SHEET__ + I_NOTE
+
 GET_DICT = __GET_SHEET__
 
 GET_RECORDS = __GET_SHEET__
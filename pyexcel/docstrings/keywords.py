@@ -118,6 +118,15 @@ source_library :
 parser_library :
     choose a pyexcel parser plugin for reading
 
+cache_dir :
+    with a file name, a directory to cache the parsed file in. An
+    unchanged file read again with the same keywords is loaded from
+    there. defaults to the one of :func:`pyexcel.cache.set_cache_dir`
+
+cache_size :
+    the bytes the cache may take, beyond which the entries used least
+    recently are removed
+
 skip_hidden_sheets:
      default is True. Please toggle it to read hidden sheets
 
@@ -192,12 +201,21 @@ table :
 model:
     a django model
 
+batch_size :
+    with a table, a django model or query sets, the rows are fetched
+    this many at a time. iget_array, iget_records and isave_as then
+    stream them instead of loading the whole query result
+
 adict:
     a dictionary of one dimensional arrays
 
 url :
     a download http url for your excel file
 
+sheet_stream :
+    a sheet stream of :func:`pyexcel.iget_sheet`, e.g. after its
+    filter, map or project
+
 with_keys :
     load with previous dictionary's keys, default is True
 
@@ -227,9 +245,11 @@ source                     parameters
 loading from file          file_name, sheet_name, keywords
 loading from string        file_content, file_type, sheet_name, keywords
 loading from stream        file_stream, file_type, sheet_name, keywords
-loading from sql           session, table
-loading from sql in django model
-loading from query sets    any query sets(sqlalchemy or django)
+loading from sql           session, table, batch_size
+loading from sheet stream  sheet_stream
+loading from sql in django model, batch_size
+loading from query sets    any query sets(sqlalchemy or django),
+                           batch_size
 loading from dictionary    adict, with_keys
 loading from records       records
 loading from array         array
@@ -268,8 +288,8 @@ dest_mapdict:
     nominate headers
 
 dest_batch_size:
-    object creation batch size.
-    it is Django specific
+    object creation batch size for a django model. for a sql table,
+    the rows are inserted and committed this many at a time
 
 dest_library:
     choose a specific pyexcel-io plugin for writing
@@ -292,7 +312,7 @@ file              dest_file_name, dest_sheet_name,dest_force_file_type
 memory            dest_file_type, dest_content,
                   dest_sheet_name, keywords with prefix 'dest'
 sql               dest_session, dest_table,
-                  dest_initializer, dest_mapdict
+                  dest_initializer, dest_mapdict, dest_batch_size
 django model      dest_model, dest_initializer,
                   dest_mapdict, dest_batch_size
 ================= =============================================
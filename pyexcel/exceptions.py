@@ -25,3 +25,9 @@ class UpgradePlugin(Exception):
     """Please upgrade your plugin"""
 
     pass
+
+
+class NoMatchingTable(Exception):
+    """No table is given for a sheet to be saved to a database"""
+
+    pass
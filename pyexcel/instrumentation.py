@@ -0,0 +1,206 @@
+"""
+    pyexcel.instrumentation
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Timing and memory events of the stages of reading and writing
+
+    An observer is any callable which takes an :class:`Event`. While
+    no observer is registered, the stages cost nothing but a check.
+
+    Example::
+
+        >>> import pyexcel as pe
+        >>> from pyexcel import instrumentation
+        >>> with instrumentation.observe() as aggregator:
+        ...     sheet = pe.get_sheet(array=[["X"], [1], [2]],
+        ...                          name_columns_by_row=0)
+        >>> sorted(aggregator.summary())  # doctest: +NORMALIZE_WHITESPACE
+        [('get_sheet_stream', 'parse'), ('get_sheet_stream', 'source'),
+         ('sheet', 'name_series'), ('sheet', 'uniform')]
+        >>> aggregator.summary()[('sheet', 'uniform')]['cells']
+        3
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import time
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from collections import namedtuple
+
+from pyexcel._compact import OrderedDict
+
+Event = namedtuple(
+    "Event", ["operation", "stage", "duration", "rows", "cells", "memory"]
+)
+Event.__doc__ = """What happened in a stage
+
+:ivar operation: e.g. 'get_sheet_stream', 'save_book' or 'sheet'
+:ivar stage: e.g. 'source', 'parse', 'uniform' or 'render'
+:ivar duration: seconds spent in the stage
+:ivar rows: the number of rows handled, or None if unknown, e.g. a
+            parser gave a generator which the next stage consumes
+:ivar cells: the number of cells handled, or None if unknown
+:ivar memory: the bytes allocated and not freed in the stage, when
+              memory is traced. otherwise None
+"""
+
+_OBSERVERS = []
+_MEMORY_OBSERVERS = []
+# whether tracemalloc was started here, hence is stopped here too once
+# the last memory observer is removed
+_STARTED_TRACING = False
+
+
+def add_observer(observer, trace_memory=False):
+    """Send the events of all stages to the observer
+
+    :param observer: a callable which takes an :class:`Event`
+    :param bool trace_memory: trace the memory allocated in the
+                              stages, which slows them down
+    """
+    global _STARTED_TRACING
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _STARTED_TRACING = True
+        _MEMORY_OBSERVERS.append(observer)
+    _OBSERVERS.append(observer)
+
+
+def remove_observer(observer):
+    """Stop sending events to the observer"""
+    global _STARTED_TRACING
+    for observers in (_OBSERVERS, _MEMORY_OBSERVERS):
+        if observer in observers:
+            observers.remove(observer)
+    if _STARTED_TRACING and not _MEMORY_OBSERVERS:
+        _STARTED_TRACING = False
+        tracemalloc.stop()
+
+
+@contextmanager
+def observe(observer=None, trace_memory=False):
+    """Observe the stages within the block
+
+    :param observer: an observer. a new :class:`Aggregator` by default
+    :returns: the observer
+    """
+    if observer is None:
+        observer = Aggregator()
+    add_observer(observer, trace_memory=trace_memory)
+    try:
+        yield observer
+    finally:
+        remove_observer(observer)
+
+
+def stage(operation, name):
+    """A context manager which times a stage and notifies the observers"""
+    if _OBSERVERS:
+        return _Stage(operation, name)
+    return _NO_STAGE
+
+
+class Aggregator(object):
+    """Sum up the events by operation and stage"""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__stages = OrderedDict()
+
+    def __call__(self, event):
+        key = (event.operation, event.stage)
+        with self.__lock:
+            summary = self.__stages.get(key)
+            if summary is None:
+                summary = dict(
+                    count=0, duration=0.0, max_duration=0.0, rows=0, cells=0
+                )
+                summary["memory"] = 0 if event.memory is not None else None
+                self.__stages[key] = summary
+            summary["count"] += 1
+            summary["duration"] += event.duration
+            summary["max_duration"] = max(
+                summary["max_duration"], event.duration
+            )
+            summary["rows"] += event.rows or 0
+            summary["cells"] += event.cells or 0
+            if event.memory is not None:
+                summary["memory"] = (summary["memory"] or 0) + event.memory
+
+    def summary(self):
+        """A dictionary of (operation, stage) and their totals"""
+        with self.__lock:
+            return OrderedDict(
+                (key, dict(value)) for key, value in self.__stages.items()
+            )
+
+    def clear(self):
+        """Forget the events seen so far"""
+        with self.__lock:
+            self.__stages.clear()
+
+
+class _Stage(object):
+    def __init__(self, operation, name):
+        self.operation = operation
+        self.name = name
+        self.rows = None
+        self.cells = None
+        self.memory = None
+        self.start = None
+
+    def count(self, *contents):
+        """Count the rows and cells of sheets or lists of rows
+
+        Generators are not counted, so as not to consume them
+        """
+        rows = cells = 0
+        for content in contents:
+            if hasattr(content, "number_of_rows"):
+                nrows = content.number_of_rows()
+                rows += nrows
+                cells += nrows * content.number_of_columns()
+            elif isinstance(content, list):
+                rows += len(content)
+                cells += sum(len(row) for row in content)
+            else:
+                return
+        self.rows, self.cells = rows, cells
+
+    def __enter__(self):
+        if _MEMORY_OBSERVERS and tracemalloc.is_tracing():
+            self.memory = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        duration = time.perf_counter() - self.start
+        memory = None
+        if self.memory is not None and tracemalloc.is_tracing():
+            memory = tracemalloc.get_traced_memory()[0] - self.memory
+        event = Event(
+            self.operation, self.name, duration, self.rows, self.cells, None
+        )
+        for observer in list(_OBSERVERS):
+            if memory is not None and observer in _MEMORY_OBSERVERS:
+                observer(event._replace(memory=memory))
+            else:
+                observer(event)
+        return False
+
+
+class _NoStage(object):
+    def count(self, *contents):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+_NO_STAGE = _NoStage()
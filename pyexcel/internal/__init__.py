@@ -7,9 +7,9 @@
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
-from lml.loader import scan_plugins_regex
 from pyexcel.internal.plugins import PARSER, RENDERER  # noqa
 from pyexcel.internal.generators import BookStream, SheetStream  # noqa
+from pyexcel.internal.manifest import scan_plugins
 from pyexcel.internal.source_plugin import SOURCE  # noqa
 
 BLACK_LIST = [
@@ -29,9 +29,6 @@ WHITE_LIST = [
 ]
 
 
-scan_plugins_regex(
-    plugin_name_patterns="^pyexcel_.+$",
-    pyinstaller_path="pyexcel",
-    black_list=BLACK_LIST,
-    white_list=WHITE_LIST,
+scan_plugins(
+    pyinstaller_path="pyexcel", black_list=BLACK_LIST, white_list=WHITE_LIST
 )
@@ -0,0 +1,118 @@
+"""
+    pyexcel.internal.asynchronous
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Run the signature functions off the event loop
+
+    Parsing and rendering run in an executor. An async source, whose
+    read is a coroutine, is read on the loop before it is parsed, and
+    an async sink is written on the loop after the data is rendered.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import asyncio
+import inspect
+from functools import partial
+from itertools import islice
+
+from pyexcel.internal import garbagecollector as gc
+from pyexcel.plugins.sources import params
+
+READ_SIZE = 64 * 1024
+WRITE_SIZE = 64 * 1024
+
+
+async def run(function, pool=None, **keywords):
+    """Call the function in the executor"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(pool, partial(function, **keywords))
+
+
+def is_async_stream(stream, method):
+    """Whether the method of the stream is a coroutine function"""
+    return inspect.iscoroutinefunction(getattr(stream, method, None))
+
+
+def is_async_sink(stream):
+    """Whether the stream is written by a coroutine or drained by one"""
+    return is_async_stream(stream, "write") or is_async_stream(
+        stream, "drain"
+    )
+
+
+async def read_async_source(keywords):
+    """Replace an async file_stream by the content it reads
+
+    It is read in chunks, so that the loop serves others meanwhile,
+    by read_chunk if it has one, like a part of an aiohttp multipart
+    upload, or else by read.
+    """
+    stream = keywords.get(params.FILE_STREAM)
+    if is_async_stream(stream, "read_chunk"):
+        read = stream.read_chunk
+    elif is_async_stream(stream, "read"):
+        read = stream.read
+    else:
+        return keywords
+    chunks = []
+    while True:
+        chunk = await read(READ_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    keywords = dict(keywords)
+    keywords.pop(params.FILE_STREAM)
+    empty = chunks[0][:0] if chunks else b""
+    keywords[params.FILE_CONTENT] = empty.join(chunks)
+    return keywords
+
+
+async def write_async_sink(sink, content):
+    """Write the content to the sink in chunks
+
+    The write of the sink may be a coroutine, or a function which is
+    followed by an awaited drain like that of asyncio.StreamWriter.
+    """
+    for start in range(0, len(content), WRITE_SIZE):
+        end = start + WRITE_SIZE
+        written = sink.write(content[start:end])
+        if inspect.isawaitable(written):
+            await written
+        if is_async_stream(sink, "drain"):
+            await sink.drain()
+
+
+async def iterate(make_iterator, chunk_size, pool=None):
+    """Yield what the iterator gives, reading chunk_size items at a time
+
+    The file handles opened by the iterator are closed when it is done
+    or the async iteration is closed.
+    """
+    loop = asyncio.get_event_loop()
+    iterator = None
+    handles = []
+
+    def open_and_read():
+        nonlocal iterator
+        with gc.collecting() as opened:
+            try:
+                iterator = iter(make_iterator())
+                return list(islice(iterator, chunk_size))
+            finally:
+                handles.extend(opened)
+
+    def read():
+        return list(islice(iterator, chunk_size))
+
+    try:
+        chunk = await loop.run_in_executor(pool, open_and_read)
+        while chunk:
+            for item in chunk:
+                yield item
+            if len(chunk) < chunk_size:
+                break
+            chunk = await loop.run_in_executor(pool, read)
+    finally:
+        for handle in handles:
+            handle.close()
@@ -0,0 +1,400 @@
+"""
+    pyexcel.internal.connections
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Kept-alive http connections and a response cache for url sources
+
+    urllib closes its connection after each response. Here an idle
+    connection to a host is kept in a pool and reused by the next
+    request to the same host, with pyexcel as the User-Agent. Urls of
+    other schemes, and all urls when a proxy is configured or an
+    opener with other handlers or headers is installed by
+    urllib.request.install_opener, are still opened by urllib.
+
+    A response cache keeps the bodies of the responses which carry an
+    ETag or a Last-Modified header. The next request of the url is a
+    conditional GET, and 304 Not Modified is answered from the disk.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import io
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from http import client
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+from pyexcel._compact import request
+
+HTTP_SCHEMES = ("http", "https")
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+NOT_MODIFIED = 304
+MAX_REDIRECTS = 5
+MAX_IDLE_CONNECTIONS = 4
+USER_AGENT = "pyexcel"
+# urllib.request.urlopen installs an opener like this one by itself
+DEFAULT_OPENER = request.build_opener()
+DEFAULT_HANDLERS = frozenset(map(type, DEFAULT_OPENER.handlers))
+
+
+class ConnectionPool(object):
+    """Idle connections by scheme and host"""
+
+    def __init__(self, max_idle=MAX_IDLE_CONNECTIONS):
+        self.max_idle = max_idle
+        self.__lock = threading.Lock()
+        self.__idle = {}
+
+    def acquire(self, scheme, host):
+        """An idle connection to the host, or a new one
+
+        :returns: the connection and whether it was used before
+        """
+        with self.__lock:
+            connections = self.__idle.get((scheme, host))
+            if connections:
+                return connections.pop(), True
+        if scheme == "https":
+            return client.HTTPSConnection(host), False
+        return client.HTTPConnection(host), False
+
+    def release(self, scheme, host, connection):
+        """Keep a connection whose last response was read in full"""
+        with self.__lock:
+            connections = self.__idle.setdefault((scheme, host), [])
+            if len(connections) < self.max_idle:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def clear(self):
+        """Close the idle connections"""
+        with self.__lock:
+            idle = self.__idle
+            self.__idle = {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+POOL = ConnectionPool()
+
+
+class Response(io.BufferedIOBase):
+    """A response body and its headers, like what urllib gives
+
+    :param on_close: called with True if the body was read to the end
+    """
+
+    def __init__(self, url, status, headers, body, on_close=None):
+        io.BufferedIOBase.__init__(self)
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.__body = body
+        self.__on_close = on_close
+        self.__finished = False
+
+    def info(self):
+        return self.headers
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data = self.__body.read()
+            self.__finished = True
+        else:
+            data = self.__body.read(size)
+            if size and not data:
+                self.__finished = True
+        return data
+
+    def read1(self, size=-1):
+        read1 = getattr(self.__body, "read1", None)
+        if read1 is None:
+            return self.read(size)
+        data = read1(size)
+        if size and not data:
+            self.__finished = True
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self.__body.close()
+            if self.__on_close is not None:
+                self.__on_close(self.__finished)
+        finally:
+            io.BufferedIOBase.close(self)
+
+
+class ResponseCache(object):
+    """Response bodies in a folder with their validators
+
+    Each url has a json file of its validators and content type, which
+    names the file of the body. A new body gets a new file, hence a
+    body being read is never overwritten.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def validators(self, url):
+        """The headers of a conditional GET of the url"""
+        entry = self.__load(url)
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def open(self, url):
+        """The cached response of the url, or None"""
+        entry = self.__load(url)
+        if entry is None:
+            return None
+        try:
+            body = open(os.path.join(self.folder, entry["body"]), "rb")
+        except (IOError, OSError):
+            return None
+        headers = client.HTTPMessage()
+        if entry.get("content_type"):
+            headers["Content-Type"] = entry["content_type"]
+        return Response(url, 200, headers, body)
+
+    def keep(self, url, response):
+        """Save the body of the response while it is being read
+
+        It is saved once it is read to the end. A response without
+        validators is not saved.
+        """
+        headers = response.info()
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if response.status != 200 or not (etag or last_modified):
+            return response
+        try:
+            _makedirs(self.folder)
+            handle, temp_file = tempfile.mkstemp(
+                dir=self.folder, suffix=".body"
+            )
+        except (IOError, OSError):
+            return response
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": headers.get("Content-Type"),
+            "body": os.path.basename(temp_file),
+        }
+        return Response(
+            url,
+            response.status,
+            headers,
+            _TeeBody(response, os.fdopen(handle, "wb")),
+            on_close=lambda finished: self.__save(entry, finished),
+        )
+
+    def __save(self, entry, finished):
+        body_file = os.path.join(self.folder, entry["body"])
+        if not finished:
+            _remove(body_file)
+            return
+        old_entry = self.__load(entry["url"])
+        entry_file = self.__entry_file(entry["url"])
+        try:
+            handle, temp_file = tempfile.mkstemp(
+                dir=self.folder, suffix=".tmp"
+            )
+            with os.fdopen(handle, "w") as output:
+                json.dump(entry, output)
+            os.replace(temp_file, entry_file)
+        except (IOError, OSError):
+            _remove(body_file)
+            return
+        if old_entry is not None:
+            _remove(os.path.join(self.folder, old_entry["body"]))
+
+    def __load(self, url):
+        try:
+            with open(self.__entry_file(url)) as entry_file:
+                entry = json.load(entry_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        return entry
+
+    def __entry_file(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.folder, digest + ".json")
+
+
+def urlopen(url, cache=None, pool=POOL):
+    """Open a url, reusing an idle connection to its host
+
+    :param cache: a :class:`ResponseCache`, or None
+    :returns: a :class:`Response`
+    """
+    headers = {}
+    if cache is not None:
+        headers = cache.validators(url)
+    response = _open(url, headers, pool)
+    if response.status == NOT_MODIFIED and cache is not None:
+        response.read()
+        response.close()
+        cached = cache.open(url)
+        if cached is not None:
+            return cached
+        response = _open(url, {}, pool)
+    if cache is not None:
+        response = cache.keep(url, response)
+    return response
+
+
+def _open(url, headers, pool):
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if (
+            parts.scheme not in HTTP_SCHEMES
+            or _proxied(parts)
+            or _custom_opener()
+        ):
+            return _open_by_urllib(url, headers)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        request_headers = {"User-Agent": USER_AGENT}
+        request_headers.update(headers)
+        connection, response = _get(pool, parts, path, request_headers)
+        on_close = _releaser(pool, parts, connection, response)
+        if response.status in REDIRECT_CODES:
+            location = response.getheader("Location")
+            response.read()
+            on_close(True)
+            if location is None:
+                raise HTTPError(
+                    url, response.status, response.reason, response.msg, None
+                )
+            url = urljoin(url, location)
+            continue
+        if response.status >= 400:
+            body = response.read()
+            on_close(True)
+            raise HTTPError(
+                url,
+                response.status,
+                response.reason,
+                response.msg,
+                io.BytesIO(body),
+            )
+        return Response(
+            url, response.status, response.msg, response, on_close
+        )
+    raise HTTPError(url, response.status, "Too many redirects", None, None)
+
+
+def _get(pool, parts, path, headers):
+    while True:
+        connection, reused = pool.acquire(parts.scheme, parts.netloc)
+        try:
+            connection.request("GET", path, headers=headers)
+            return connection, connection.getresponse()
+        except (client.HTTPException, OSError):
+            connection.close()
+            # the host may have closed an idle connection. so try again
+            if not reused:
+                raise
+
+
+def _releaser(pool, parts, connection, response):
+    def release(finished):
+        if finished and response.isclosed() and not response.will_close:
+            pool.release(parts.scheme, parts.netloc, connection)
+        else:
+            connection.close()
+
+    return release
+
+
+def _proxied(parts):
+    return parts.scheme in request.getproxies() and not request.proxy_bypass(
+        parts.hostname or ""
+    )
+
+
+def _custom_opener():
+    """Tell if an opener of other handlers or headers is installed"""
+    opener = getattr(request, "_opener", None)
+    if opener is None:
+        return False
+    return opener.addheaders != DEFAULT_OPENER.addheaders or not all(
+        map(_default_handler, opener.handlers)
+    )
+
+
+def _default_handler(handler):
+    if type(handler) is request.ProxyHandler:
+        # it is among the handlers only when proxies are configured
+        return handler.proxies == request.getproxies()
+    return type(handler) in DEFAULT_HANDLERS
+
+
+def _open_by_urllib(url, headers):
+    target = url
+    if headers:
+        target = request.Request(url, headers=headers)
+    try:
+        response = request.urlopen(target)
+    except HTTPError as e:
+        if e.code != NOT_MODIFIED:
+            raise
+        return Response(url, NOT_MODIFIED, e.headers, io.BytesIO())
+    status = getattr(response, "status", None) or 200
+    return Response(url, status, response.info(), response)
+
+
+class _TeeBody(object):
+    """Copy what is read from a response into a file"""
+
+    def __init__(self, response, copy):
+        self.__response = response
+        self.__copy = copy
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data = self.__response.read()
+        else:
+            data = self.__response.read(size)
+        self.__copy.write(data)
+        return data
+
+    def close(self):
+        self.__copy.close()
+        self.__response.close()
+
+
+def _makedirs(folder):
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+
+
+def _remove(file_name):
+    try:
+        os.remove(file_name)
+    except OSError:
+        pass
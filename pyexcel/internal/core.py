@@ -7,6 +7,7 @@
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
+from pyexcel import instrumentation as instrumentation
 from pyexcel._compact import PY2
 from pyexcel.internal import SOURCE
 from pyexcel.constants import DEFAULT_NO_DATA
@@ -17,9 +18,13 @@ def get_sheet_stream(**keywords):
     """
     Get an instance of SheetStream from an excel source
     """
-    a_source = SOURCE.get_source(**keywords)
+    with instrumentation.stage("get_sheet_stream", "source"):
+        a_source = SOURCE.get_source(**keywords)
     filename, path = a_source.get_source_info()
-    sheets = a_source.get_data()
+    with instrumentation.stage("get_sheet_stream", "parse") as stage:
+        sheets = a_source.get_data()
+        if sheets:
+            stage.count(*sheets.values())
     if sheets:
         sheet_name, data = _one_sheet_tuple(sheets.items())
         return SheetStream(sheet_name, data)
@@ -34,9 +39,13 @@ def get_book_stream(**keywords):
     Where the dictionary should have text as keys and two dimensional
     array as values.
     """
-    a_source = SOURCE.get_book_source(**keywords)
+    with instrumentation.stage("get_book_stream", "source"):
+        a_source = SOURCE.get_book_source(**keywords)
     filename, path = a_source.get_source_info()
-    sheets = a_source.get_data()
+    with instrumentation.stage("get_book_stream", "parse") as stage:
+        sheets = a_source.get_data()
+        if sheets:
+            stage.count(*sheets.values())
     return BookStream(sheets, filename=filename, path=path)
 
 
@@ -44,20 +53,27 @@ def save_sheet(sheet, **keywords):
     """
     Save a sheet instance to any source
     """
-    a_source = SOURCE.get_writable_source(**keywords)
-    return _save_any(a_source, sheet)
+    with instrumentation.stage("save_sheet", "source"):
+        a_source = SOURCE.get_writable_source(**keywords)
+    return _save_any("save_sheet", a_source, sheet)
 
 
 def save_book(book, **keywords):
     """
     Save a book instance to any source
     """
-    a_source = SOURCE.get_writable_book_source(**keywords)
-    return _save_any(a_source, book)
-
-
-def _save_any(a_source, instance):
-    a_source.write_data(instance)
+    with instrumentation.stage("save_book", "source"):
+        a_source = SOURCE.get_writable_book_source(**keywords)
+    return _save_any("save_book", a_source, book)
+
+
+def _save_any(operation, a_source, instance):
+    with instrumentation.stage(operation, "render") as stage:
+        a_source.write_data(instance)
+        if hasattr(instance, "number_of_sheets"):
+            stage.count(*instance)
+        else:
+            stage.count(instance)
     try:
         content_stream = a_source.get_content()
         _seek_at_zero(content_stream)
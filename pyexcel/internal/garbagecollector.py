@@ -7,18 +7,30 @@
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
+import threading
+from contextlib import contextmanager
+
 from pyexcel import docstrings as docs
 from pyexcel._compact import append_doc
 
 GARBAGE = []
+# GARBAGE is shared by all threads
+GARBAGE_LOCK = threading.Lock()
+# the lists of the collecting() blocks of each thread, innermost last
+COLLECTING = threading.local()
 
 
 def append(item):
     """
-    add garbage to the global list of garbages
+    add garbage to the global list of garbages, or to the list of the
+    innermost collecting() block of the current thread
     """
-    global GARBAGE
-    GARBAGE.append(item)
+    collections = getattr(COLLECTING, "lists", None)
+    if collections:
+        collections[-1].append(item)
+        return
+    with GARBAGE_LOCK:
+        GARBAGE.append(item)
 
 
 @append_doc(docs.FREE_RESOURCES)
@@ -26,10 +38,39 @@ def free_resources():
     """
     Close file handles opened by signature functions that starts with 'i'
     """
-    for item in GARBAGE:
+    global GARBAGE
+    with GARBAGE_LOCK:
+        items, GARBAGE = GARBAGE, []
+    close(items)
+
+
+@contextmanager
+def collecting():
+    """
+    Keep the garbage added by the current thread within the block apart
+
+    It goes to the list given by the block instead of the global list,
+    hence neither free_resources nor other threads close it. The caller
+    closes it, by :func:`close` for example.
+    """
+    collections = getattr(COLLECTING, "lists", None)
+    if collections is None:
+        collections = COLLECTING.lists = []
+    items = []
+    collections.append(items)
+    try:
+        yield items
+    finally:
+        collections.pop()
+
+
+def close(items):
+    """
+    Close the given file handles and forget them
+    """
+    for item in items:
         item.close()
-        item = None
-    reset()
+    del items[:]
 
 
 def reset():
@@ -37,4 +78,5 @@ def reset():
     After everything has been closed, reset the array
     """
     global GARBAGE
-    GARBAGE = []
+    with GARBAGE_LOCK:
+        GARBAGE = []
@@ -7,8 +7,13 @@
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
+from functools import partial
+from itertools import chain, islice
+
+from pyexcel import _compact as compact
+from pyexcel import constants as constants
 from pyexcel._compact import OrderedDict
-from pyexcel.internal.common import SheetIterator
+from pyexcel.internal.common import NO_COLUMN_NAMES, SheetIterator
 
 
 class SheetStream(object):
@@ -25,11 +30,18 @@ class SheetStream(object):
     pass a row formatting/rendering function to the parameter
     "renderer" of pyexcel's signature functions.
 
+    The rows can be transformed lazily with :meth:`filter`,
+    :meth:`map`, :meth:`map_rows`, :meth:`project`, :meth:`rename`,
+    :meth:`skip` and :meth:`limit`. Each of them returns a new
+    stream and reads nothing until the stream is saved or iterated.
+    When header is True, the first row is the header: it is used to
+    find the columns by name and is left out of the transformations.
     """
 
-    def __init__(self, name, payload):
+    def __init__(self, name, payload, header=False):
         self.name = name
         self.payload = payload
+        self.header = header
         self.colnames = []
 
     def to_array(self):
@@ -46,6 +58,129 @@ class SheetStream(object):
     def get_internal_array(self):
         return self.payload
 
+    def __iter__(self):
+        return iter(self.payload)
+
+    def filter(self, predicate):
+        """Keep the rows for which predicate(row) is true"""
+        return self._derive(partial(filter, predicate))
+
+    def map(self, custom_function):
+        """Apply a function to every cell"""
+
+        def map_cells(rows):
+            for row in rows:
+                yield [custom_function(cell) for cell in row]
+
+        return self._derive(map_cells)
+
+    def map_rows(self, custom_function):
+        """Replace every row with custom_function(row)"""
+        return self._derive(partial(map, custom_function))
+
+    def skip(self, number):
+        """Leave out the first number of rows"""
+        return self._derive(lambda rows: islice(rows, number, None))
+
+    def limit(self, number):
+        """Stop after the given number of rows"""
+        return self._derive(lambda rows: islice(rows, number))
+
+    def head(self, number=5):
+        """The first few rows"""
+        return self.limit(number)
+
+    def project(self, columns):
+        """Keep the given columns in the given order
+
+        :param list columns: column indices, or column names when the
+                             stream has a header
+        """
+        self._check_names(columns)
+
+        def project_rows(header, rows):
+            indices = [
+                header.index(column)
+                if compact.is_string(type(column))
+                else column
+                for column in columns
+            ]
+            for row in chain([header], rows):
+                yield [
+                    row[index] if index < len(row) else constants.DEFAULT_NA
+                    for index in indices
+                ]
+
+        return self._derive_with_header(project_rows)
+
+    def rename(self, names):
+        """Rename the columns
+
+        :param names: a dictionary of old and new column names,
+                      or a list of new column names
+        """
+        if not self.header:
+            raise ValueError(NO_COLUMN_NAMES)
+
+        def rename_header(header, rows):
+            if isinstance(names, dict):
+                yield [names.get(name, name) for name in header]
+            else:
+                start = len(names)
+                yield list(names) + list(header[start:])
+            for row in rows:
+                yield row
+
+        return self._derive_with_header(rename_header)
+
+    def save_as(self, filename, **keywords):
+        """Save the rows to a named file, reading as it writes"""
+        from pyexcel.internal.core import save_sheet
+
+        return save_sheet(self, file_name=filename, **keywords)
+
+    def save_to_memory(self, file_type, stream=None, **keywords):
+        """Save the rows to a memory stream, reading as it writes"""
+        from pyexcel.internal.core import save_sheet
+
+        return save_sheet(
+            self, file_type=file_type, file_stream=stream, **keywords
+        )
+
+    def _derive(self, transform):
+        """Make a new stream whose data rows are transform(rows)"""
+
+        def transform_data(header, rows):
+            if self.header:
+                yield header
+            for row in transform(rows):
+                yield row
+
+        if self.header:
+            return self._derive_with_header(transform_data)
+        return SheetStream(self.name, transform(iter(self.payload)))
+
+    def _derive_with_header(self, transform):
+        """Make a new stream out of transform(first_row, other_rows)"""
+
+        def transform_all(payload):
+            rows = iter(payload)
+            first_row = next(rows, None)
+            if first_row is None:
+                return
+            for row in transform(first_row, rows):
+                yield row
+
+        return SheetStream(
+            self.name, transform_all(self.payload), header=self.header
+        )
+
+    def _check_names(self, columns):
+        if not self.header:
+            for column in columns:
+                if compact.is_string(type(column)):
+                    raise ValueError(NO_COLUMN_NAMES)
+
 
 class BookStream(object):
     """
@@ -0,0 +1,296 @@
+"""
+    pyexcel.internal.interop
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Conversion of sheets from and to numpy arrays and arrow record
+    batches
+
+    numpy and pyarrow are optional. They are imported when a
+    conversion is asked for.
+
+    The typed columns of the columnar storage are handed over as
+    buffers: an arrow array shares the buffer of a column, and a numpy
+    array is filled from it without making a python object of each
+    cell. Other columns are converted a column or a block of rows at a
+    time.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import json
+import importlib
+from array import array
+from itertools import islice
+
+from pyexcel import constants as constants
+from pyexcel.internal.sheets.columnar import ROW_CHUNK, TypedColumn
+
+NUMPY_TYPES = {"q": "int64", "d": "float64"}
+ARROW_TYPES = {"q": "int64", "d": "float64"}
+# the largest integer of a typed column
+MAX_INT64 = 2 ** 63 - 1
+
+
+def sheet_to_numpy(sheet, dtype=None):
+    """A two dimensional numpy array of the cells of a sheet
+
+    Column and row names are left out. Numeric columns of the columnar
+    storage are copied buffer to buffer, and their empty cells become
+    NaN. Other sheets are converted from their rows, as objects unless
+    all cells are numbers or a dtype is given.
+    """
+    numpy = _import("numpy")
+    shape = (sheet.number_of_rows(), sheet.number_of_columns())
+    columns = sheet._typed_columns()
+    if columns and all(column.is_typed() for column in columns):
+        if dtype is None:
+            dtype = "int64"
+            for column in columns:
+                if column.data.typecode == "d" or column.nulls is not None:
+                    dtype = "float64"
+        result = numpy.empty(shape, dtype=dtype)
+        if shape[0] == 0:
+            return result
+        for index, column in enumerate(columns):
+            result[:, index] = numpy.frombuffer(
+                column.data, dtype=NUMPY_TYPES[column.data.typecode]
+            )
+            if column.nulls is not None:
+                nulls = numpy.frombuffer(column.nulls, dtype=bool)
+                result[nulls, index] = numpy.nan
+        return result
+    if columns is None:
+        rows = sheet.get_internal_array()
+        if dtype is not None:
+            return numpy.array(rows, dtype=dtype).reshape(shape)
+        result = numpy.array(rows).reshape(shape)
+        if result.dtype.kind not in "SU":
+            return result
+        # numbers mixed with text would be turned into text
+        return _object_array(numpy, rows, shape)
+    return _object_array(numpy, sheet.rows(), shape, dtype or object)
+
+
+def sheet_from_numpy(
+    cls,
+    numbers,
+    name=constants.DEFAULT_NAME,
+    colnames=None,
+    rownames=None,
+    storage=constants.ROW_STORAGE,
+):
+    """A sheet of the cells of a one or two dimensional numpy array
+
+    With the columnar storage, integer and float columns are copied
+    buffer to buffer.
+    """
+    numpy = _import("numpy")
+    numbers = numpy.asarray(numbers)
+    if numbers.ndim == 1:
+        numbers = numbers.reshape(-1, 1)
+    if numbers.ndim != 2:
+        raise ValueError(constants.MESSAGE_NOT_TWO_DIMENSIONAL)
+    if storage != constants.COLUMNAR_STORAGE:
+        return cls(
+            numbers.tolist(), name=name, colnames=colnames, rownames=rownames
+        )
+    sheet = cls(name=name, storage=storage)
+    columns = [
+        _column_from_numpy(numpy, numbers[:, index])
+        for index in range(numbers.shape[1])
+    ]
+    sheet._use_columns(columns, numbers.shape[0])
+    return _name_series(sheet, colnames, rownames)
+
+
+def sheet_to_arrow(sheet):
+    """An arrow record batch of the columns of a sheet
+
+    The column names become the field names, and the row names, if
+    any, the first field. Numeric columns of the columnar storage are
+    shared with the batch, hence later changes of their cells show in
+    it.
+    """
+    pyarrow = _import("pyarrow")
+    columns = sheet._typed_columns()
+    arrays = []
+    for index in range(sheet.number_of_columns()):
+        if columns is not None and columns[index].is_typed():
+            arrays.append(_typed_to_arrow(pyarrow, columns[index]))
+        else:
+            arrays.append(_values_to_arrow(pyarrow, sheet.column_at(index)))
+    names = [str(index) for index in range(len(arrays))]
+    if len(sheet.colnames) > 0:
+        names = [str(name) for name in sheet.colnames]
+    if len(sheet.rownames) > 0:
+        arrays.insert(0, _values_to_arrow(pyarrow, sheet.rownames))
+        names.insert(0, "")
+    metadata = {
+        "colnames": len(sheet.colnames) > 0,
+        "rownames": len(sheet.rownames) > 0,
+    }
+    batch = pyarrow.RecordBatch.from_arrays(arrays, names=names)
+    return batch.replace_schema_metadata(
+        {constants.ARROW_METADATA_KEY: json.dumps(metadata)}
+    )
+
+
+def sheet_from_arrow(
+    cls, batch, name=constants.DEFAULT_NAME, storage=constants.ROW_STORAGE
+):
+    """A sheet of an arrow record batch or table
+
+    The field names become the column names. A batch made by
+    :func:`sheet_to_arrow` gets back its row names and, if it had
+    none, loses the column names. With the columnar storage, integer
+    and float columns are copied buffer to buffer.
+    """
+    pyarrow = _import("pyarrow")
+    metadata = {"colnames": True, "rownames": False}
+    if batch.schema.metadata:
+        saved = batch.schema.metadata.get(constants.ARROW_METADATA_KEY)
+        if saved is not None:
+            metadata.update(json.loads(saved))
+    arrays = [
+        _combine(pyarrow, batch.column(index))
+        for index in range(batch.num_columns)
+    ]
+    names = list(batch.schema.names)
+    rownames = None
+    if metadata["rownames"] and len(arrays) > 0:
+        rownames = _values_from_arrow(arrays.pop(0))
+        names.pop(0)
+    colnames = names if metadata["colnames"] else None
+    if storage != constants.COLUMNAR_STORAGE:
+        values = [_values_from_arrow(an_array) for an_array in arrays]
+        rows = [list(row) for row in zip(*values)]
+        return cls(rows, name=name, colnames=colnames, rownames=rownames)
+    sheet = cls(name=name, storage=storage)
+    columns = [_column_from_arrow(pyarrow, an_array) for an_array in arrays]
+    sheet._use_columns(columns, batch.num_rows)
+    return _name_series(sheet, colnames, rownames)
+
+
+def _import(library):
+    try:
+        return importlib.import_module(library)
+    except ImportError:
+        raise ImportError(constants.MESSAGE_MISSING_LIBRARY % library)
+
+
+def _object_array(numpy, rows, shape, dtype=object):
+    result = numpy.empty(shape, dtype=dtype)
+    rows = iter(rows)
+    for start in range(0, shape[0], ROW_CHUNK):
+        stop = min(start + ROW_CHUNK, shape[0])
+        result[start:stop] = list(islice(rows, stop - start))
+    return result
+
+
+def _column_from_numpy(numpy, values):
+    kind = values.dtype.kind
+    if kind in "iu" and (kind == "i" or values.max(initial=0) <= MAX_INT64):
+        data = array("q")
+        data.frombytes(numpy.ascontiguousarray(values, dtype="int64"))
+        return TypedColumn(data)
+    if kind == "f":
+        data = array("d")
+        data.frombytes(numpy.ascontiguousarray(values, dtype="float64"))
+        return TypedColumn(data)
+    return TypedColumn.from_values(values.tolist())
+
+
+def _typed_to_arrow(pyarrow, column):
+    compute = _import("pyarrow.compute")
+    typecode = column.data.typecode
+    validity = None
+    null_count = 0
+    if column.nulls is not None:
+        null_count = column.nulls.count(1)
+    if null_count > 0:
+        flags = pyarrow.Array.from_buffers(
+            pyarrow.uint8(),
+            len(column),
+            [None, pyarrow.py_buffer(column.nulls)],
+        )
+        validity = compute.equal(flags, 0).buffers()[1]
+    return pyarrow.Array.from_buffers(
+        getattr(pyarrow, ARROW_TYPES[typecode])(),
+        len(column),
+        [validity, pyarrow.py_buffer(column.data)],
+        null_count,
+    )
+
+
+def _values_to_arrow(pyarrow, values):
+    try:
+        return pyarrow.array(_nones(values))
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # mixed types
+        return pyarrow.array(
+            [None if value is None else str(value) for value in _nones(values)]
+        )
+
+
+def _nones(values):
+    """Empty cells as None, unless all cells are text"""
+    if all(isinstance(value, str) for value in values):
+        return values
+    return [
+        None if value == constants.DEFAULT_NA else value for value in values
+    ]
+
+
+def _combine(pyarrow, an_array):
+    # a table has chunked columns
+    chunks = getattr(an_array, "chunks", None)
+    if chunks is None:
+        return an_array
+    if len(chunks) == 1:
+        return chunks[0]
+    if len(chunks) == 0:
+        return pyarrow.array([], type=an_array.type)
+    return pyarrow.concat_arrays(chunks)
+
+
+def _values_from_arrow(an_array):
+    return [
+        constants.DEFAULT_NA if value is None else value
+        for value in an_array.to_pylist()
+    ]
+
+
+def _column_from_arrow(pyarrow, an_array):
+    compute = _import("pyarrow.compute")
+    arrow_type = an_array.type
+    typecode = None
+    if pyarrow.types.is_integer(arrow_type):
+        typecode = "q"
+    elif pyarrow.types.is_floating(arrow_type):
+        typecode = "d"
+    if typecode is not None:
+        try:
+            an_array = an_array.cast(getattr(pyarrow, ARROW_TYPES[typecode])())
+        except pyarrow.ArrowInvalid:
+            # unsigned integers out of range
+            typecode = None
+    if typecode is None:
+        return TypedColumn.from_values(_values_from_arrow(an_array))
+    nulls = None
+    if an_array.null_count > 0:
+        flags = compute.cast(an_array.is_null(), pyarrow.uint8())
+        nulls = bytearray(memoryview(flags.buffers()[1])[: len(an_array)])
+        an_array = compute.fill_null(an_array, 0)
+    start = an_array.offset * 8
+    stop = start + len(an_array) * 8
+    data = array(typecode)
+    data.frombytes(memoryview(an_array.buffers()[1])[start:stop])
+    return TypedColumn(data, nulls)
+
+
+def _name_series(sheet, colnames, rownames):
+    if colnames:
+        sheet.colnames = colnames
+    if rownames:
+        sheet.rownames = rownames
+    return sheet
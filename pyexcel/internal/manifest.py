@@ -0,0 +1,187 @@
+"""
+    pyexcel.internal.manifest
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A persisted list of the installed plugins
+
+    Finding the plugins means walking every entry of sys.path. The
+    names found can be kept in a manifest file together with the
+    modification times of the sys.path entries, hence an import skips
+    the walk until a package is installed or removed. The first
+    entry, the folder of the script or the current folder, changes
+    often and is always scanned.
+
+    The manifest is only written when it is asked for, by
+    :func:`build_manifest`::
+
+        >>> from pyexcel.internal import manifest
+        >>> manifest.build_manifest()  # doctest: +SKIP
+
+    It is kept in the user cache folder. Set the environment variable
+    PYEXCEL_PLUGIN_MANIFEST to use another file, or to an empty string
+    to always scan. A manifest which is out of date, or which names a
+    module that is not a plugin, is ignored.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import os
+import re
+import sys
+import json
+import logging
+import pkgutil
+import tempfile
+from itertools import chain
+
+from lml.utils import do_import
+from lml.loader import scan_from_pyinstaller
+
+PLUGIN_NAME_PATTERN = "^pyexcel_.+$"
+MANIFEST_ENVIRONMENT_VARIABLE = "PYEXCEL_PLUGIN_MANIFEST"
+MANIFEST_VERSION = 1
+
+log = logging.getLogger(__name__)
+
+
+def scan_plugins(pyinstaller_path, black_list, white_list):
+    """Import the plugins in the manifest, or found by a scan
+
+    It does what lml.loader.scan_plugins_regex does, except that the
+    scan is skipped when the manifest is up to date.
+    """
+    manifest_file = manifest_path()
+    module_names = None
+    if manifest_file:
+        module_names = load_manifest(manifest_file)
+    if module_names is None:
+        module_names = find_plugins(pyinstaller_path)
+    local_names = [
+        module_name
+        for module_name in _iter_plugins(sys.path[:1])
+        if module_name not in module_names
+    ]
+    for module_name in chain(local_names, module_names, white_list):
+        if module_name in black_list:
+            log.debug("ignored " + module_name)
+            continue
+        try:
+            do_import(module_name)
+        except ImportError as e:
+            log.debug(module_name)
+            log.debug(e)
+
+
+def build_manifest(pyinstaller_path="pyexcel", manifest_file=None):
+    """Scan for the plugins and save the manifest
+
+    Use it where the first import should be fast too, e.g. when a
+    container image is built.
+
+    :returns: the names of the plugin modules
+    """
+    if manifest_file is None:
+        manifest_file = manifest_path()
+    module_names = find_plugins(pyinstaller_path)
+    if manifest_file:
+        save_manifest(manifest_file, module_names)
+    return module_names
+
+
+def find_plugins(pyinstaller_path):
+    """The names of the plugin modules on sys.path but its first entry"""
+    module_names = list(_iter_plugins(sys.path[1:]))
+    module_names.extend(
+        scan_from_pyinstaller(PLUGIN_NAME_PATTERN, pyinstaller_path)
+    )
+    return module_names
+
+
+def manifest_path():
+    """The manifest file, or None if it is turned off"""
+    manifest_file = os.environ.get(MANIFEST_ENVIRONMENT_VARIABLE)
+    if manifest_file is not None:
+        return manifest_file or None
+    if getattr(sys, "frozen", False):
+        # the set of plugins of a frozen application never changes
+        return None
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(
+        cache,
+        "pyexcel",
+        "plugins-%s.%s.json" % (sys.version_info[0], sys.version_info[1]),
+    )
+
+
+def load_manifest(manifest_file):
+    """The names in the manifest, or None if it is missing, stale or
+    names a module which is not a plugin"""
+    try:
+        with open(manifest_file) as manifest:
+            content = json.load(manifest)
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(content, dict):
+        return None
+    if content.get("fingerprint") != fingerprint():
+        log.debug("plugin manifest is out of date")
+        return None
+    module_names = content.get("plugins")
+    if not isinstance(module_names, list) or not all(
+        map(is_plugin_name, module_names)
+    ):
+        log.debug("plugin manifest names modules other than plugins")
+        return None
+    return module_names
+
+
+def save_manifest(manifest_file, module_names):
+    """Write the manifest, quietly giving up if it cannot be written"""
+    content = {"fingerprint": fingerprint(), "plugins": module_names}
+    folder = os.path.dirname(os.path.abspath(manifest_file))
+    try:
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        handle, temp_file = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(handle, "w") as manifest:
+            json.dump(content, manifest)
+        os.replace(temp_file, manifest_file)
+    except (IOError, OSError) as e:
+        log.debug("cannot save plugin manifest: %s" % e)
+
+
+def fingerprint():
+    """What the installed packages depend on
+
+    Installing or removing a package changes the modification time
+    of its folder on sys.path.
+    """
+    paths = []
+    for entry in sys.path[1:]:
+        try:
+            modified = os.stat(entry).st_mtime_ns
+        except OSError:
+            modified = None
+        paths.append([entry, modified])
+    return {
+        "version": MANIFEST_VERSION,
+        "python": sys.version,
+        "paths": paths,
+    }
+
+
+def is_plugin_name(name):
+    """Tell if the name is the one of a top level plugin module"""
+    return (
+        isinstance(name, str)
+        and name.isidentifier()
+        and re.match(PLUGIN_NAME_PATTERN, name) is not None
+    )
+
+
+def _iter_plugins(path):
+    for module_info in pkgutil.iter_modules(path):
+        if module_info[2] and is_plugin_name(module_info[1]):
+            yield module_info[1]
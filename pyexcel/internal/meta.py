@@ -157,6 +157,11 @@ class StreamAttribute(object):
 class PyexcelObject(object):
     """parent class for pyexcel.Sheet and pyexcel.Book"""
 
+    #: the rows and the columns of a sheet shown by repr() and in a
+    #: notebook, half from the head and half from the tail. None for all
+    preview_rows = constants.DEFAULT_PREVIEW_ROWS
+    preview_columns = constants.DEFAULT_PREVIEW_COLUMNS
+
     @property
     def stream(self):
         """Return a stream in which the content is properly encoded
@@ -231,17 +236,16 @@ class PyexcelObject(object):
             )
         return memory_content
 
-    def _repr_html_(self):
-        return self.html
-
     def __repr__(self):
+        result = self.get_texttable(
+            max_rows=self.preview_rows, max_columns=self.preview_columns
+        )
         if PY2:
             default_encoding = sys.getdefaultencoding()
             if default_encoding == "ascii":
-                result = self.texttable
                 return result.encode("utf-8")
 
-        return self.texttable
+        return result
 
     def __str__(self):
         return self.__repr__()
@@ -254,6 +258,14 @@ class SheetMeta(PyexcelObject):
     register_presentation = classmethod(REGISTER_PRESENTATION)
     register_input = classmethod(REGISTER_INPUT)
 
+    def _repr_html_(self):
+        from pyexcel.internal import preview
+
+        limits = (self.preview_rows, self.preview_columns)
+        if preview.is_truncated(self, *limits):
+            return preview.html_preview(self, *limits)
+        return self.html
+
     @append_doc(docs.SAVE_AS_OPTIONS)
     def save_as(self, filename, **keywords):
         """Save the content to a named file"""
@@ -285,7 +297,13 @@ class SheetMeta(PyexcelObject):
         )
 
     def save_to_database(
-        self, session, table, initializer=None, mapdict=None, auto_commit=True
+        self,
+        session,
+        table,
+        initializer=None,
+        mapdict=None,
+        auto_commit=True,
+        batch_size=None,
     ):
         """Save data in sheet to database table
 
@@ -294,6 +312,9 @@ class SheetMeta(PyexcelObject):
         :param initializer: a initialization functions for your table
         :param mapdict: custom map dictionary for your data columns
         :param auto_commit: by default, data is auto committed.
+        :param batch_size: the number of rows inserted, and committed,
+                           at a time by executemany. by default, the
+                           rows are added one by one.
 
         """
         save_sheet(
@@ -303,6 +324,7 @@ class SheetMeta(PyexcelObject):
             initializer=initializer,
             mapdict=mapdict,
             auto_commit=auto_commit,
+            batch_size=batch_size,
         )
 
 
@@ -313,6 +335,16 @@ class BookMeta(PyexcelObject):
     register_presentation = classmethod(REGISTER_BOOK_PRESENTATION)
     register_input = classmethod(REGISTER_BOOK_INPUT)
 
+    def _repr_html_(self):
+        from pyexcel.internal import preview
+
+        limits = (self.preview_rows, self.preview_columns)
+        if any(preview.is_truncated(sheet, *limits) for sheet in self):
+            return "\n".join(
+                preview.html_preview(sheet, *limits) for sheet in self
+            )
+        return self.html
+
     @append_doc(docs.SAVE_AS_OPTIONS)
     def save_as(self, filename, **keywords):
         """
@@ -371,6 +403,7 @@ class BookMeta(PyexcelObject):
         initializers=None,
         mapdicts=None,
         auto_commit=True,
+        batch_size=None,
     ):
         """
         Save data in sheets to database tables
@@ -387,6 +420,9 @@ class BookMeta(PyexcelObject):
         :param mapdicts: custom map dictionary for your data columns
                          and the sequence should match tables
         :param auto_commit: by default, data is committed.
+        :param batch_size: the number of rows inserted, and committed,
+                           at a time by executemany. by default, the
+                           rows are added one by one.
 
         """
         save_book(
@@ -396,6 +432,7 @@ class BookMeta(PyexcelObject):
             initializers=initializers,
             mapdicts=mapdicts,
             auto_commit=auto_commit,
+            batch_size=batch_size,
         )
 
 
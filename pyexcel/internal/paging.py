@@ -0,0 +1,91 @@
+"""
+    pyexcel.internal.paging
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read database query results a batch of rows at a time
+
+    A query set handed to pyexcel-io is read in full before its first
+    row is seen. Here an sqlalchemy query is read with yield_per, which
+    asks the driver for a server side cursor where it has one, and a
+    django query set by iterator(chunk_size), which does not cache its
+    results. The rows then go through pyexcel-io one by one.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import datetime
+from itertools import chain
+
+from pyexcel_io import get_data, iget_data
+from pyexcel_io.constants import DB_QUERYSET
+
+
+def paged(query_sets, batch_size):
+    """Iterate a query, fetching batch_size rows at a time"""
+    if hasattr(query_sets, "yield_per"):
+        return iter(query_sets.yield_per(batch_size))
+    if hasattr(query_sets, "iterator"):
+        return query_sets.iterator(chunk_size=batch_size)
+    return iter(query_sets)
+
+
+def read_query_sets(query_sets, column_names, on_demand=False, **keywords):
+    """The rows of the column names and the query results
+
+    :returns: a generator if on_demand, otherwise a list
+    """
+    if on_demand:
+        sheets, _ = iget_data(
+            query_sets,
+            file_type=DB_QUERYSET,
+            column_names=column_names,
+            **keywords
+        )
+    else:
+        sheets = get_data(
+            query_sets,
+            file_type=DB_QUERYSET,
+            column_names=column_names,
+            **keywords
+        )
+    return list(sheets.values())[0]
+
+
+def table_rows(session, table, export_columns, batch_size):
+    """The column names and the paged rows of an sqlalchemy table
+
+    The columns are sorted by name unless export_columns are given.
+    When all of them are plain columns, only their values are queried,
+    instead of whole objects.
+
+    :returns: the column names, None for an empty table without
+              export_columns, and an iterator of the rows
+    """
+    from sqlalchemy import inspect
+
+    mapper = inspect(table)
+    plain_columns = mapper.column_attrs.keys()
+    column_names = export_columns
+    if not column_names:
+        column_names = sorted(plain_columns)
+    if all(name in plain_columns for name in column_names):
+        query = session.query(*[getattr(table, name) for name in column_names])
+        rows = (_plain_row(row) for row in paged(query, batch_size))
+    else:
+        rows = paged(session.query(table), batch_size)
+    if export_columns:
+        return column_names, rows
+    first_row = next(rows, None)
+    if first_row is None:
+        return None, iter([])
+    return column_names, chain([first_row], rows)
+
+
+def _plain_row(row):
+    # as pyexcel-io reads the attributes of an object
+    return [
+        value.isoformat()
+        if isinstance(value, (datetime.date, datetime.time))
+        else value
+        for value in row
+    ]
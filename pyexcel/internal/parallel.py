@@ -0,0 +1,171 @@
+"""
+    pyexcel.internal.parallel
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read and build sheets with a pool of workers
+
+    Each worker reads a sheet of a file or a file content by its name
+    and builds it. A worker process makes the rows uniform, then sends
+    them back instead of a sheet, because sheets do not travel between
+    processes; the sheet is then made of the rows as they are.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+from concurrent import futures
+
+from pyexcel import constants as constants
+from pyexcel.book import Book
+from pyexcel.sheet import Sheet
+from pyexcel._compact import OrderedDict
+from pyexcel.internal import core as sources
+from pyexcel.internal import garbagecollector as gc
+from pyexcel.internal.sheets.matrix import uniform
+
+# sources which can be read a sheet at a time by several workers
+SHEET_BY_SHEET_SOURCES = ("file_name", "file_content")
+EXECUTORS = {
+    constants.THREAD_EXECUTOR: futures.ThreadPoolExecutor,
+    constants.PROCESS_EXECUTOR: futures.ProcessPoolExecutor,
+}
+
+
+def parallel_map(function, items, workers, executor):
+    """Apply the function to the items with a pool of workers
+
+    The results are in the order of the items. Without more than
+    one worker, the items are processed one after another.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(constants.MESSAGE_UNKNOWN_EXECUTOR % executor)
+    items = list(items)
+    if workers is None or workers < 2 or len(items) < 2:
+        return list(map(function, items))
+    with EXECUTORS[executor](max_workers=workers) as pool:
+        return list(pool.map(function, items))
+
+
+def get_book(workers, executor, **keywords):
+    """Get a book whose sheets are read and built by a pool of workers
+
+    When the source is a file or a file content, each worker reads one
+    sheet by its name. Otherwise the sheets are read first, then built
+    by the workers.
+    """
+    if any(keywords.get(key) is not None for key in SHEET_BY_SHEET_SOURCES):
+        names, filename, path = _get_book_info(**keywords)
+        sheets = get_sheets(
+            _sheet_keywords(keywords, names), workers, executor
+        )
+    else:
+        book_stream = sources.get_book_stream(**keywords)
+        filename, path = book_stream.filename, book_stream.path
+        sheets = _make_sheets(
+            book_stream.to_dict().items(), workers, executor
+        )
+    content = OrderedDict((sheet.name, sheet) for sheet in sheets)
+    return Book(content, filename=filename, path=path)
+
+
+def get_sheets(sources_keywords, workers, executor):
+    """Get a sheet out of each set of source keywords"""
+    if executor == constants.PROCESS_EXECUTOR:
+        arrays = parallel_map(
+            _read_uniform_sheet, sources_keywords, workers, executor
+        )
+        return [_use_uniform_sheet(*array) for array in arrays]
+    return parallel_map(_read_sheet, sources_keywords, workers, executor)
+
+
+def get_books(sources_keywords, workers, executor):
+    """Get a book out of each set of source keywords"""
+    if executor == constants.PROCESS_EXECUTOR:
+        books = parallel_map(
+            _read_uniform_book, sources_keywords, workers, executor
+        )
+        return [
+            Book(
+                OrderedDict(
+                    (array[0], _use_uniform_sheet(*array))
+                    for array in arrays
+                ),
+                filename=filename,
+                path=path,
+            )
+            for arrays, filename, path in books
+        ]
+    return parallel_map(_read_book, sources_keywords, workers, executor)
+
+
+def _make_sheets(names_and_arrays, workers, executor):
+    if executor == constants.PROCESS_EXECUTOR:
+        arrays = parallel_map(
+            _make_uniform, names_and_arrays, workers, executor
+        )
+        return [_use_uniform_sheet(*array) for array in arrays]
+    return parallel_map(_make_sheet, names_and_arrays, workers, executor)
+
+
+def _make_uniform(name_and_array):
+    name, array = name_and_array
+    width, array = uniform(list(array))
+    return name, width, array
+
+
+def _make_sheet(name_and_array):
+    name, array = name_and_array
+    return Sheet(array, name)
+
+
+def _use_uniform_sheet(name, width, array):
+    # the array was made uniform in a worker process
+    sheet = Sheet(name=name)
+    sheet._use_rows(array, width)
+    return sheet
+
+
+def _read_sheet(keywords):
+    sheet_stream = sources.get_sheet_stream(**keywords)
+    return Sheet(sheet_stream.payload, sheet_stream.name)
+
+
+def _read_book(keywords):
+    book_stream = sources.get_book_stream(**keywords)
+    return Book(
+        book_stream.to_dict(),
+        filename=book_stream.filename,
+        path=book_stream.path,
+    )
+
+
+def _read_uniform_sheet(keywords):
+    sheet_stream = sources.get_sheet_stream(**keywords)
+    return _make_uniform((sheet_stream.name, sheet_stream.payload))
+
+
+def _read_uniform_book(keywords):
+    book_stream = sources.get_book_stream(**keywords)
+    arrays = [_make_uniform(item) for item in book_stream.to_dict().items()]
+    return arrays, book_stream.filename, book_stream.path
+
+
+def _sheet_keywords(keywords, names):
+    """The source keywords of each sheet, which is read by its name"""
+    keywords = dict(keywords)
+    for field in ("sheet_index", "sheets"):
+        keywords.pop(field, None)
+    return [dict(keywords, sheet_name=name) for name in names]
+
+
+def _get_book_info(**keywords):
+    """Find out the sheet names without reading the sheets"""
+    with gc.collecting() as opened:
+        try:
+            book_stream = sources.get_book_stream(on_demand=True, **keywords)
+            return (
+                book_stream.sheet_names(),
+                book_stream.filename,
+                book_stream.path,
+            )
+        finally:
+            gc.close(opened)
@@ -0,0 +1,77 @@
+"""
+    pyexcel.internal.partition
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Partition a stream of rows by key within bounded memory
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import pickle
+import tempfile
+
+from pyexcel import constants as constants
+from pyexcel._compact import OrderedDict
+
+
+class RowPartitioner(object):
+    """
+    Route rows to partitions by key
+
+    Rows are kept in memory until max_buffered_rows of them are
+    buffered, then the buffered rows of each key are appended to one
+    temporary file as a block. A spill writes once per key, and one
+    file serves however many keys there are.
+    """
+
+    def __init__(self, max_buffered_rows=constants.DEFAULT_MAX_BUFFERED_ROWS):
+        self.max_buffered_rows = max_buffered_rows
+        self.__buffers = OrderedDict()
+        # the offsets of the blocks of each key in the spill file
+        self.__blocks = {}
+        self.__buffered = 0
+        self.__spill = None
+
+    def add(self, key, row):
+        """Put a row in the partition of the key"""
+        rows = self.__buffers.get(key)
+        if rows is None:
+            rows = []
+            self.__buffers[key] = rows
+        rows.append(row)
+        self.__buffered += 1
+        if self.__buffered >= self.max_buffered_rows:
+            self.spill()
+
+    def keys(self):
+        """The keys in the order they were first seen"""
+        return list(self.__buffers.keys())
+
+    def rows(self, key):
+        """Iterate the rows of a partition in the order they came in"""
+        for offset in self.__blocks.get(key, ()):
+            self.__spill.seek(offset)
+            for row in pickle.load(self.__spill):
+                yield row
+        for row in self.__buffers[key]:
+            yield row
+
+    def spill(self):
+        """Move all buffered rows to the temporary file"""
+        if self.__spill is None:
+            self.__spill = tempfile.TemporaryFile(prefix="pyexcel")
+        self.__spill.seek(0, 2)
+        for key, rows in self.__buffers.items():
+            if rows:
+                self.__blocks.setdefault(key, []).append(self.__spill.tell())
+                pickle.dump(rows, self.__spill, pickle.HIGHEST_PROTOCOL)
+                del rows[:]
+        self.__buffered = 0
+
+    def close(self):
+        """Close and remove the temporary file"""
+        if self.__spill is not None:
+            self.__spill.close()
+            self.__spill = None
+        self.__blocks.clear()
+        self.__buffers.clear()
@@ -15,6 +15,8 @@ class IOPluginManager(PluginManager):
 
     def __init__(self, name):
         PluginManager.__init__(self, name)
+        # counts the registrations, which change the file types
+        self.generation = 0
 
     def get_a_plugin(self, key, library=None):
         """get a plugin to handle the file type"""
@@ -25,6 +27,12 @@ class IOPluginManager(PluginManager):
 
         return plugin_cls(__file_type)
 
+    def _update_registry_and_expand_tag_groups(self, plugin_info):
+        PluginManager._update_registry_and_expand_tag_groups(
+            self, plugin_info
+        )
+        self.generation += 1
+
     def get_all_file_types(self):
         """get all supported file types"""
         file_types = list(self.registry.keys())
@@ -0,0 +1,150 @@
+"""
+    pyexcel.internal.preview
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The head and the tail of a large sheet
+
+    repr() of a sheet or a book, and its display in a notebook, show
+    at most a number of rows and columns. Only the rows shown are read,
+    hence printing a sheet of a million rows costs as much as printing
+    a small one.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+from html import escape
+
+from pyexcel import constants as constants
+from pyexcel.internal.sheets.formatters import to_format
+
+ELLIPSIS = "..."
+SHAPE_FORMAT = "[%d rows x %d columns]"
+
+
+def preview(sheet, max_rows=None, max_columns=None):
+    """The cells shown of a sheet, laid out as sheet.to_array() does
+
+    The rows and the columns left out in the middle are replaced by
+    one row or column of ellipses.
+
+    :param max_rows: the rows shown, not counting the column names.
+                     None for all
+    :param max_columns: the columns shown, not counting the row names.
+                        None for all
+    :returns: the column names or None, the rows and whether any cell
+              is left out
+    """
+    colnames = sheet.colnames
+    rownames = sheet.rownames
+    number_of_columns = max(sheet.number_of_columns(), len(colnames))
+    row_indices = _head_and_tail(sheet.number_of_rows(), max_rows)
+    column_indices = _head_and_tail(number_of_columns, max_columns)
+    header = None
+    if len(colnames) > 0:
+        header = _pick(colnames, column_indices)
+        if len(rownames) > 0:
+            header.insert(0, constants.DEFAULT_NA)
+    rows = []
+    for index, row in _rows_at(sheet, row_indices):
+        if index is None:
+            row = [ELLIPSIS] * len(column_indices)
+        elif None in column_indices:
+            row = _pick(row, column_indices)
+        if len(rownames) > 0:
+            row_name = ELLIPSIS
+            if index is not None:
+                row_name = _value_at(rownames, index)
+            row.insert(0, row_name)
+        rows.append(row)
+    truncated = None in row_indices or None in column_indices
+    return header, rows, truncated
+
+
+def shape(sheet):
+    """The dimensions of a sheet as they are written below a preview"""
+    return SHAPE_FORMAT % (sheet.number_of_rows(), sheet.number_of_columns())
+
+
+def cleanse(row):
+    """The text of each cell, a space for an empty one"""
+    for item in row:
+        if item is ELLIPSIS:
+            yield item
+        elif item == constants.DEFAULT_NA:
+            yield " "
+        else:
+            yield to_format(str, item)
+
+
+def html_table(header, rows):
+    """An html table of the header, which may be None, and the rows"""
+    lines = ["<table>"]
+    if header is not None:
+        lines.append("<thead>")
+        lines.append(_html_row("th", header))
+        lines.append("</thead>")
+    lines.append("<tbody>")
+    lines.extend(_html_row("td", row) for row in rows)
+    lines.append("</tbody>")
+    lines.append("</table>")
+    return "\n".join(lines)
+
+
+def html_preview(sheet, max_rows=None, max_columns=None):
+    """The preview of a sheet as html, with its dimensions if truncated"""
+    header, rows, truncated = preview(sheet, max_rows, max_columns)
+    content = "%s:\n" % escape(sheet.name)
+    content += html_table(header, rows)
+    if truncated:
+        content += "\n<p>%s</p>" % shape(sheet)
+    return content
+
+
+def is_truncated(sheet, max_rows=None, max_columns=None):
+    """Whether a preview of the sheet leaves out any cell"""
+    number_of_columns = max(sheet.number_of_columns(), len(sheet.colnames))
+    return _exceeds(sheet.number_of_rows(), max_rows) or _exceeds(
+        number_of_columns, max_columns
+    )
+
+
+def _html_row(tag, row):
+    cells = "".join(
+        "<%s>%s</%s>" % (tag, escape(cell), tag) for cell in cleanse(row)
+    )
+    return "<tr>%s</tr>" % cells
+
+
+def _rows_at(sheet, indices):
+    if None not in indices:
+        # all of them. the rows may be those of the sheet
+        return ((index, list(row)) for index, row in enumerate(sheet.rows()))
+    return (
+        (index, None if index is None else sheet.row_at(index))
+        for index in indices
+    )
+
+
+def _exceeds(length, limit):
+    return limit is not None and length > limit
+
+
+def _head_and_tail(length, limit):
+    if not _exceeds(length, limit):
+        return list(range(length))
+    head = (limit + 1) // 2
+    tail = limit // 2
+    return list(range(head)) + [None] + list(range(length - tail, length))
+
+
+def _pick(values, indices):
+    return [
+        ELLIPSIS if index is None else _value_at(values, index)
+        for index in indices
+    ]
+
+
+def _value_at(values, index):
+    if index < len(values):
+        return values[index]
+    return constants.DEFAULT_NA
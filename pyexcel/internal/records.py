@@ -0,0 +1,120 @@
+"""
+    pyexcel.internal.records
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Typed records out of a stream of rows
+
+    A record class is made once per schema, hence each row costs
+    one tuple rather than a dictionary.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+from operator import itemgetter
+from itertools import chain, islice
+from collections import namedtuple
+
+from pyexcel import constants as constants
+from pyexcel._compact import OrderedDict
+from pyexcel.internal.sheets.formatters import to_format
+
+
+def iget_typed_records(
+    rows, schema, sample_size=constants.DEFAULT_SAMPLE_SIZE, headers=None
+):
+    """Yield a record per row, using the first row as column names
+
+    :param rows: an iterable of rows, whose first row is the header
+    :param schema: 'infer' to infer the column types from the first
+                   sample_size rows, or a dictionary of column names
+                   and types. Columns without a type are not coerced
+    :param int sample_size: the number of rows used in the inference
+    :param list headers: column names to select and order the fields.
+                         None or an empty list selects all columns
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    if schema == constants.INFER_SCHEMA:
+        sample = list(islice(rows, sample_size))
+        schema = infer_schema(header, sample)
+        rows = chain(sample, rows)
+    elif not isinstance(schema, dict):
+        raise ValueError(constants.MESSAGE_UNKNOWN_SCHEMA)
+    width = len(header)
+    pick = None
+    if not headers:
+        headers = header
+    else:
+        positions = dict((name, index) for index, name in enumerate(header))
+        indices = [positions[name] for name in headers]
+        pick = itemgetter(*indices)
+    record_class = make_record_class(headers)
+    coercions = [
+        (field, coercer(schema[name]))
+        for field, name in enumerate(headers)
+        if schema.get(name) is not None
+    ]
+
+    for row in rows:
+        if len(row) != width:
+            row = list(row[:width])
+            row += [constants.DEFAULT_NA] * (width - len(row))
+        if pick is not None:
+            row = pick(row)
+            if len(headers) == 1:
+                row = (row,)
+        if coercions:
+            row = list(row)
+            for field, coerce in coercions:
+                row[field] = coerce(row[field])
+        yield record_class._make(row)
+
+
+def infer_schema(header, rows):
+    """Find the type of each column from the non empty values
+
+    A column gets a type only if its values share it, except that
+    a mix of integers and floats makes a float column.
+
+    :returns: an ordered dictionary of column names and types
+    """
+    value_types = [set() for _ in header]
+    for row in rows:
+        for index, value in enumerate(row[: len(header)]):
+            if value != constants.DEFAULT_NA:
+                value_types[index].add(type(value))
+    schema = OrderedDict()
+    for name, types in zip(header, value_types):
+        if types == set([int, float]):
+            schema[name] = float
+        elif len(types) == 1:
+            schema[name] = types.pop()
+        else:
+            schema[name] = None
+    return schema
+
+
+def make_record_class(names):
+    """A namedtuple for the column names
+
+    Names which are not valid identifiers are renamed to their
+    position, e.g. '_1'.
+    """
+    return namedtuple("Record", [str(name) for name in names], rename=True)
+
+
+def coercer(to_type):
+    """Make a function to convert a value to the given type
+
+    Empty values are kept, and so are the values which
+    cannot be converted.
+    """
+
+    def coerce(value):
+        if type(value) is to_type or value == constants.DEFAULT_NA:
+            return value
+        return to_format(to_type, value)
+
+    return coerce
@@ -46,6 +46,33 @@ class CommonPropertyAmongRowNColumn(object):
         return converter
 
 
+def map_cells(custom_function, values):
+    """Apply a function to a list of cells in one go
+
+    A cell is left unchanged when the function returns None for it
+    """
+    new_values = list(map(custom_function, values))
+    if None in new_values:
+        new_values = [
+            value if new_value is None else new_value
+            for value, new_value in zip(values, new_values)
+        ]
+    return new_values
+
+
+def keep_mask(length, indices):
+    """A flag for each of the length positions, cleared at the indices
+
+    Indices out of range are ignored, and so are repeated ones. A
+    deletion by the mask is a single pass over the positions.
+    """
+    mask = bytearray(b"\x01") * length
+    for index in indices:
+        if 0 <= index < length:
+            mask[index] = 0
+    return mask
+
+
 def analyse_slice(aslice, upper_bound):
     """An internal function to analyze a given slice"""
     if aslice.start is None:
@@ -115,12 +142,17 @@ def _get_index(index_chars):
 
 
 def names_to_indices(names, series):
-    """translate names to indices"""
+    """translate names to indices
+
+    :param series: a list of names, or a function that finds the
+                   index of a name, e.g. Sheet.column_index_of
+    """
+    index_of = series if callable(series) else series.index
     if isinstance(names, str):
-        indices = series.index(names)
+        indices = index_of(names)
     elif isinstance(names, list) and isinstance(names[0], str):
         # translate each row name to index
-        indices = [series.index(astr) for astr in names]
+        indices = [index_of(astr) for astr in names]
     else:
         return names
     return indices
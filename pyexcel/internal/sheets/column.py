@@ -104,12 +104,15 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         """
         new_indices = []
         if compact.is_array_type(indices, str):
-            new_indices = utils.names_to_indices(indices, self._ref.colnames)
+            new_indices = utils.names_to_indices(
+                indices, self._ref.column_index_of
+            )
         else:
             new_indices = indices
+        kept = set(new_indices)
         to_remove = []
         for index in self._ref.column_range():
-            if index not in new_indices:
+            if index not in kept:
                 to_remove.append(index)
         self._ref.filter(column_indices=to_remove)
 
@@ -164,7 +167,9 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         if is_sheet:
             self._ref.delete_named_column_at(aslice)
         elif compact.is_tuple_consists_of_strings(aslice):
-            indices = utils.names_to_indices(list(aslice), self._ref.colnames)
+            indices = utils.names_to_indices(
+                list(aslice), self._ref.column_index_of
+            )
             self._ref.delete_columns(indices)
         elif isinstance(aslice, slice):
             my_range = utils.analyse_slice(
@@ -285,13 +290,15 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         """
         Refer to sheet.column.name
         """
-        the_attr = attr
-        if attr not in self._ref.colnames:
-            the_attr = the_attr.replace("_", " ")
-            if the_attr not in self._ref.colnames:
+        try:
+            index = self._ref.column_index_of(attr)
+        except ValueError:
+            try:
+                index = self._ref.column_index_of(attr.replace("_", " "))
+            except ValueError:
                 raise AttributeError("%s is not found" % attr)
 
-        return self._ref.named_column_at(the_attr)
+        return self._ref.column_at(index)
 
     def format(self, column_index=None, formatter=None, format_specs=None):
         """Format a column"""
@@ -304,14 +311,17 @@ class Column(utils.CommonPropertyAmongRowNColumn):
     def _handle_one_formatter(self, columns, theformatter):
         new_indices = columns
         if len(self._ref.colnames) > 0:
-            new_indices = utils.names_to_indices(columns, self._ref.colnames)
+            new_indices = utils.names_to_indices(
+                columns, self._ref.column_index_of
+            )
         converter = utils.CommonPropertyAmongRowNColumn.get_converter(
             theformatter
         )
 
         if isinstance(new_indices, list):
+            selected = set(new_indices)
             for rcolumn in self._ref.column_range():
-                if rcolumn in new_indices:
+                if rcolumn in selected:
                     for row in self._ref.row_range():
                         value = self._ref.cell_value(row, rcolumn)
                         value = converter(value)
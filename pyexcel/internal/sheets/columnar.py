@@ -0,0 +1,391 @@
+"""
+    pyexcel.internal.sheets.columnar
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Column oriented storage for Matrix
+
+    Integer and float columns are kept in typed :class:`array.array`
+    buffers, which cost 8 bytes a cell instead of a boxed python object
+    plus a list slot. Columns of any other, or of mixed types fall back
+    to a plain list of objects.
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+from array import array
+from itertools import chain, compress
+
+from pyexcel import constants as constants
+from pyexcel.internal.sheets._shared import map_cells, keep_mask
+from pyexcel.internal.sheets.formatters import column_formatter
+
+TYPECODES = {int: "q", float: "d"}
+NULL = 1
+# rows are assembled from the columns in blocks of this size
+ROW_CHUNK = 4096
+
+
+class TypedColumn(object):
+    """A column of cells
+
+    When the column is typed, empty cells are stored as zero in the
+    buffer and flagged in a null mask, which is only allocated once
+    the column holds an empty cell. Empty cells come back as empty
+    strings, so a None written into a typed column turns it into a
+    list of objects, where None is kept as it is.
+    """
+
+    __slots__ = ("data", "nulls")
+
+    def __init__(self, data, nulls=None):
+        self.data = data
+        self.nulls = nulls
+
+    @classmethod
+    def from_values(cls, values, typecode=None):
+        """Pack a list of cell values into the most compact column"""
+        if typecode is None:
+            typecode = _infer_typecode(values)
+        if typecode is not None:
+            flags = [_is_empty(value) for value in values]
+            nulls = None
+            if any(flags):
+                nulls = bytearray(flags)
+                values = [
+                    0 if flag else value for value, flag in zip(values, flags)
+                ]
+            try:
+                return cls(array(typecode, values), nulls)
+            except OverflowError:
+                if nulls is not None:
+                    values = _restore_nulls(values, nulls)
+        return cls([_empty_to_na(value) for value in values])
+
+    def is_typed(self):
+        """Tell if the cells are in a typed buffer"""
+        return isinstance(self.data, array)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if self.nulls is not None and self.nulls[index]:
+            return constants.DEFAULT_NA
+        return self.data[index]
+
+    def __setitem__(self, index, value):
+        if value is None:
+            self.to_objects()
+        if not self.is_typed():
+            self.data[index] = value
+        elif _is_empty(value):
+            self._null_mask()[index] = NULL
+            self.data[index] = 0
+        elif TYPECODES.get(type(value)) == self.data.typecode:
+            try:
+                self.data[index] = value
+            except OverflowError:
+                self.to_objects()
+                self.data[index] = value
+                return
+            if self.nulls is not None:
+                self.nulls[index] = 0
+        else:
+            self.to_objects()
+            self.data[index] = value
+
+    def append(self, value):
+        """Append a cell at the bottom of the column"""
+        self._extend_data([0 if self.is_typed() else constants.DEFAULT_NA])
+        if self.nulls is not None:
+            self.nulls.append(0)
+        self[len(self.data) - 1] = value
+
+    def extend(self, values):
+        """Append a list of cells at the bottom of the column"""
+        if len(values) == 0:
+            return
+        if self.is_typed():
+            typecode = _infer_typecode(values, default=self.data.typecode)
+            if typecode == self.data.typecode:
+                other = TypedColumn.from_values(values, typecode)
+                if other.is_typed():
+                    nulls = self.nulls
+                    if nulls is None and other.nulls is not None:
+                        nulls = bytearray(len(self.data))
+                    self._extend_data(other.data)
+                    if nulls is not None:
+                        nulls.extend(other.nulls or bytearray(len(other.data)))
+                        self.nulls = nulls
+                    return
+            self.to_objects()
+        self.data.extend(_empty_to_na(value) for value in values)
+
+    def values(self, start=0, stop=None):
+        """Return the cells as a list of python values"""
+        if stop is None:
+            stop = len(self.data)
+        if not self.is_typed():
+            return self.data[start:stop]
+        values = self.data[start:stop].tolist()
+        if self.nulls is not None:
+            _restore_nulls(values, self.nulls[start:stop])
+        return values
+
+    def keep(self, mask):
+        """Retain only the cells whose flag in the mask is set"""
+        data = [value for value, flag in zip(self.data, mask) if flag]
+        if self.is_typed():
+            data = array(self.data.typecode, data)
+            if self.nulls is not None:
+                self.nulls = bytearray(
+                    null for null, flag in zip(self.nulls, mask) if flag
+                )
+        self.data = data
+
+    def format(self, to_type):
+        """Return the column converted to the given type
+
+        Typed columns are converted buffer to buffer. Empty cells become
+        zero for numeric types, as :meth:`~pyexcel.Sheet.format` does.
+        """
+        if self.is_typed() and to_type in TYPECODES:
+            typecode = TYPECODES[to_type]
+            if typecode == self.data.typecode:
+                data = self.data[:]
+            elif to_type is float:
+                data = array(typecode, self.data)
+            else:
+                try:
+                    data = array(typecode, map(to_type, self.data))
+                except OverflowError:
+                    data = None
+            if data is not None:
+                return TypedColumn(data)
+        values = self.values()
+        converter = column_formatter(values, to_type)
+        if converter is None:
+            return self.copy()
+        return TypedColumn.from_values(list(map(converter, values)))
+
+    def copy(self):
+        """Shallow copy of the column"""
+        nulls = None
+        if self.nulls is not None:
+            nulls = bytearray(self.nulls)
+        return TypedColumn(self.data[:], nulls)
+
+    def to_objects(self):
+        """Turn the column into a list of objects, e.g. when mixed types
+        are stored in it"""
+        if self.is_typed():
+            self.data = self.values()
+            self.nulls = None
+
+    def _extend_data(self, values):
+        try:
+            self.data.extend(values)
+        except BufferError:
+            # the buffer is shared, e.g. by an arrow array, and cannot
+            # be resized. so a copy of it is grown instead
+            self.data = self.data[:]
+            self.data.extend(values)
+
+    def _null_mask(self):
+        if self.nulls is None:
+            self.nulls = bytearray(len(self.data))
+        return self.nulls
+
+
+class ColumnarStorage(object):
+    """Column by column representation of a uniform two dimensional array
+
+    Its interface follows the one of Matrix, with row and column indices
+    always within range. Each column is a :class:`TypedColumn`.
+    """
+
+    def __init__(self, columns=None, height=0):
+        if columns is None:
+            columns = []
+        self.columns = columns
+        self.height = height
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build the storage from a list of lists of uneven length"""
+        if not isinstance(rows, list):
+            rows = list(rows)
+        width = 0
+        if len(rows) > 0:
+            width = max(map(len, rows))
+        columns = []
+        for index in range(width):
+            values = [
+                row[index] if index < len(row) else constants.DEFAULT_NA
+                for row in rows
+            ]
+            columns.append(TypedColumn.from_values(values))
+        return cls(columns, len(rows))
+
+    def number_of_rows(self):
+        return self.height
+
+    def number_of_columns(self):
+        return len(self.columns)
+
+    def cell(self, row, column):
+        return self.columns[column][row]
+
+    def set_cell(self, row, column, value):
+        self.columns[column][row] = value
+
+    def row(self, index):
+        return [column[index] for column in self.columns]
+
+    def column(self, index):
+        return self.columns[index].values()
+
+    def rows(self, reverse=False):
+        """Iterate rows, which are assembled a block at a time"""
+        starts = range(0, self.height, ROW_CHUNK)
+        if reverse:
+            starts = reversed(starts)
+        for start in starts:
+            stop = min(start + ROW_CHUNK, self.height)
+            block = [column.values(start, stop) for column in self.columns]
+            if len(block) == 0:
+                block_rows = [[] for _ in range(stop - start)]
+            else:
+                block_rows = [list(row) for row in zip(*block)]
+            if reverse:
+                block_rows.reverse()
+            for row in block_rows:
+                yield row
+
+    def to_rows(self):
+        """Return a new list of lists"""
+        return list(self.rows())
+
+    def expand(self, height, width):
+        """Grow the storage to at least height x width with empty cells"""
+        if height > self.height:
+            for column in self.columns:
+                column.extend([constants.DEFAULT_NA] * (height - self.height))
+            self.height = height
+        for _ in range(len(self.columns), width):
+            self.columns.append(
+                TypedColumn([constants.DEFAULT_NA] * self.height)
+            )
+
+    def set_row(self, index, row, starting=0):
+        """Replace cells of a row from the given column onwards"""
+        self.expand(self.height, starting + len(row))
+        for offset, value in enumerate(row):
+            self.columns[starting + offset][index] = value
+
+    def set_column(self, index, values, starting=0):
+        """Replace cells of a column from the given row onwards"""
+        self.expand(starting + len(values), self.number_of_columns())
+        column = self.columns[index]
+        for offset, value in enumerate(values):
+            column[starting + offset] = value
+
+    def append_rows(self, rows):
+        """Append rows at the bottom, padding or widening as needed"""
+        if len(rows) == 0:
+            return
+        width = max(self.number_of_columns(), max(map(len, rows)))
+        self.expand(self.height, width)
+        for index, column in enumerate(self.columns):
+            column.extend(
+                [
+                    row[index] if index < len(row) else constants.DEFAULT_NA
+                    for row in rows
+                ]
+            )
+        self.height += len(rows)
+
+    def append_columns(self, columns):
+        """Append columns on the right, padding or heightening as needed"""
+        if len(columns) == 0:
+            return
+        self.expand(max(self.height, max(map(len, columns))), 0)
+        for values in columns:
+            values = list(values)
+            values += [constants.DEFAULT_NA] * (self.height - len(values))
+            self.columns.append(TypedColumn.from_values(values))
+
+    def delete_rows(self, indices):
+        """Delete the rows at the given indices in one pass"""
+        mask = keep_mask(self.height, indices)
+        for column in self.columns:
+            column.keep(mask)
+        self.height = sum(mask)
+
+    def delete_columns(self, indices):
+        """Delete the columns at the given indices"""
+        mask = keep_mask(len(self.columns), indices)
+        self.columns = list(compress(self.columns, mask))
+
+    def map(self, custom_function):
+        """Apply a function to every cell, a column at a time"""
+        self.columns = [
+            TypedColumn.from_values(
+                map_cells(custom_function, column.values())
+            )
+            for column in self.columns
+        ]
+
+    def format(self, to_type):
+        """Convert every cell to the given type, a column at a time"""
+        self.columns = [column.format(to_type) for column in self.columns]
+
+    def transpose(self):
+        """Return a new storage whose rows are the columns of this one"""
+        return ColumnarStorage.from_rows(
+            [column.values() for column in self.columns]
+        )
+
+    def enumerate(self):
+        return chain.from_iterable(self.rows())
+
+    def copy(self):
+        return ColumnarStorage(
+            [column.copy() for column in self.columns], self.height
+        )
+
+
+def _is_empty(value):
+    return value is None or (isinstance(value, str) and value == "")
+
+
+def _empty_to_na(value):
+    if value is None:
+        return constants.DEFAULT_NA
+    return value
+
+
+def _infer_typecode(values, default=None):
+    """Find the typecode shared by all non-empty values, if any"""
+    found = None
+    for value in values:
+        if _is_empty(value):
+            continue
+        typecode = TYPECODES.get(type(value))
+        if typecode is None:
+            return None
+        if found is None:
+            found = typecode
+        elif found != typecode:
+            return None
+    if found is None:
+        return default
+    return found
+
+
+def _restore_nulls(values, nulls):
+    index = nulls.find(NULL)
+    while index != -1:
+        values[index] = constants.DEFAULT_NA
+        index = nulls.find(NULL, index + 1)
+    return values
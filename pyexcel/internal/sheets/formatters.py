@@ -10,6 +10,7 @@
 import json
 import datetime
 from decimal import Decimal
+from functools import partial
 
 from pyexcel import constants as constants
 from pyexcel._compact import PY2
@@ -113,6 +114,15 @@ if PY2:
     CONVERSION_FUNCTIONS[long] = float_to_format
 
 
+# the values of these types are converted by the target type itself
+# as they would be by to_format, e.g. float(1) gives int_to_format(1, float)
+BUILTIN_CONVERSIONS = {
+    float: set([int, float, bool]),
+    int: set([int, float, Decimal]),
+    str: set([str, int, float, Decimal]),
+}
+
+
 def default_formatter(value, to_type):
     return json.dumps(value)
 
@@ -133,3 +143,25 @@ def to_format(to_type, value):
         from_type = None
     func = CONVERSION_FUNCTIONS.get(from_type, default_formatter)
     return func(value, to_type)
+
+
+def column_formatter(values, to_type):
+    """Plan the conversion of a column of values to the given type
+
+    The plan is made once for all values from their types, so that
+    the column can be converted with a single map call.
+
+    :param list values: the values of a column
+    :param type to_type: a python type
+    :returns: None if the values need no conversion, otherwise the
+              function to convert each value with
+    """
+    value_types = set(map(type, values))
+    builtin_types = BUILTIN_CONVERSIONS.get(to_type)
+    if builtin_types is None:
+        return partial(to_format, to_type)
+    if value_types == set([to_type]):
+        return None
+    if value_types.issubset(builtin_types):
+        return to_type
+    return partial(to_format, to_type)
@@ -0,0 +1,85 @@
+"""
+    pyexcel.internal.sheets.indexes
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Indexes of the values in a column
+
+    :copyright: (c) 2015-2020 by Onni Software Ltd.
+    :license: New BSD License
+"""
+import numbers
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+
+from pyexcel import constants as constants
+
+
+class HashIndex(object):
+    """Row positions by cell value, for equality look ups"""
+
+    def __init__(self, values):
+        self.positions = {}
+        for position, value in enumerate(values):
+            self.positions.setdefault(value, []).append(position)
+
+    def find(self, value):
+        """The positions of the rows which have the value, in order"""
+        return list(self.positions.get(value, []))
+
+
+class SortedIndex(object):
+    """Row positions sorted by cell value, for range look ups
+
+    Values are sorted within their kind: numbers, strings, dates
+    and so on. A value is compared with the values of its kind
+    only, hence an empty cell is never less than a number.
+    """
+
+    def __init__(self, values):
+        keys = [(_kind(value), value) for value in values]
+        self.positions = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[position] for position in self.positions]
+
+    def find(self, operator, value):
+        """The positions of the rows whose value compares, in order
+
+        :param str operator: one of '==', '<', '<=', '>' and '>='
+        """
+        kind = _kind(value)
+        # the values of the kind sit between (kind,) and (kind + '\0',)
+        start = bisect_left(self.keys, (kind,))
+        stop = bisect_left(self.keys, (kind + "\0",), start)
+        key = (kind, value)
+        if operator == "<":
+            stop = bisect_left(self.keys, key, start, stop)
+        elif operator == "<=":
+            stop = bisect_right(self.keys, key, start, stop)
+        elif operator == ">":
+            start = bisect_right(self.keys, key, start, stop)
+        elif operator == ">=":
+            start = bisect_left(self.keys, key, start, stop)
+        elif operator == "==":
+            start = bisect_left(self.keys, key, start, stop)
+            stop = bisect_right(self.keys, key, start, stop)
+        else:
+            raise ValueError(constants.MESSAGE_UNKNOWN_OPERATOR % operator)
+        return sorted(self.positions[start:stop])
+
+
+INDEXES = {
+    constants.HASH_INDEX: HashIndex,
+    constants.SORTED_INDEX: SortedIndex,
+}
+
+
+def make_index(kind, values):
+    """Index the values with a hash index or a sorted index"""
+    if kind not in INDEXES:
+        raise ValueError(constants.MESSAGE_UNKNOWN_INDEX % kind)
+    return INDEXES[kind](values)
+
+
+def _kind(value):
+    if isinstance(value, (numbers.Real, Decimal)):
+        return "number"
+    return type(value).__name__
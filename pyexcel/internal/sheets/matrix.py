@@ -10,55 +10,140 @@
 """
 import copy
 import types
-from functools import partial
-from itertools import chain
+from itertools import chain, repeat, compress, zip_longest
 
 from pyexcel import _compact as compact
 from pyexcel import constants as constants
 from pyexcel.internal.meta import SheetMeta
 from pyexcel.internal.sheets.row import Row
 from pyexcel.internal.sheets.column import Column
-from pyexcel.internal.sheets.formatters import to_format
+from pyexcel.internal.sheets.indexes import make_index
+from pyexcel.internal.sheets.columnar import ColumnarStorage
+from pyexcel.internal.sheets.formatters import column_formatter
 from pyexcel.internal.sheets.extended_list import PyexcelList
 
 from . import _shared as utils
 
 
+# rows transposed at a time
+TRANSPOSE_BLOCK_SIZE = 1024
+
+
 class Matrix(SheetMeta):
     """The internal representation of a sheet data. Each element
     can be of any python types
+
+    By default, the data is kept as a list of rows. With
+    storage='columnar', the data is kept column by column instead
+    and integer and float columns are packed into typed arrays.
+    Operations which have no columnar implementation, e.g. paste,
+    work on a temporary row storage.
+
+    :meth:`transpose` only marks the rows as transposed. Reading
+    cells, rows and columns swaps the indices, while anything else
+    transposes the rows for real first.
+
+    The data of a matrix can be lent to others, e.g. to its clones or
+    to the sheets of a book made by '+'. They read the same rows or
+    columns. Once either of them changes, each keeps a list of its own
+    and copies a row before changing it, while the columnar storage is
+    copied as a whole.
     """
 
-    def __init__(self, array):
+    def __init__(self, array, storage=constants.ROW_STORAGE):
         """Constructor
 
         The reason a deep copy was not made here is because
         the data sheet could be huge. It could be costly to
         copy every cell to a new memory area
         :param list array: a list of arrays
+        :param str storage: 'row' or 'columnar'
         """
+        if storage not in constants.STORAGES:
+            raise ValueError(constants.MESSAGE_UNKNOWN_STORAGE % storage)
+        self.__store = None
+        # the rows are kept as they are until a transposed view of them
+        # is to be changed
+        self.__rows = None
+        self.__transposed = False
+        # ids of the rows which may be shared with other matrices
+        self.__shared = set()
+        # the count of the matrices which share the data, or None
+        self.__sharers = None
+        # value indexes by column and kind, dropped on any change
+        self.__indexes = {}
         if isinstance(array, types.GeneratorType):
-            self.__width, self.__array = uniform(list(array))
-        else:
-            try:
+            array = list(array)
+        try:
+            if storage == constants.COLUMNAR_STORAGE:
+                self.__width, self.__array = 0, None
+                self.__store = ColumnarStorage.from_rows(array)
+            else:
                 self.__width, self.__array = uniform(array)
-            except TypeError:
-                raise TypeError("Invalid two dimensional array")
+        except TypeError:
+            raise TypeError("Invalid two dimensional array")
         self.row = Row(self)
         self.column = Column(self)
         self.name = "matrix"
 
+    @property
+    def __array(self):
+        """The rows, transposed for real if they are only marked so"""
+        if self.__transposed:
+            self.__materialise()
+        return self.__rows
+
+    @__array.setter
+    def __array(self, rows):
+        self.__rows = rows
+        self.__transposed = False
+
+    def __materialise(self):
+        # a copy of the list of rows, for the rows are dropped from it
+        # while they are transposed, and the list may be the caller's
+        rows = list(self.__rows)
+        self.__rows = None
+        self.__shared.clear()
+        # the rows transposed are new ones
+        self.__release()
+        width = len(rows) if self.__width > 0 else 0
+        self.__rows = transpose_uniform(rows, self.__width)
+        self.__width = width
+        self.__transposed = False
+
+    @property
+    def storage(self):
+        """The storage in use: 'row' or 'columnar'"""
+        if self.__store is not None:
+            return constants.COLUMNAR_STORAGE
+        return constants.ROW_STORAGE
+
     def get_internal_array(self):
-        """present internal array"""
-        return self.__array
+        """present internal array
+
+        For columnar storage, it is a snapshot: a new list of rows,
+        which are not written back when they are changed. Use
+        :meth:`cell_value`, :meth:`set_row_at` and the like instead.
+        """
+        if self.__store is not None:
+            return self.__store.to_rows()
+        return self.__exposed_rows()
 
     def number_of_rows(self):
         """The number of rows"""
-        return len(self.__array)
+        if self.__store is not None:
+            return self.__store.number_of_rows()
+        if self.__transposed:
+            return self.__width
+        return len(self.__rows)
 
     def number_of_columns(self):
         """The number of columns"""
         if self.number_of_rows() > 0:
+            if self.__store is not None:
+                return self.__store.number_of_columns()
+            if self.__transposed:
+                return len(self.__rows)
             return self.__width
         else:
             return 0
@@ -85,38 +170,69 @@ class Matrix(SheetMeta):
         fit = row < self.number_of_rows() and column < self.number_of_columns()
         if new_value is None:
             if fit:
-                return self.__array[row][column]
+                if self.__store is not None:
+                    return self.__store.cell(row, column)
+                if self.__transposed:
+                    return self.__rows[column][row]
+                return self.__rows[row][column]
             else:
                 raise IndexError("Index out of range")
+        elif self.__store is not None:
+            self._changed()
+            if not fit:
+                self.__store.expand(row + 1, column + 1)
+            self.__store.set_cell(row, column, new_value)
         else:
+            self._changed()
             if not fit:
-                width, array = uniform(self.__array, row+1, column+1)
-                self.__width, self.__array = width, array
+                nrows = self.number_of_rows()
+                self._uniform(row + 1, column + 1, range(nrows, nrows))
 
-            self.__array[row][column] = new_value
+            self._own_row(row)[column] = new_value
 
     def row_at(self, index):
         """
         Gets the data at the specified row
+
+        A shallow copy of the row, a
+        :class:`~pyexcel.internal.sheets.extended_list.PyexcelList`,
+        is returned.
         """
+        if self.__store is not None:
+            if index in self.row_range() or (
+                index < 0 and utils.abs(index) in self.row_range()
+            ):
+                return PyexcelList(self.__store.row(index))
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+
+        if self.__transposed:
+            if index in self.row_range() or (
+                index < 0 and utils.abs(index) in self.row_range()
+            ):
+                return PyexcelList(row[index] for row in self.__rows)
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+
         if index in self.row_range():
-            return PyexcelList(copy.deepcopy(self.__array[index]))
+            return PyexcelList(self.__array[index])
 
         elif index < 0 and utils.abs(index) in self.row_range():
-            return PyexcelList(
-                copy.deepcopy(self.__array[index + self.number_of_rows()])
-            )
+            return PyexcelList(self.__array[index + self.number_of_rows()])
 
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
     def set_row_at(self, row_index, data_array):
         """Update a row data range"""
+        self._changed()
         nrows = self.number_of_rows()
-        if row_index < nrows:
+        if row_index < nrows and self.__store is not None:
+            ncolumns = self.number_of_columns()
+            padding = [constants.DEFAULT_NA] * (ncolumns - len(data_array))
+            self.__store.set_row(row_index, list(data_array) + padding)
+        elif row_index < nrows:
             self.__array[row_index] = data_array
             if len(data_array) != self.number_of_columns():
-                self.__width, self.__array = uniform(self.__array)
+                self._uniform(changed=range(row_index, row_index + 1))
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -138,9 +254,13 @@ class Matrix(SheetMeta):
         :raises IndexError: if row_index exceeds row range or starting
                             exceeds column range
         """
+        self._changed()
         nrows = self.number_of_rows()
         ncolumns = self.number_of_columns()
-        if row_index < nrows and starting < ncolumns:
+        fit = row_index < nrows and starting < ncolumns
+        if fit and self.__store is not None:
+            self.__store.set_row(row_index, data_array, starting=starting)
+        elif fit:
             real_len = len(data_array) + starting
             end = min(real_len, ncolumns)
             for i in range(starting, end):
@@ -150,51 +270,73 @@ class Matrix(SheetMeta):
                 self.__array[row_index] = (
                     self.__array[row_index] + data_array[left:]
                 )
-            self.__width, self.__array = uniform(self.__array)
+            self._uniform(changed=range(row_index, row_index + 1))
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
     def _extend_row(self, row):
+        self._changed()
         array = copy.deepcopy(row)
-        if compact.is_array_type(array, list):
-            self.__array += array
+        if not compact.is_array_type(array, list):
+            array = [array]
+        if self.__store is not None:
+            self.__store.append_rows(array)
         else:
-            self.__array.append(array)
+            self.__array += array
 
     def extend_rows(self, rows):
         """Inserts two dimensional data after the bottom row"""
         if isinstance(rows, list):
+            nrows = self.number_of_rows()
             self._extend_row(rows)
-            self.__width, self.__array = uniform(self.__array)
+            if self.__store is None:
+                self._uniform(changed=range(nrows, self.number_of_rows()))
         else:
             raise TypeError("Cannot use %s" % type(rows))
 
+    def append_rows(self, rows):
+        """Append rows after the bottom row
+
+        Unlike :meth:`extend_rows`, the rows can come from any
+        iterable, e.g. a generator, and are copied but not deep
+        copied. Only the new rows are padded, unless they are wider
+        than the others, hence appending a row at a time takes
+        constant time.
+
+        :param rows: an iterable of rows
+        """
+        self._changed()
+        rows = [list(row) for row in rows]
+        if self.__store is not None:
+            self.__store.append_rows(rows)
+            return
+        nrows = self.number_of_rows()
+        self.__array.extend(rows)
+        self._uniform(changed=range(nrows, self.number_of_rows()))
+
     def delete_rows(self, row_indices):
         """Deletes specified row indices"""
         if isinstance(row_indices, list) is False:
             raise IndexError
-        if len(row_indices) > 0:
-            unique_list = _unique(row_indices)
-            sorted_list = sorted(unique_list, reverse=True)
-            for i in sorted_list:
-                if i < self.number_of_rows() and i >= 0:
-                    del self.__array[i]
+        self._changed()
+        if len(row_indices) > 0 and self.__store is not None:
+            self.__store.delete_rows(row_indices)
+        elif len(row_indices) > 0:
+            mask = utils.keep_mask(self.number_of_rows(), row_indices)
+            self.__array[:] = compress(self.__array, mask)
 
     def column_at(self, index):
         """
         Gets the data at the specified column
         """
-        cell_array = PyexcelList()
-        if index in self.column_range():
-            for i in self.row_range():
-                cell_array.append(self.cell_value(i, index))
-            return cell_array
-
-        elif index < 0 and utils.abs(index) in self.column_range():
-            reverse_index = self.number_of_columns() + index
-            for i in self.row_range():
-                cell_array.append(self.cell_value(i, reverse_index))
-            return cell_array
+        if index in self.column_range() or (
+            index < 0 and utils.abs(index) in self.column_range()
+        ):
+            if self.__store is not None:
+                return PyexcelList(self.__store.column(index))
+            if self.__transposed:
+                return PyexcelList(self.__rows[index])
+            return PyexcelList(row[index] for row in self.__rows)
 
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
@@ -219,9 +361,13 @@ class Matrix(SheetMeta):
         :raises IndexError: if column_index exceeds column range
                             or starting exceeds row range
         """
+        self._changed()
         nrows = self.number_of_rows()
         ncolumns = self.number_of_columns()
-        if column_index < ncolumns and starting < nrows:
+        fit = column_index < ncolumns and starting < nrows
+        if fit and self.__store is not None:
+            self.__store.set_column(column_index, data_array, starting)
+        elif fit:
             real_len = len(data_array) + starting
             end = min(real_len, nrows)
             for i in range(starting, end):
@@ -230,7 +376,7 @@ class Matrix(SheetMeta):
                 for i in range(nrows, real_len):
                     new_row = [""] * column_index + [data_array[i - starting]]
                     self.__array.append(new_row)
-            self.__width, self.__array = uniform(self.__array)
+            self._uniform(changed=range(nrows, self.number_of_rows()))
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -256,6 +402,16 @@ class Matrix(SheetMeta):
         self._extend_columns_with_rows(incoming_data)
 
     def _extend_columns_with_rows(self, rows):
+        self._changed()
+        if self.__store is not None:
+            width = longest_row_number(rows)
+            padded = [
+                list(row) + [constants.DEFAULT_NA] * (width - len(row))
+                for row in rows
+            ]
+            self.__store.append_columns(list(zip(*padded)))
+            return
+        self._own_rows()
         current_nrows = self.number_of_rows()
         current_ncols = self.number_of_columns()
         insert_column_nrows = len(rows)
@@ -270,7 +426,7 @@ class Matrix(SheetMeta):
                 new_array = [constants.DEFAULT_NA] * current_ncols
                 new_array += rows[base + i]
                 self.__array.append(new_array)
-        self.__width, self.__array = uniform(self.__array)
+        self._uniform()
 
     def extend_columns_with_rows(self, rows):
         """Rows were appended to the rightmost side
@@ -403,12 +559,18 @@ class Matrix(SheetMeta):
             +----+----+----+----+----+----+----+----+----+----+----+----+
 
         """
-        if rows:
-            self._paste_rows(topleft_corner, rows)
-        elif columns:
-            self._paste_columns(topleft_corner, columns)
-        else:
-            raise ValueError(constants.MESSAGE_DATA_ERROR_EMPTY_CONTENT)
+        self._changed()
+        storage = self.storage
+        self._use_storage(constants.ROW_STORAGE)
+        try:
+            if rows:
+                self._paste_rows(topleft_corner, rows)
+            elif columns:
+                self._paste_columns(topleft_corner, columns)
+            else:
+                raise ValueError(constants.MESSAGE_DATA_ERROR_EMPTY_CONTENT)
+        finally:
+            self._use_storage(storage)
 
     def _paste_rows(self, topleft_corner, rows):
         starting_row, starting_column = topleft_corner
@@ -430,7 +592,7 @@ class Matrix(SheetMeta):
             else:
                 real_row = [constants.DEFAULT_NA] * topleft_corner[1] + row
                 self._extend_row(real_row)
-        self.__width, self.__array = uniform(self.__array)
+        self._uniform()
 
     def _paste_columns(self, topleft_corner, columns):
         starting_column = topleft_corner[1]
@@ -445,19 +607,22 @@ class Matrix(SheetMeta):
                 real_column = [constants.DEFAULT_NA] * topleft_corner[0]
                 real_column += column
                 self.extend_columns([real_column])
-        self.__width, self.__array = uniform(self.__array)
+        self._uniform()
 
     def delete_columns(self, column_indices):
         """Delete columns by specified list of indices"""
         if isinstance(column_indices, list) is False:
             raise TypeError(constants.MESSAGE_DATA_ERROR_DATA_TYPE_MISMATCH)
-        if len(column_indices) > 0:
-            unique_list = _unique(column_indices)
-            sorted_list = sorted(unique_list, reverse=True)
-            for i in self.row_range():
-                for j in sorted_list:
-                    if j < self.number_of_columns() and j >= 0:
-                        del self.__array[i][j]
+        self._changed()
+        if len(column_indices) > 0 and self.__store is not None:
+            self.__store.delete_columns(column_indices)
+        elif len(column_indices) > 0:
+            mask = utils.keep_mask(self.number_of_columns(), column_indices)
+            if all(mask):
+                return
+            self._own_rows()
+            for row in self.__array:
+                row[:] = compress(row, mask)
             self.__width = longest_row_number(self.__array)
 
     def __setitem__(self, aset, cell_value):
@@ -494,14 +659,18 @@ class Matrix(SheetMeta):
     def transpose(self):
         """Rotate the data table by 90 degrees
 
-        Reference :func:`transpose`
+        It takes no time, for the rows are only marked as transposed
+        until they are changed. See :class:`Matrix`.
         """
-        self.__array = transpose(self.__array)
-        self.__width, self.__array = uniform(self.__array)
+        self._changed()
+        if self.__store is not None:
+            self.__store = self.__store.transpose()
+            return
+        self.__transposed = not self.__transposed
 
     def to_array(self):
         """Get an array out"""
-        return self.__array
+        return self.get_internal_array()
 
     def __iter__(self):
         """
@@ -528,6 +697,10 @@ class Matrix(SheetMeta):
 
         More details see :class:`HTLBRIterator`
         """
+        if self.__store is not None:
+            return self.__store.enumerate()
+        if self.__transposed:
+            return chain(*compact.czip(*self.__rows))
         return chain(*self.__array)
 
     def reverse(self):
@@ -549,7 +722,7 @@ class Matrix(SheetMeta):
 
         More details see :class:`HBRTLIterator`
         """
-        for row in reversed(self.__array):
+        for row in self.rrows():
             for cell in reversed(row):
                 yield cell
 
@@ -574,6 +747,10 @@ class Matrix(SheetMeta):
 
         More details see :class:`VTLBRIterator`
         """
+        if self.__store is not None:
+            return chain.from_iterable(self.columns())
+        if self.__transposed:
+            return chain(*self.__rows)
         return chain(*compact.czip(*self.__array))
 
     def rvertical(self):
@@ -597,7 +774,7 @@ class Matrix(SheetMeta):
 
         More details see :class:`VBRTLIterator`
         """
-        for column in compact.czip(*(reversed(row) for row in self.__array)):
+        for column in self.rcolumns():
             for cell in reversed(column):
                 yield cell
 
@@ -622,7 +799,15 @@ class Matrix(SheetMeta):
 
         More details see :class:`RowIterator`
         """
-        for row in self.__array:
+        if self.__store is not None:
+            for row in self.__store.rows():
+                yield row
+            return
+        if self.__transposed:
+            for column in compact.czip(*self.__rows):
+                yield list(column)
+            return
+        for row in self.__exposed_rows():
             yield row
 
     def rrows(self):
@@ -646,7 +831,16 @@ class Matrix(SheetMeta):
 
         More details see :class:`RowReverseIterator`
         """
-        for row in reversed(self.__array):
+        if self.__store is not None:
+            for row in self.__store.rows(reverse=True):
+                yield row
+            return
+        if self.__transposed:
+            reversed_rows = (reversed(row) for row in self.__rows)
+            for column in compact.czip(*reversed_rows):
+                yield list(column)
+            return
+        for row in reversed(self.__exposed_rows()):
             yield row
 
     def columns(self):
@@ -670,6 +864,14 @@ class Matrix(SheetMeta):
 
         More details see :class:`ColumnIterator`
         """
+        if self.__store is not None:
+            for index in self.column_range():
+                yield self.__store.column(index)
+            return
+        if self.__transposed:
+            for row in self.__rows:
+                yield list(row)
+            return
         for row in compact.czip(*self.__array):
             yield list(row)
 
@@ -694,6 +896,14 @@ class Matrix(SheetMeta):
 
         More details see :class:`ColumnReverseIterator`
         """
+        if self.__store is not None:
+            for index in reversed(self.column_range()):
+                yield self.__store.column(index)
+            return
+        if self.__transposed:
+            for row in reversed(self.__rows):
+                yield list(row)
+            return
         for column in compact.czip(*(reversed(row) for row in self.__array)):
             yield list(column)
 
@@ -728,8 +938,25 @@ class Matrix(SheetMeta):
             [1, 1, 2, 1]
 
         """
-        custom_function = partial(to_format, formatter)
-        self.map(custom_function)
+        self._changed()
+        if self.__store is not None:
+            self.__store.format(formatter)
+            return
+        if self.number_of_columns() == 0:
+            return
+        columns = list(compact.czip(*self.__array))
+        converters = [
+            column_formatter(column, formatter) for column in columns
+        ]
+        if all(converter is None for converter in converters):
+            return
+        columns = [
+            column if converter is None else map(converter, column)
+            for column, converter in zip(columns, converters)
+        ]
+        self._own_rows()
+        for row, new_row in zip(self.__array, compact.czip(*columns)):
+            row[:] = new_row
 
     def map(self, custom_function):
         """Execute a function across all cells of the sheet
@@ -753,36 +980,186 @@ class Matrix(SheetMeta):
             [2.0, 2.25, 3.0, 2.0]
 
         """
-        for row in self.row_range():
-            for column in self.column_range():
-                value = self.cell_value(row, column)
-                value = custom_function(value)
-                self.cell_value(row, column, value)
+        self._changed()
+        if self.__store is not None:
+            self.__store.map(custom_function)
+            return
+        self._own_rows()
+        for row in self.__array:
+            row[:] = utils.map_cells(custom_function, row)
 
     def __iadd__(self, other):
-        return _add(self.name, self.__array, other)
+        return _add(self, other)
 
     def __add__(self, other):
         """Overload the + sign
 
+        The sheets of the new book share the data of the operands
+        until either changes.
+
         :returns: a new book
         """
-        return _add(self.name, copy.deepcopy(self.__array), other)
+        return _add(self, other)
 
     def clone(self):
-        return Matrix(copy.deepcopy(self.__array))
+        """A copy of the matrix, sharing the data until either changes"""
+        new_matrix = Matrix([])
+        new_matrix._borrow(self)
+        return new_matrix
 
+    def create_index(self, column, kind=constants.HASH_INDEX):
+        """Index the values of a column
 
-def _unique(seq):
-    """Return a unique list of the incoming list
+        The index is made once and kept until the matrix changes.
 
-    Reference:
-    http://stackoverflow.com/questions/480214/
-    how-do-you-remove-duplicates-from-a-list-in-python-whilst-preserving-order
-    """
-    seen = set()
-    seen_add = seen.add
-    return [x for x in seq if not (x in seen or seen_add(x))]
+        :param int column: the column index
+        :param str kind: 'hash' for equality look ups, or 'sorted'
+                         for range look ups too
+        """
+        if column < 0:
+            column = column + self.number_of_columns()
+        index = self.__indexes.get((column, kind))
+        if index is None:
+            index = make_index(kind, self.column_at(column))
+            self.__indexes[(column, kind)] = index
+        return index
+
+    def _changed(self):
+        """Drop the value indexes, which may no longer match the data
+
+        Data shared with another matrix is copied before it changes
+        """
+        self.__indexes.clear()
+        if self.__sharers is not None:
+            self.__unshare()
+
+    def _borrow(self, other):
+        """Share the data of another matrix until either of them changes"""
+        self._changed()
+        if other.__sharers is None:
+            other.__sharers = [1]
+        other.__sharers[0] += 1
+        self.__sharers = other.__sharers
+        self.__shared.clear()
+        self.__store = other.__store
+        self.__width = other.__width
+        self.__rows = other.__rows
+        self.__transposed = other.__transposed
+
+    def __unshare(self):
+        if self.__store is not None:
+            if self.__sharers[0] > 1:
+                self.__store = self.__store.copy()
+        else:
+            if self.__sharers[0] > 1:
+                self.__rows = list(self.__rows)
+            # the others may still read the rows, hence they are copied
+            # one by one when they are to change
+            self.__shared.update(id(row) for row in self.__rows)
+        self.__release()
+
+    def __release(self):
+        if self.__sharers is not None:
+            self.__sharers[0] -= 1
+            self.__sharers = None
+
+    def _own_row(self, index):
+        """Get a row which is safe to change in place
+
+        A row shared with other matrices is replaced by a copy of it
+        """
+        row = self.__array[index]
+        if id(row) in self.__shared:
+            self.__shared.discard(id(row))
+            row = list(row)
+            self.__array[index] = row
+        return row
+
+    def __exposed_rows(self):
+        """The rows, to be handed out as they are
+
+        Whoever gets them may change them in place, hence the rows
+        shared with other matrices are copied first and the value
+        indexes are dropped
+        """
+        self.__indexes.clear()
+        if self.__sharers is not None and not self.__transposed:
+            self.__unshare()
+        self._own_rows()
+        return self.__array
+
+    def _own_rows(self):
+        if self.__shared:
+            for index, row in enumerate(self.__array):
+                if id(row) in self.__shared:
+                    self.__array[index] = list(row)
+            self.__shared.clear()
+
+    def _uniform(self, min_rows=0, min_columns=0, changed=None):
+        """Make the array MxN again after a change
+
+        :param range changed: the rows which have changed, all rows
+                              by default. The other rows are padded
+                              only when the changed rows are wider
+        """
+        array = self.__array
+        if changed is None or len(changed) == len(array):
+            self._own_rows()
+            self.__width, self.__array = uniform(
+                array, min_rows, min_columns
+            )
+            return
+        width = max(
+            min_columns,
+            self.__width,
+            longest_row_number([array[index] for index in changed]),
+        )
+        if width > self.__width:
+            self._own_rows()
+            changed = range(len(array))
+        if width > 0:
+            pad_rows(array, width, changed)
+            for _ in range(len(array), min_rows):
+                array.append([constants.DEFAULT_NA] * width)
+        self.__width = width
+
+    def _typed_columns(self):
+        """The columns of the columnar storage, or None for rows"""
+        if self.__store is None:
+            return None
+        return self.__store.columns
+
+    def _use_columns(self, columns, height):
+        """Replace the data by columnar storage of the given columns"""
+        self.__release()
+        self._changed()
+        self.__shared.clear()
+        self.__width, self.__array = 0, None
+        self.__store = ColumnarStorage(columns, height)
+
+    def _use_rows(self, rows, width):
+        """Replace the data by rows made uniform already by :func:`uniform`
+
+        :param list rows: rows of the given width
+        :param int width: the width of the rows
+        """
+        self.__release()
+        self._changed()
+        self.__shared.clear()
+        self.__store = None
+        self.__width, self.__array = width, rows
+
+    def _use_storage(self, storage):
+        """Convert the data to the given storage, 'row' or 'columnar'"""
+        if storage == self.storage:
+            return
+        if storage == constants.COLUMNAR_STORAGE:
+            self.__store = ColumnarStorage.from_rows(self.__array)
+            self.__width, self.__array = 0, None
+        else:
+            rows = self.__store.to_rows()
+            self.__store = None
+            self.__width, self.__array = uniform(rows)
 
 
 def longest_row_number(array):
@@ -811,19 +1188,33 @@ def uniform(array, min_rows=0, min_columns=0):
     if width == 0:
         return 0, array
     else:
-        for row in array:
-            row_length = len(row)
-            for index in range(0, row_length):
-                if row[index] is None:
-                    row[index] = constants.DEFAULT_NA
-            if row_length < width:
-                row += [constants.DEFAULT_NA] * (width - row_length)
+        pad_rows(array, width)
         for _ in range(array_length, height):
             row = [constants.DEFAULT_NA] * width
             array.append(row)
         return width, array
 
 
+def pad_rows(array, width, row_indices=None):
+    """Fill-in empty strings to the empty cells of the rows
+
+    :param list array: a list of arrays
+    :param int width: the length of the rows
+    :param range row_indices: the rows to be padded, all by default
+    """
+    if row_indices is None:
+        rows = enumerate(array)
+    else:
+        rows = ((index, array[index]) for index in row_indices)
+    for row_index, row in rows:
+        row_length = len(row)
+        for index in range(0, row_length):
+            if row[index] is None:
+                row[index] = constants.DEFAULT_NA
+        if row_length < width:
+            row += [constants.DEFAULT_NA] * (width - row_length)
+
+
 def transpose(in_array):
     """Rotate clockwise by 90 degrees and flip horizontally
 
@@ -837,40 +1228,54 @@ def transpose(in_array):
                     3  6
                     '' 7
     """
-    max_length = longest_row_number(in_array)
-    new_array = []
-    for i in range(0, max_length):
-        row_data = []
-        for row in in_array:
-            if i < len(row):
-                row_data.append(row[i])
-            else:
-                row_data.append(constants.DEFAULT_NA)
-        new_array.append(row_data)
+    return [
+        list(column)
+        for column in zip_longest(*in_array, fillvalue=constants.DEFAULT_NA)
+    ]
+
+
+def transpose_uniform(array, width, block_size=TRANSPOSE_BLOCK_SIZE):
+    """Transpose an MxN array a block of rows at a time
+
+    The rows are dropped from the given list once they are copied,
+    so that the cells are not held twice when nothing else refers to
+    the rows. The list is empty afterwards.
+
+    :param list array: a list of arrays of the same length
+    :param int width: the length of the arrays
+    :param int block_size: the rows transposed at a time
+    """
+    new_array = [[] for _ in range(width)]
+    for start in range(0, len(array), block_size):
+        end = start + block_size
+        block = array[start:end]
+        array[start:end] = repeat(None, len(block))
+        for new_row, cells in zip(new_array, zip(*block)):
+            new_row.extend(cells)
+    del array[:]
     return new_array
 
 
-def _add(name, left, right):
-    from pyexcel.book import Book, local_uuid
+def _add(left, right):
+    from pyexcel.book import Book, local_uuid, share_sheet, share_book_sheet
 
     content = {}
-    content[name] = left
+    content[left.name] = share_sheet(left, left.name)
     if isinstance(right, Book):
-        right_in_dict = copy.deepcopy(right.to_dict())
-        for key in right_in_dict.keys():
-            new_key = key
-            if len(right_in_dict.keys()) == 1:
+        for sheet in right:
+            new_key = sheet.name
+            if right.number_of_sheets() == 1:
                 new_key = right.filename
             if new_key in content:
                 uid = local_uuid()
-                new_key = "%s_%s" % (key, uid)
-            content[new_key] = right_in_dict[key]
+                new_key = "%s_%s" % (sheet.name, uid)
+            content[new_key] = share_book_sheet(sheet, new_key)
     elif isinstance(right, Matrix):
         new_key = right.name
         if new_key in content:
             uid = local_uuid()
             new_key = "%s_%s" % (right.name, uid)
-        content[new_key] = copy.deepcopy(right.get_internal_array())
+        content[new_key] = share_sheet(right, new_key)
     else:
         raise TypeError
     new_book = Book()
@@ -87,12 +87,15 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         """
         new_indices = []
         if compact.is_array_type(indices, str):
-            new_indices = utils.names_to_indices(indices, self._ref.rownames)
+            new_indices = utils.names_to_indices(
+                indices, self._ref.row_index_of
+            )
         else:
             new_indices = indices
+        kept = set(new_indices)
         to_remove = []
         for index in self._ref.row_range():
-            if index not in new_indices:
+            if index not in kept:
                 to_remove.append(index)
         self._ref.filter(row_indices=to_remove)
 
@@ -140,7 +143,9 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         if compact.is_string(type(locator)):
             self._ref.delete_named_row_at(locator)
         elif compact.is_tuple_consists_of_strings(locator):
-            indices = utils.names_to_indices(list(locator), self._ref.rownames)
+            indices = utils.names_to_indices(
+                list(locator), self._ref.row_index_of
+            )
             self._ref.delete_rows(indices)
         elif isinstance(locator, slice):
             my_range = utils.analyse_slice(locator, self._ref.number_of_rows())
@@ -160,13 +165,15 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         """
         Refer to sheet.row.name
         """
-        the_attr = attr
-        if attr not in self._ref.rownames:
-            the_attr = the_attr.replace("_", " ")
-            if the_attr not in self._ref.rownames:
+        try:
+            index = self._ref.row_index_of(attr)
+        except ValueError:
+            try:
+                index = self._ref.row_index_of(attr.replace("_", " "))
+            except ValueError:
                 raise AttributeError("%s is not found" % attr)
 
-        return self._ref.named_row_at(the_attr)
+        return self._ref.row_at(index)
 
     def _delete_rows_by_content(self, locator):
         to_remove = []
@@ -247,14 +254,15 @@ class Row(utils.CommonPropertyAmongRowNColumn):
     def _handle_one_formatter(self, rows, theformatter):
         new_indices = rows
         if len(self._ref.rownames) > 0:
-            new_indices = utils.names_to_indices(rows, self._ref.rownames)
+            new_indices = utils.names_to_indices(rows, self._ref.row_index_of)
 
         converter = utils.CommonPropertyAmongRowNColumn.get_converter(
             theformatter
         )
         if isinstance(new_indices, list):
+            selected = set(new_indices)
             for rindex in self._ref.row_range():
-                if rindex in new_indices:
+                if rindex in selected:
                     for column in self._ref.column_range():
                         value = self._ref.cell_value(rindex, column)
                         value = converter(value)
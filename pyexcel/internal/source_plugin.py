@@ -4,12 +4,20 @@
 
     Second level abstraction
 
+    The source chosen for a signature function call depends only on the
+    action, the keywords which are given, the file type and the library
+    asked for, hence it is remembered by those until another source, a
+    parser or a renderer is registered.
+
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
 from pyexcel import constants as constants
 from pyexcel import exceptions as exceptions
 from lml.plugin import PluginManager
+from pyexcel._compact import is_string
+from pyexcel.plugins import find_file_type_from_file_name
+from pyexcel.internal.plugins import PARSER, RENDERER
 from pyexcel.internal.attributes import (
     register_book_attribute,
     register_sheet_attribute,
@@ -26,15 +34,33 @@ class SourcePluginManager(PluginManager):
     """Data source plugin loader"""
 
     def __init__(self):
+        self._resolutions = {}
+        self._generations = None
         PluginManager.__init__(self, "source")
         self.keywords = {}
 
     def load_me_later(self, plugin_info):
         PluginManager.load_me_later(self, plugin_info)
+        self._resolutions.clear()
         self._register_a_plugin_info(plugin_info)
 
     def load_me_now(self, key, action=None, library=None, **keywords):
         """get source module into memory for use"""
+        resolution = _resolution_key(key, action, library, keywords)
+        if resolution is None:
+            return self._find_a_source(key, action, library, **keywords)
+
+        generations = (PARSER.generation, RENDERER.generation)
+        if generations != self._generations:
+            self._resolutions.clear()
+            self._generations = generations
+        plugin = self._resolutions.get(resolution)
+        if plugin is None:
+            plugin = self._find_a_source(key, action, library, **keywords)
+            self._resolutions[resolution] = plugin
+        return plugin
+
+    def _find_a_source(self, key, action, library, **keywords):
         self._logger.debug("load me now:" + key)
         plugin = None
         for source in self.registry[key]:
@@ -55,6 +81,7 @@ class SourcePluginManager(PluginManager):
     def register_a_plugin(self, plugin_cls, plugin_info):
         """ for dynamically loaded plugin """
         PluginManager.register_a_plugin(self, plugin_cls, plugin_info)
+        self._resolutions.clear()
         self._register_a_plugin_info(plugin_info)
 
     def get_a_plugin(
@@ -131,6 +158,34 @@ class SourcePluginManager(PluginManager):
             self._logger.debug(debug_registry)
 
 
+def _resolution_key(key, action, library, keywords):
+    """What the choice of a source depends on
+
+    :returns: a hashable key, or None if the choice cannot be remembered,
+              e.g. the file name is not a string or has no known file type
+    """
+    fields = frozenset(
+        field for field, value in keywords.items() if value is not None
+    )
+    file_name = keywords.get("file_name")
+    if file_name:
+        file_type = keywords.get("force_file_type")
+        if file_type is None:
+            if not is_string(type(file_name)):
+                return None
+            try:
+                file_type = find_file_type_from_file_name(file_name, action)
+            except exceptions.FileTypeNotSupported:
+                return None
+    else:
+        file_type = keywords.get("file_type")
+    if is_string(type(file_type)):
+        file_type = file_type.lower()
+    elif file_type is not None:
+        return None
+    return (key, action, fields, file_type, library)
+
+
 def _error_handler(action, **keywords):
     if keywords:
         file_type = keywords.get("file_type", None)
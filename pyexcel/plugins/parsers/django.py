@@ -4,10 +4,15 @@
 
     Export data into database datables
 
+    With a batch_size, the objects of a model are fetched by
+    iterator(chunk_size=batch_size) and none of them is cached.
+
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
 from pyexcel.parser import DbParser
+from pyexcel._compact import OrderedDict
+from pyexcel.internal import paging
 
 from pyexcel_io import get_data, iget_data
 from pyexcel_io.database import common as django
@@ -17,12 +22,33 @@ class DjangoExporter(DbParser):
     """Export data from django model"""
 
     def parse_db(
-        self, argument, export_columns_list=None, on_demand=True, **keywords
+        self,
+        argument,
+        export_columns_list=None,
+        on_demand=True,
+        batch_size=None,
+        **keywords
     ):
         models = argument
         exporter = django.DjangoModelExporter()
         if export_columns_list is None:
             export_columns_list = [None] * len(models)
+        if batch_size is not None:
+            sheets = OrderedDict()
+            for model, export_columns in zip(models, export_columns_list):
+                adapter = django.DjangoModelExportAdapter(
+                    model, export_columns
+                )
+                column_names = export_columns
+                if not column_names:
+                    column_names = sorted(
+                        field.attname for field in model._meta.concrete_fields
+                    )
+                rows = paging.paged(model.objects.all(), batch_size)
+                sheets[adapter.get_name()] = paging.read_query_sets(
+                    rows, column_names, on_demand=on_demand, **keywords
+                )
+            return sheets
         for model, export_columns in zip(models, export_columns_list):
             adapter = django.DjangoModelExportAdapter(model, export_columns)
             exporter.append(adapter)
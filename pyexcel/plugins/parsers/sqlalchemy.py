@@ -4,10 +4,15 @@
 
     Export data into database datables
 
+    With a batch_size, a table is read batch_size rows at a time by
+    yield_per, instead of by one query of all its objects.
+
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
 from pyexcel.parser import DbParser
+from pyexcel._compact import OrderedDict
+from pyexcel.internal import paging
 
 from pyexcel_io import get_data, iget_data
 from pyexcel_io.database import common as sql
@@ -17,12 +22,28 @@ class SQLAlchemyExporter(DbParser):
     """export data via sqlalchmey"""
 
     def parse_db(
-        self, argument, export_columns_list=None, on_demand=False, **keywords
+        self,
+        argument,
+        export_columns_list=None,
+        on_demand=False,
+        batch_size=None,
+        **keywords
     ):
         session, tables = argument
         exporter = sql.SQLTableExporter(session)
         if export_columns_list is None:
             export_columns_list = [None] * len(tables)
+        if batch_size is not None:
+            sheets = OrderedDict()
+            for table, export_columns in zip(tables, export_columns_list):
+                adapter = sql.SQLTableExportAdapter(table, export_columns)
+                column_names, rows = paging.table_rows(
+                    session, table, export_columns, batch_size
+                )
+                sheets[adapter.get_name()] = paging.read_query_sets(
+                    rows, column_names, on_demand=on_demand, **keywords
+                )
+            return sheets
         for table, export_columns in zip(tables, export_columns_list):
             adapter = sql.SQLTableExportAdapter(table, export_columns)
             exporter.append(adapter)
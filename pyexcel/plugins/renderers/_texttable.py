@@ -5,52 +5,176 @@
     Export data into texttable format. It also serves the default
     presentation of pyexcel sheet and book.
 
+    The table is drawn here the way texttable draws it without a
+    maximum width, from the text of the cells, so that no table
+    object holds a copy of them.
+
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
-from types import GeneratorType
+import unicodedata
 
-from pyexcel import constants as constants
-from texttable import Texttable
 from pyexcel.renderer import Renderer
-from pyexcel.internal.sheets.formatters import to_format
+from pyexcel.internal.preview import shape, cleanse, preview
+
+try:
+    from wcwidth import wcwidth
+except ImportError:
+    wcwidth = None
+
+HORIZONTAL = "-"
+HEADER_HORIZONTAL = "="
+# the whitespace which texttable's wrapping turns into spaces
+WHITESPACE = dict.fromkeys(map(ord, "\x0b\x0c\r"), " ")
 
 
 class TextTableRenderer(Renderer):
     """Default texttable presetation"""
 
-    def render_sheet(self, sheet):
-        content = render_text_table(sheet, self._write_title)
+    def render_sheet(self, sheet, max_rows=None, max_columns=None):
+        content = render_text_table(
+            sheet, self._write_title, max_rows, max_columns
+        )
         self._stream.write(content)
 
+    def render_book(self, book, max_rows=None, max_columns=None):
+        number_of_sheets = book.number_of_sheets() - 1
+        for index, sheet in enumerate(book):
+            self.render_sheet(sheet, max_rows, max_columns)
+            if index < number_of_sheets:
+                self._stream.write("\n")
 
-def render_text_table(sheet, write_title):
-    """return data in text table presentation"""
+
+def render_text_table(sheet, write_title, max_rows=None, max_columns=None):
+    """return data in text table presentation
+
+    With max_rows or max_columns, only the head and the tail of the
+    sheet are read and its dimensions are written below the table.
+    """
     content = ""
     if write_title:
         content += "%s:\n" % sheet.name
-    table = Texttable(max_width=0)
-    data = sheet.to_array()
-    if isinstance(data, GeneratorType):
-        data = list(data)
-    if len(data) == 0:
-        return content
-    table.set_cols_dtype(["t"] * len(data[0]))
-    if len(sheet.colnames) > 0:
-        table.set_chars(["-", "|", "+", "="])
-        table.header(list(_cleanse_a_row(data[0])))
+    truncated = False
+    if hasattr(sheet, "rownames"):
+        header, rows, truncated = preview(sheet, max_rows, max_columns)
     else:
-        table.add_row(list(_cleanse_a_row(data[0])))
-    for sub_array in data[1:]:
-        new_array = _cleanse_a_row(sub_array)
-        table.add_row(list(new_array))
-    content += table.draw()
+        # a sheet stream, whose rows can only be read once
+        header = None
+        rows = sheet.to_array()
+        if len(sheet.colnames) > 0:
+            rows = iter(rows)
+            header = next(rows, None)
+    if header is not None:
+        header = list(cleanse(header))
+    rows = [list(cleanse(row)) for row in rows]
+    if header is None and len(rows) == 0:
+        return content
+    content += draw_table(rows, header)
+    if truncated:
+        content += "\n" + shape(sheet)
     return content
 
 
-def _cleanse_a_row(row):
-    for item in row:
-        if item == constants.DEFAULT_NA:
-            yield " "
-        else:
-            yield to_format(str, item)
+def draw_table(rows, header=None):
+    """Draw the rows of text, and the header if any, in a bordered table
+
+    A header is centered and underlined by '='. Every row is followed
+    by a line of '-'.
+    """
+    widths = []
+    for row in ([header] if header else []) + rows:
+        for index, text in enumerate(row):
+            width = _cell_width(text)
+            if index < len(widths):
+                if width > widths[index]:
+                    widths[index] = width
+            else:
+                widths.append(width)
+    if len(widths) == 0:
+        return ""
+    hline = _hline(widths, HORIZONTAL)
+    lines = [hline]
+    if header:
+        lines.extend(_draw_row(header, widths, centered=True))
+        lines.append(_hline(widths, HEADER_HORIZONTAL))
+    for row in rows:
+        lines.extend(_draw_row(row, widths))
+        lines.append(hline)
+    if not rows:
+        lines.append(hline)
+    return "\n".join(lines)
+
+
+def _draw_row(row, widths, centered=False):
+    if not any("\n" in text for text in row):
+        yield "| %s |" % " | ".join(
+            _fill(_cell_line(text), width, centered)
+            for text, width in zip(row, widths)
+        )
+        return
+    cells = [list(map(_cell_line, text.split("\n"))) for text in row]
+    for line_index in range(max(map(len, cells))):
+        texts = []
+        for cell, width in zip(cells, widths):
+            text = ""
+            if line_index < len(cell):
+                text = cell[line_index]
+            texts.append(_fill(text, width, centered))
+        yield "| %s |" % " | ".join(texts)
+
+
+def _fill(text, width, centered):
+    fill = width - _text_width(text)
+    if centered:
+        left = fill // 2
+        return " " * left + text + " " * (fill - left)
+    return text + " " * fill
+
+
+def _cell_width(text):
+    if _is_plain(text):
+        return len(text)
+    return max(
+        _text_width(line.expandtabs().translate(WHITESPACE))
+        for line in text.split("\n")
+    )
+
+
+def _cell_line(line):
+    if _is_plain(line):
+        return line.rstrip(" ")
+    if line.strip() == "":
+        return ""
+    return line.expandtabs().translate(WHITESPACE).rstrip(" ")
+
+
+def _hline(widths, horizontal):
+    return "+%s+" % "+".join(horizontal * (width + 2) for width in widths)
+
+
+def _is_plain(text):
+    """Whether the text is of printable ascii characters only"""
+    if not text.isprintable():
+        return False
+    # str.isascii is not there before python 3.7
+    try:
+        text.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _text_width(text):
+    if _is_plain(text):
+        return len(text)
+    return sum(_char_width(char) for char in text)
+
+
+def _char_width(char):
+    if wcwidth is not None:
+        return max(0, wcwidth(char))
+    if unicodedata.east_asian_width(char) in "WF":
+        return 2
+    if unicodedata.combining(char):
+        return 0
+    return 1
@@ -4,22 +4,50 @@
 
     Export data into database datables
 
+    With a batch_size, the rows are read, inserted and committed that
+    many at a time, so that a large sheet or a sheet stream is loaded
+    without being held in memory.
+
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
+from itertools import islice
+
+from pyexcel import constants as constants
+from pyexcel import instrumentation as instrumentation
 from pyexcel._compact import OrderedDict
+from pyexcel.exceptions import NoMatchingTable
 from pyexcel.internal import common as common
 from pyexcel.renderer import DbRenderer
 
 from pyexcel_io import save_data
+from pyexcel_io.utils import is_empty_array, swap_empty_string_for_none
 from pyexcel_io.database import common as sql
 
+try:
+    # it lives in a private module of pyexcel-io, which may move it
+    from pyexcel_io.database.importers.sqlalchemy import (
+        PyexcelSQLSkipRowException,
+    )
+except ImportError:
+
+    class PyexcelSQLSkipRowException(Exception):
+        """Raised by a row initializer to skip its row"""
+
+        pass
+
 
 class SQLAlchemyRenderer(DbRenderer):
     """Import data into database"""
 
     def render_sheet_to_stream(
-        self, file_stream, sheet, init=None, mapdict=None, **keywords
+        self,
+        file_stream,
+        sheet,
+        init=None,
+        mapdict=None,
+        batch_size=None,
+        **keywords
     ):
         headers = common.get_sheet_headers(sheet)
         importer = sql.SQLTableImporter(file_stream[0])
@@ -27,6 +55,15 @@ class SQLAlchemyRenderer(DbRenderer):
         adapter.column_names = headers
         adapter.row_initializer = init
         adapter.column_name_mapping_dict = mapdict
+        if batch_size is not None:
+            bulk_insert(
+                importer.session,
+                adapter,
+                _data_rows(sheet),
+                batch_size,
+                auto_commit=keywords.get("auto_commit", True),
+            )
+            return
         importer.append(adapter)
         save_data(
             importer,
@@ -36,7 +73,13 @@ class SQLAlchemyRenderer(DbRenderer):
         )
 
     def render_book_to_stream(
-        self, file_stream, book, inits=None, mapdicts=None, **keywords
+        self,
+        file_stream,
+        book,
+        inits=None,
+        mapdicts=None,
+        batch_size=None,
+        **keywords
     ):
         session, tables = file_stream
         thebook = book
@@ -55,9 +98,89 @@ class SQLAlchemyRenderer(DbRenderer):
             adapter.column_name_mapping_dict = each_table[2]
             adapter.row_initializer = each_table[3]
             importer.append(adapter)
+        if batch_size is not None:
+            for sheet in thebook:
+                adapter = importer.get(sheet.name)
+                if adapter is None:
+                    raise NoMatchingTable(
+                        constants.MESSAGE_NO_MATCHING_TABLE % sheet.name
+                    )
+                bulk_insert(
+                    session,
+                    adapter,
+                    _data_rows(sheet),
+                    batch_size,
+                    auto_commit=keywords.get("auto_commit", True),
+                )
+            return
         to_store = OrderedDict()
         for sheet in thebook:
             # due book.to_dict() brings in column_names
             # which corrupts the data
             to_store[sheet.name] = sheet.get_internal_array()
         save_data(importer, to_store, file_type=self._file_type, **keywords)
+
+
+def bulk_insert(session, adapter, rows, batch_size, auto_commit=True):
+    """Insert the rows into the table of the adapter in batches
+
+    Without a row initializer, a batch is inserted by one executemany
+    statement. Otherwise the objects made by the initializer are added
+    and flushed a batch at a time. With auto_commit, each batch is
+    committed, and a failed batch is rolled back while the batches
+    before it stay in the table.
+
+    Each batch is an instrumentation stage ('save_to_database',
+    'insert'), whose events tell the rows and the time taken.
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if len(batch) == 0:
+            break
+        with instrumentation.stage("save_to_database", "insert") as stage:
+            stage.count(batch)
+            try:
+                _insert_batch(session, adapter, batch)
+                if auto_commit:
+                    session.commit()
+            except Exception:
+                if auto_commit:
+                    session.rollback()
+                raise
+
+
+def _insert_batch(session, adapter, batch):
+    column_names = adapter.column_names
+    indices = adapter.column_name_mapping_dict
+    records = []
+    for row in batch:
+        if is_empty_array(row):
+            continue
+        row = swap_empty_string_for_none(row)
+        if indices:
+            row = [row[index] for index in indices if index < len(row)]
+        records.append(dict(zip(column_names, row)))
+    if adapter.row_initializer is None:
+        session.bulk_insert_mappings(adapter.table, records)
+        return
+    objects = []
+    for record in records:
+        try:
+            an_object = adapter.row_initializer(record)
+        except PyexcelSQLSkipRowException:
+            continue
+        if an_object is None:
+            an_object = adapter.table()
+            for name in column_names:
+                setattr(an_object, name, record.get(name))
+        objects.append(an_object)
+    session.add_all(objects)
+    session.flush()
+
+
+def _data_rows(sheet):
+    # the header of a sheet stream has been read by get_sheet_headers
+    if hasattr(sheet, "payload"):
+        return sheet.payload
+    return sheet.rows()
@@ -9,6 +9,7 @@
 """
 import os
 
+from pyexcel import cache as cache
 from pyexcel.source import AbstractSource
 from pyexcel.internal import PARSER
 
@@ -17,8 +18,16 @@ from pyexcel.internal import PARSER
 class ReadExcelFromFile(AbstractSource):
     """Pick up 'file_name' field and do single sheet based read and write"""
 
-    def __init__(self, file_name=None, parser_library=None, **keywords):
+    def __init__(
+        self,
+        file_name=None,
+        parser_library=None,
+        cache_dir=None,
+        cache_size=None,
+        **keywords
+    ):
         self.__file_name = file_name
+        self.__cache = cache.get_cache(cache_dir, cache_size)
 
         if "force_file_type" in keywords:
             file_type = keywords.get("force_file_type")
@@ -34,6 +43,13 @@ class ReadExcelFromFile(AbstractSource):
     def get_data(self):
         """
         Return a dictionary with only one key and one value
+
+        With a cache directory, the file is parsed only if it is not in
+        the cache
         """
+        if self.__cache is not None:
+            return self.__cache.parse_file(
+                self.__parser, self.__file_name, **self._keywords
+            )
         sheets = self.__parser.parse_file(self.__file_name, **self._keywords)
         return sheets
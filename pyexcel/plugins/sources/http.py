@@ -4,13 +4,24 @@
 
     Representation of http sources
 
+    The connection to a host is kept alive for the next url of the
+    same host. With url_cache, a folder, the responses are saved with
+    their ETag and Last-Modified headers and asked for again by
+    conditional GETs. With url_stream=True, a csv or tsv response is
+    parsed while it is being downloaded rather than after. The response
+    is closed once it is parsed, or by free_resources when its rows are
+    read on demand.
+
     :copyright: (c) 2015-2020 by Onni Software Ltd.
     :license: New BSD License
 """
+import io
+
 from pyexcel import constants as constants
 from pyexcel.source import AbstractSource
-from pyexcel._compact import PY2, request
-from pyexcel.internal import PARSER
+from pyexcel._compact import PY2
+from pyexcel.internal import PARSER, connections
+from pyexcel.internal import garbagecollector as gc
 
 from . import params
 
@@ -25,6 +36,7 @@ FILE_TYPE_MIME_TABLE = {
     "application/vnd.ms-excel.sheet.macroenabled.12": "xlsm",
     "text/html": "html",
 }
+STREAMABLE_FILE_TYPES = ("csv", "tsv")
 
 
 # pylint: disable=W0223
@@ -39,12 +51,41 @@ class HttpSource(AbstractSource):
     attributes = [params.URL]
     key = params.URL
 
-    def __init__(self, url=None, **keywords):
+    def __init__(self, url=None, url_stream=False, url_cache=None, **keywords):
         self.__url = url
+        self.__stream = url_stream
+        self.__cache = url_cache
         AbstractSource.__init__(self, **keywords)
 
     def get_data(self):
-        connection = request.urlopen(self.__url)
+        cache = None
+        if self.__cache:
+            cache = connections.ResponseCache(self.__cache)
+        connection = connections.urlopen(self.__url, cache=cache)
+        # rows streamed on demand are read after get_data returns
+        on_demand = False
+        try:
+            file_type = self.__get_file_type(connection)
+            parser_library = self._keywords.get("parser_library", None)
+            aparser = PARSER.get_a_plugin(file_type, parser_library)
+            if self.__stream and file_type in STREAMABLE_FILE_TYPES:
+                encoding = self._keywords.get("encoding", "utf-8")
+                sheets = aparser.parse_file_stream(
+                    _TextStream(connection, encoding), **self._keywords
+                )
+                on_demand = self._keywords.get("on_demand", False)
+                if on_demand:
+                    gc.append(connection)
+            else:
+                content = connection.read()
+                connection.close()
+                sheets = aparser.parse_file_content(content, **self._keywords)
+        finally:
+            if not on_demand:
+                connection.close()
+        return sheets
+
+    def __get_file_type(self, connection):
         info = connection.info()
         if PY2:
             mime_type = info.type
@@ -53,16 +94,31 @@ class HttpSource(AbstractSource):
         file_type = FILE_TYPE_MIME_TABLE.get(mime_type, None)
         if file_type is None:
             file_type = _get_file_type_from_url(self.__url)
-        parser_library = self._keywords.get("parser_library", None)
-        aparser = PARSER.get_a_plugin(file_type, parser_library)
-        content = connection.read()
-        sheets = aparser.parse_file_content(content, **self._keywords)
-        return sheets
+        return file_type
 
     def get_source_info(self):
         return self.__url, None
 
 
+class _TextStream(object):
+    """The lines of a response, decoded as the csv reader asks for them
+
+    It cannot seek, hence the reader does not rewind it
+    """
+
+    def __init__(self, response, encoding):
+        self.__text = io.TextIOWrapper(response, encoding=encoding, newline="")
+
+    def read(self, size=-1):
+        return self.__text.read(size)
+
+    def __iter__(self):
+        return iter(self.__text)
+
+    def close(self):
+        self.__text.close()
+
+
 def _get_file_type_from_url(url):
     extension = url.split(".")
     return extension[-1]
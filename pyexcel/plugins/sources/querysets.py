@@ -9,9 +9,8 @@
 """
 from pyexcel import constants as constants
 from pyexcel.source import AbstractSource
+from pyexcel.internal import paging
 
-from pyexcel_io import get_data
-from pyexcel_io.constants import DB_QUERYSET
 from . import params
 
 
@@ -20,7 +19,8 @@ class SheetQuerySetSource(AbstractSource):
     """
     Database query set as data source
 
-    SQLAlchemy and Django query sets are supported
+    SQLAlchemy and Django query sets are supported. With a batch_size,
+    a query is fetched that many rows at a time rather than at once
     """
 
     fields = [params.COLUMN_NAMES, params.QUERY_SETS]
@@ -40,6 +40,7 @@ class SheetQuerySetSource(AbstractSource):
         column_limit=None,
         skip_row_func=None,
         skip_column_func=None,
+        batch_size=None,
         **keywords
     ):
         self.__sheet_name = sheet_name
@@ -51,6 +52,7 @@ class SheetQuerySetSource(AbstractSource):
         self.__start_row = start_row
         self.__row_limit = row_limit
         self.__skip_row_func = skip_row_func
+        self.__batch_size = batch_size
 
         if start_column is None:
             print("start_column is ignored")
@@ -69,10 +71,13 @@ class SheetQuerySetSource(AbstractSource):
         if self.__skip_row_func is not None:
             local_params["skip_row_func"] = self.__skip_row_func
 
-        data = get_data(
-            self.__query_sets,
-            file_type=DB_QUERYSET,
-            column_names=self.__column_names,
+        query_sets = self.__query_sets
+        if self.__batch_size is not None:
+            query_sets = paging.paged(query_sets, self.__batch_size)
+        rows = paging.read_query_sets(
+            query_sets,
+            self.__column_names,
+            on_demand=self._keywords.get("on_demand", False),
             **local_params
         )
-        return data
+        return {constants.DEFAULT_SHEET_NAME: rows}
@@ -11,7 +11,9 @@ from collections import defaultdict
 
 from pyexcel import _compact as compact
 from pyexcel import constants as constants
+from pyexcel import instrumentation as instrumentation
 from pyexcel._compact import OrderedDict
+from pyexcel.internal import interop
 from pyexcel.internal.sheets.row import Row as NamedRow
 from pyexcel.internal.sheets.column import Column as NamedColumn
 from pyexcel.internal.sheets.matrix import Matrix
@@ -70,6 +72,7 @@ class Sheet(Matrix):
         rownames=None,
         transpose_before=False,
         transpose_after=False,
+        storage=constants.ROW_STORAGE,
     ):
         """Constructor
 
@@ -79,9 +82,13 @@ class Sheet(Matrix):
         :param name_rows_by_column: use a column to name all rows
         :param colnames: use an external list of strings to name the columns
         :param rownames: use an external list of strings to name the rows
+        :param storage: 'row' keeps a list of rows. 'columnar' keeps typed
+                        columns, which saves memory for numeric data
         """
         self.__column_names = []
         self.__row_names = []
+        self.__column_positions = _NamePositions()
+        self.__row_positions = _NamePositions()
         self.__row_index = -1
         self.__column_index = -1
         self.init(
@@ -93,6 +100,7 @@ class Sheet(Matrix):
             rownames=rownames,
             transpose_before=transpose_before,
             transpose_after=transpose_after,
+            storage=storage,
         )
 
     def init(
@@ -105,6 +113,7 @@ class Sheet(Matrix):
         rownames=None,
         transpose_before=False,
         transpose_after=False,
+        storage=constants.ROW_STORAGE,
     ):
         """custom initialization functions
 
@@ -138,14 +147,29 @@ class Sheet(Matrix):
         # this get rid of phatom data by not specifying sheet
         if sheet is None:
             sheet = []
-        Matrix.__init__(self, sheet)
+        with instrumentation.stage("sheet", "uniform") as stage:
+            Matrix.__init__(self, sheet, storage=storage)
+            stage.count(self)
         self.name = name
         self.__column_names = []
         self.__row_names = []
+        self.__column_positions = _NamePositions()
+        self.__row_positions = _NamePositions()
         if transpose_before:
             self.transpose()
         self.row = NamedRow(self)
         self.column = NamedColumn(self)
+        with instrumentation.stage("sheet", "name_series") as stage:
+            self.__name_series(
+                name_columns_by_row, name_rows_by_column, colnames, rownames
+            )
+            stage.count(self)
+        if transpose_after:
+            self.transpose()
+
+    def __name_series(
+        self, name_columns_by_row, name_rows_by_column, colnames, rownames
+    ):
         if name_columns_by_row != -1:
             if colnames:
                 raise NotImplementedError(constants.MESSAGE_NOT_IMPLEMENTED_02)
@@ -160,17 +184,18 @@ class Sheet(Matrix):
         else:
             if rownames:
                 self.__row_names = rownames
-        if transpose_after:
-            self.transpose()
 
     def clone(self):
-        import copy
+        """A copy of the sheet, sharing the data until either changes
 
-        new_sheet = Sheet(
-            copy.deepcopy(self.get_internal_array()),
-            name_columns_by_row=self.__row_index,
-            name_rows_by_column=self.__column_index,
-        )
+        The names of the columns and the rows are copied
+        """
+        new_sheet = Sheet(name=self.name)
+        new_sheet._borrow(self)
+        new_sheet.__column_names = list(self.__column_names)
+        new_sheet.__row_names = list(self.__row_names)
+        new_sheet.__row_index = self.__row_index
+        new_sheet.__column_index = self.__column_index
         return new_sheet
 
     def transpose(self):
@@ -178,6 +203,10 @@ class Sheet(Matrix):
             self.__row_names,
             self.__column_names,
         )
+        self.__column_positions, self.__row_positions = (
+            self.__row_positions,
+            self.__column_positions,
+        )
         Matrix.transpose(self)
 
     def name_columns_by_row(self, row_index):
@@ -188,6 +217,7 @@ class Sheet(Matrix):
         """
         self.__row_index = row_index
         self.__column_names = make_names_unique(self.row_at(row_index))
+        self.__column_positions = _NamePositions()
         del self.row[row_index]
 
     def name_rows_by_column(self, column_index):
@@ -198,6 +228,7 @@ class Sheet(Matrix):
         """
         self.__column_index = column_index
         self.__row_names = make_names_unique(self.column_at(column_index))
+        self.__row_positions = _NamePositions()
         del self.column[column_index]
 
     def group_rows_by_column(self, column_index_or_name):
@@ -278,6 +309,24 @@ class Sheet(Matrix):
     def colnames(self, value):
         """Set column names"""
         self.__column_names = make_names_unique(value)
+        self.__column_positions = _NamePositions()
+
+    def column_index_of(self, name):
+        """Find the index of a named column
+
+        The indices are kept in a dictionary, hence a look up does
+        not scan the column names.
+
+        :raises ValueError: if no column has the name
+        """
+        return _index_of(name, self.__column_names, self.__column_positions)
+
+    def row_index_of(self, name):
+        """Find the index of a named row
+
+        :raises ValueError: if no row has the name
+        """
+        return _index_of(name, self.__row_names, self.__row_positions)
 
     @property
     def rownames(self):
@@ -288,12 +337,13 @@ class Sheet(Matrix):
     def rownames(self, value):
         """Set row names"""
         self.__row_names = make_names_unique(value)
+        self.__row_positions = _NamePositions()
 
     def named_column_at(self, name):
         """Get a column by its name"""
         index = name
         if compact.is_string(type(index)):
-            index = self.colnames.index(name)
+            index = self.column_index_of(name)
         column_array = self.column_at(index)
         return column_array
 
@@ -306,7 +356,7 @@ class Sheet(Matrix):
         """
         index = name
         if compact.is_string(type(index)):
-            index = self.colnames.index(name)
+            index = self.column_index_of(name)
         self.set_column_at(index, column_array)
 
     def delete_columns(self, column_indices):
@@ -316,12 +366,14 @@ class Sheet(Matrix):
         """
         Matrix.delete_columns(self, column_indices)
         if len(self.__column_names) > 0:
+            deleted = set(column_indices)
             new_series = [
                 self.__column_names[i]
                 for i in range(0, len(self.__column_names))
-                if i not in column_indices
+                if i not in deleted
             ]
             self.__column_names = new_series
+            self.__column_positions = _NamePositions()
 
     def delete_rows(self, row_indices):
         """Delete one or more rows
@@ -330,12 +382,14 @@ class Sheet(Matrix):
         """
         Matrix.delete_rows(self, row_indices)
         if len(self.__row_names) > 0:
+            deleted = set(row_indices)
             new_series = [
                 self.__row_names[i]
                 for i in range(0, len(self.__row_names))
-                if i not in row_indices
+                if i not in deleted
             ]
             self.__row_names = new_series
+            self.__row_positions = _NamePositions()
 
     def delete_named_column_at(self, name):
         """Works only after you named columns by a row
@@ -349,14 +403,14 @@ class Sheet(Matrix):
                 self.rownames.pop(name)
             self.delete_columns([name])
         else:
-            index = self.colnames.index(name)
+            index = self.column_index_of(name)
             self.colnames.pop(index)
+            self.__column_positions = _NamePositions()
             Matrix.delete_columns(self, [index])
 
     def named_row_at(self, name):
         """Get a row by its name """
-        index = name
-        index = self.rownames.index(name)
+        index = self.row_index_of(name)
         row_array = self.row_at(index)
         return row_array
 
@@ -369,7 +423,7 @@ class Sheet(Matrix):
         """
         index = name
         if compact.is_string(type(index)):
-            index = self.rownames.index(name)
+            index = self.row_index_of(name)
         self.set_row_at(index, row_array)
 
     def delete_named_row_at(self, name):
@@ -383,8 +437,9 @@ class Sheet(Matrix):
                 self.rownames.pop(name)
             self.delete_rows([name])
         else:
-            index = self.rownames.index(name)
+            index = self.row_index_of(name)
             self.rownames.pop(index)
+            self.__row_positions = _NamePositions()
             Matrix.delete_rows(self, [index])
 
     def extend_rows(self, rows):
@@ -396,7 +451,8 @@ class Sheet(Matrix):
         if isinstance(rows, compact.OrderedDict):
             keys = rows.keys()
             for k in keys:
-                self.rownames.append(k)
+                self.__row_positions.setdefault(k, len(self.__row_names))
+                self.__row_names.append(k)
                 incoming_data.append(rows[k])
             Matrix.extend_rows(self, incoming_data)
         elif len(self.rownames) > 0:
@@ -406,6 +462,20 @@ class Sheet(Matrix):
         else:
             Matrix.extend_rows(self, rows)
 
+    def append_rows(self, rows):
+        """Append rows from any iterable, e.g. a generator
+
+        See :meth:`~pyexcel.internal.sheets.Matrix.append_rows`.
+        It cannot be used on a sheet with row names.
+
+        :param rows: an iterable of rows
+        """
+        if len(self.rownames) > 0:
+            raise TypeError(
+                constants.MESSAGE_DATA_ERROR_ORDEREDDICT_IS_EXPECTED
+            )
+        Matrix.append_rows(self, rows)
+
     def extend_columns_with_rows(self, rows):
         """Put rows on the right most side of the data"""
         if len(self.colnames) > 0:
@@ -422,7 +492,10 @@ class Sheet(Matrix):
         if isinstance(columns, compact.OrderedDict):
             keys = columns.keys()
             for k in keys:
-                self.colnames.append(k)
+                self.__column_positions.setdefault(
+                    k, len(self.__column_names)
+                )
+                self.__column_names.append(k)
                 incoming_data.append(columns[k])
             Matrix.extend_columns(self, incoming_data)
         elif len(self.colnames) > 0:
@@ -539,6 +612,150 @@ class Sheet(Matrix):
         array = get_array(adict=new_dict)
         return Sheet(array, name=self.name, name_columns_by_row=0)
 
+    def create_index(self, column_index_or_name, kind=constants.HASH_INDEX):
+        """Index the values of a column for :meth:`lookup`, :meth:`where`
+        and :meth:`join`
+
+        The index is made once and kept until the sheet changes.
+        These methods make the indexes they need, hence this is only
+        needed to make an index ahead of time.
+
+        :param column_index_or_name: the column index or name
+        :param str kind: 'hash' for equality look ups, or 'sorted'
+                         for range look ups too
+        """
+        index = column_index_or_name
+        if compact.is_string(type(index)):
+            index = self.column_index_of(index)
+        return Matrix.create_index(self, index, kind)
+
+    def lookup(self, column_index_or_name, value):
+        """Find the rows whose cell in the column equals the value
+
+        Example::
+
+           >>> sheet = Sheet(
+           ... [["id", "name"], [1, "a"], [2, "b"], [1, "c"]],
+           ... name_columns_by_row=0)
+           >>> sheet.lookup("id", 1)
+           [[1, 'a'], [1, 'c']]
+
+        :returns: a list of rows
+        """
+        index = self.create_index(column_index_or_name)
+        return [self.row_at(position) for position in index.find(value)]
+
+    def where(self, column_index_or_name, operator, value):
+        """Select the rows whose cell in the column compares with the value
+
+        Cells which are not comparable with the value, e.g. empty
+        cells with a number, match '!=' only.
+
+        :param column_index_or_name: the column index or name
+        :param str operator: one of '==', '!=', '<', '<=', '>' and '>='
+        :returns: a new sheet with the selected rows
+        """
+        if operator == "==":
+            index = self.create_index(column_index_or_name)
+            positions = index.find(value)
+        elif operator == "!=":
+            index = self.create_index(column_index_or_name)
+            equal = set(index.find(value))
+            positions = [
+                position
+                for position in self.row_range()
+                if position not in equal
+            ]
+        elif operator in constants.RANGE_OPERATORS:
+            index = self.create_index(
+                column_index_or_name, constants.SORTED_INDEX
+            )
+            positions = index.find(operator, value)
+        else:
+            raise ValueError(constants.MESSAGE_UNKNOWN_OPERATOR % operator)
+        sheet = Sheet(
+            [self.row_at(position) for position in positions],
+            name=self.name,
+            storage=self.storage,
+        )
+        if len(self.__column_names) > 0:
+            sheet.colnames = self.__column_names
+        if len(self.__row_names) > 0:
+            sheet.rownames = [self.__row_names[i] for i in positions]
+        return sheet
+
+    def join(self, other, on, other_on=None, how=constants.INNER_JOIN):
+        """Join the rows of another sheet by the values of a key column
+
+        The other sheet is hash indexed on its key column, then each
+        row of this sheet is joined with the rows of the other sheet
+        which have the same key. Empty keys are never joined. The key
+        column of the other sheet is left out of the result.
+
+        Example::
+
+           >>> people = Sheet(
+           ... [["id", "name"], [1, "Ann"], [2, "Bob"], [3, "Cat"]],
+           ... name_columns_by_row=0)
+           >>> ages = Sheet(
+           ... [["person", "age"], [2, 30], [1, 20]],
+           ... name_columns_by_row=0)
+           >>> people.join(ages, "id", "person")
+           pyexcel sheet:
+           +----+------+-----+
+           | id | name | age |
+           +====+======+=====+
+           | 1  | Ann  | 20  |
+           +----+------+-----+
+           | 2  | Bob  | 30  |
+           +----+------+-----+
+
+        :param other: the other sheet
+        :param on: the key column index or name in this sheet
+        :param other_on: the key column index or name in the other
+                         sheet. defaults to on
+        :param str how: 'inner' keeps the joined rows only. 'left'
+                        keeps all rows of this sheet, with empty cells
+                        where there is nothing to join
+        :returns: a new sheet
+        """
+        if how not in constants.JOINS:
+            raise ValueError(constants.MESSAGE_UNKNOWN_JOIN % how)
+        if other_on is None:
+            other_on = on
+        key = on
+        if compact.is_string(type(key)):
+            key = self.column_index_of(key)
+        other_key = other_on
+        if compact.is_string(type(other_on)):
+            other_key = other.column_index_of(other_on)
+        elif other_key < 0:
+            other_key = other_key + other.number_of_columns()
+        positions = other.create_index(other_key).positions
+        kept = [
+            column
+            for column in other.column_range()
+            if column != other_key
+        ]
+        empty = [constants.DEFAULT_NA] * len(kept)
+        rows = []
+        for row in self.rows():
+            value = row[key]
+            if value != constants.DEFAULT_NA and value in positions:
+                for position in positions[value]:
+                    other_row = other.row_at(position)
+                    rows.append(
+                        list(row) + [other_row[column] for column in kept]
+                    )
+            elif how == constants.LEFT_JOIN:
+                rows.append(list(row) + empty)
+        sheet = Sheet(rows, name=self.name)
+        if len(self.__column_names) > 0 and len(other.colnames) > 0:
+            sheet.colnames = self.__column_names + [
+                other.colnames[column] for column in kept
+            ]
+        return sheet
+
     def to_dict(self, row=False):
         """Returns a dictionary"""
         the_dict = compact.OrderedDict()
@@ -552,6 +769,47 @@ class Sheet(Matrix):
             raise NotImplementedError("Not implemented")
         return the_dict
 
+    def to_numpy(self, dtype=None):
+        """Returns a two dimensional numpy array of the cells
+
+        Column and row names are left out. numpy needs to be installed.
+        """
+        return interop.sheet_to_numpy(self, dtype=dtype)
+
+    @classmethod
+    def from_numpy(
+        cls,
+        array,
+        name=constants.DEFAULT_NAME,
+        colnames=None,
+        rownames=None,
+        storage=constants.ROW_STORAGE,
+    ):
+        """Make a sheet of a one or two dimensional numpy array"""
+        return interop.sheet_from_numpy(
+            cls,
+            array,
+            name=name,
+            colnames=colnames,
+            rownames=rownames,
+            storage=storage,
+        )
+
+    def to_arrow(self):
+        """Returns an arrow record batch of the columns
+
+        pyarrow needs to be installed. Numeric columns of the columnar
+        storage are shared with the batch rather than copied.
+        """
+        return interop.sheet_to_arrow(self)
+
+    @classmethod
+    def from_arrow(
+        cls, batch, name=constants.DEFAULT_NAME, storage=constants.ROW_STORAGE
+    ):
+        """Make a sheet of an arrow record batch or table"""
+        return interop.sheet_from_arrow(cls, batch, name=name, storage=storage)
+
     def named_rows(self):
         """iterate rows using row names"""
         for row_name in self.__row_names:
@@ -581,12 +839,12 @@ class Sheet(Matrix):
     def __getitem__(self, aset):
         if isinstance(aset, tuple):
             if isinstance(aset[0], str):
-                row = self.rownames.index(aset[0])
+                row = self.row_index_of(aset[0])
             else:
                 row = aset[0]
 
             if isinstance(aset[1], str):
-                column = self.colnames.index(aset[1])
+                column = self.column_index_of(aset[1])
             else:
                 column = aset[1]
             return self.cell_value(row, column)
@@ -596,12 +854,12 @@ class Sheet(Matrix):
     def __setitem__(self, aset, c):
         if isinstance(aset, tuple):
             if isinstance(aset[0], str):
-                row = self.rownames.index(aset[0])
+                row = self.row_index_of(aset[0])
             else:
                 row = aset[0]
 
             if isinstance(aset[1], str):
-                column = self.colnames.index(aset[1])
+                column = self.column_index_of(aset[1])
             else:
                 column = aset[1]
             self.cell_value(row, column, c)
@@ -625,6 +883,37 @@ class _RepresentedString(object):
         return self.text
 
 
+class _NamePositions(dict):
+    """Positions of names, with a copy of the names they were made of"""
+
+    __slots__ = ("names",)
+
+    def __init__(self):
+        dict.__init__(self)
+        self.names = None
+
+
+def _index_of(name, names, positions):
+    """Look up a name in a dictionary of positions
+
+    The dictionary is rebuilt when the names have been changed
+    behind its back, e.g. sheet.colnames.append("new"). A name which
+    is missing from names that did not change is not looked for again.
+    """
+    index = positions.get(name)
+    if index is not None and index < len(names) and names[index] == name:
+        return index
+    if names != positions.names:
+        positions.clear()
+        for position, a_name in enumerate(names):
+            positions.setdefault(a_name, position)
+        positions.names = list(names)
+        index = positions.get(name)
+        if index is not None:
+            return index
+    raise ValueError("%r is not in list" % (name,))
+
+
 def make_names_unique(alist):
     """Append the number of occurences to duplicated names"""
     duplicates = {}
@@ -74,7 +74,6 @@ PYTHON_REQUIRES = ">=3.6"
 INSTALL_REQUIRES = [
     "lml>=0.0.4",
     "pyexcel-io>=0.6.2",
-    "texttable>=0.8.2",
 ]
 SETUP_COMMANDS = {}
 
@@ -83,6 +82,8 @@ EXTRAS_REQUIRE = {
     "xls": ['pyexcel-xls>=0.6.0'],
     "xlsx": ['pyexcel-xlsx>=0.6.0'],
     "ods": ['pyexcel-ods3>=0.6.0'],
+    "numpy": ['numpy'],
+    "arrow": ['pyarrow'],
 }
 # You do not need to read beyond this line
 PUBLISH_COMMAND = "{0} setup.py sdist bdist_wheel upload -r pypi".format(sys.executable)
@@ -0,0 +1,107 @@
+import os
+import asyncio
+from concurrent import futures
+
+import pyexcel as pe
+from pyexcel.internal import garbagecollector as gc
+
+from nose.tools import eq_
+
+CSV = "a,b\r\n1,2\r\n3,4\r\n5,6\r\n"
+
+
+class AsyncReader(object):
+    def __init__(self, content):
+        self.content = content
+        self.sizes = []
+
+    async def read(self, size=-1):
+        self.sizes.append(size)
+        chunk, self.content = self.content[:size], self.content[size:]
+        return chunk
+
+
+class AsyncWriter(object):
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, chunk):
+        self.chunks.append(chunk)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def collect(generator, stop=None):
+    items = []
+    async for item in generator:
+        items.append(item)
+        if stop is not None and len(items) == stop:
+            break
+    await generator.aclose()
+    return items
+
+
+class TestAsync:
+    def setUp(self):
+        gc.free_resources()
+        self.test_file = "test_asynchronous.csv"
+        with open(self.test_file, "w") as output:
+            output.write(CSV)
+
+    def tearDown(self):
+        gc.free_resources()
+        os.unlink(self.test_file)
+
+    def test_aget_sheet(self):
+        sheet = run(pe.aget_sheet(file_name=self.test_file))
+        eq_(sheet.to_array(), [["a", "b"], [1, 2], [3, 4], [5, 6]])
+
+    def test_aget_sheet_from_async_stream(self):
+        stream = AsyncReader(CSV.encode("utf-8"))
+        sheet = run(
+            pe.aget_sheet(
+                file_stream=stream, file_type="csv", name_columns_by_row=0
+            )
+        )
+        eq_(sheet.colnames, ["a", "b"])
+        eq_(len(stream.sizes), 2)
+
+    def test_aget_book_in_a_pool(self):
+        with futures.ThreadPoolExecutor(1) as pool:
+            book = run(pe.aget_book(pool=pool, file_name=self.test_file))
+        eq_(book.sheet_names(), ["test_asynchronous.csv"])
+
+    def test_asave_as_to_async_sink(self):
+        sink = AsyncWriter()
+        returned = run(
+            pe.asave_as(
+                array=[[1, 2]], dest_file_type="csv", dest_file_stream=sink
+            )
+        )
+        eq_(returned, sink)
+        eq_("".join(sink.chunks), "1,2\r\n")
+
+    def test_asave_as_to_memory(self):
+        io = run(pe.asave_as(file_name=self.test_file, dest_file_type="tsv"))
+        eq_(io.getvalue().splitlines()[0], "a\tb")
+
+    def test_aiget_array_in_chunks(self):
+        rows = run(
+            collect(pe.aiget_array(file_name=self.test_file, chunk_size=3))
+        )
+        eq_(rows, [["a", "b"], [1, 2], [3, 4], [5, 6]])
+        eq_(gc.GARBAGE, [])
+
+    def test_aiget_records_stopped_early(self):
+        records = run(
+            collect(
+                pe.aiget_records(
+                    file_name=self.test_file, chunk_size=1, schema="infer"
+                ),
+                stop=2,
+            )
+        )
+        eq_([tuple(record) for record in records], [(1, 2), (3, 4)])
+        eq_(gc.GARBAGE, [])
@@ -0,0 +1,140 @@
+import os
+import pickle
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import pyexcel as pe
+from pyexcel import cache
+from pyexcel.plugins.parsers.excel import ExcelParser
+
+from nose.tools import eq_
+
+
+class TestParseCache:
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.folder, "cache")
+        self.file_name = os.path.join(self.folder, "test.csv")
+        pe.save_as(
+            array=[[1, "a", 1.5], [2, "b", 2.5]], dest_file_name=self.file_name
+        )
+
+    def tearDown(self):
+        cache.set_cache_dir(None)
+        shutil.rmtree(self.folder)
+
+    def _entries(self):
+        return [
+            name
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(cache.ENTRY_SUFFIX)
+        ]
+
+    def _get_array(self, **keywords):
+        with patch.object(
+            ExcelParser, "parse_file", autospec=True, side_effect=_parse
+        ) as parse_file:
+            array = pe.get_array(file_name=self.file_name, **keywords)
+        return array, parse_file.call_count
+
+    def test_parsed_once(self):
+        array, parsed = self._get_array(cache_dir=self.cache_dir)
+        eq_(parsed, 1)
+        eq_(len(self._entries()), 1)
+        array2, parsed = self._get_array(cache_dir=self.cache_dir)
+        eq_(parsed, 0)
+        eq_(array2, array)
+        eq_(array2, [[1, "a", 1.5], [2, "b", 2.5]])
+
+    def test_without_cache(self):
+        self._get_array()
+        _, parsed = self._get_array()
+        eq_(parsed, 1)
+        assert not os.path.exists(self.cache_dir)
+
+    def test_global_cache_dir(self):
+        cache.set_cache_dir(self.cache_dir)
+        self._get_array()
+        _, parsed = self._get_array()
+        eq_(parsed, 0)
+        book = pe.get_book(file_name=self.file_name)
+        eq_(book.number_of_sheets(), 1)
+        eq_(len(self._entries()), 1)
+
+    def test_changed_file(self):
+        self._get_array(cache_dir=self.cache_dir)
+        pe.save_as(array=[[3, "c", 3.5]], dest_file_name=self.file_name)
+        array, parsed = self._get_array(cache_dir=self.cache_dir)
+        eq_(parsed, 1)
+        eq_(array, [[3, "c", 3.5]])
+
+    def test_keywords(self):
+        self._get_array(cache_dir=self.cache_dir)
+        array, parsed = self._get_array(cache_dir=self.cache_dir, start_row=1)
+        eq_(parsed, 1)
+        eq_(array, [[2, "b", 2.5]])
+        eq_(len(self._entries()), 2)
+
+    def test_on_demand(self):
+        self._get_array(cache_dir=self.cache_dir)
+        rows = pe.iget_array(
+            file_name=self.file_name, cache_dir=self.cache_dir
+        )
+        eq_(list(rows), [[1, "a", 1.5], [2, "b", 2.5]])
+        eq_(len(self._entries()), 1)
+
+    def test_keywords_which_are_not_plain(self):
+        _, parsed = self._get_array(
+            cache_dir=self.cache_dir, skip_empty_rows=object()
+        )
+        eq_(parsed, 1)
+        assert not os.path.exists(self.cache_dir)
+
+    def test_least_recently_used_entries_are_removed(self):
+        parse_cache = cache.ParseCache(self.cache_dir)
+        parser = ExcelParser("csv")
+        keys = []
+        for start_row in (0, 1):
+            parse_cache.parse_file(parser, self.file_name, start_row=start_row)
+            keys.append(
+                parse_cache.key(
+                    parser, self.file_name, {"start_row": start_row}
+                )
+            )
+        for key in keys:
+            os.utime(parse_cache._entry_path(key), (1, 1))
+        parse_cache.parse_file(parser, self.file_name, start_row=0)
+        # room for two entries of all rows
+        parse_cache.cache_size = 2 * os.path.getsize(
+            parse_cache._entry_path(keys[0])
+        )
+        parse_cache.parse_file(parser, self.file_name, start_column=1)
+        entries = self._entries()
+        eq_(len(entries), 2)
+        assert keys[0] + cache.ENTRY_SUFFIX in entries
+        assert keys[1] + cache.ENTRY_SUFFIX not in entries
+
+    def test_entries_larger_than_the_cache(self):
+        self._get_array(cache_dir=self.cache_dir, cache_size=10)
+        assert not os.path.exists(self.cache_dir)
+
+    def test_unsafe_entry(self):
+        self._get_array(cache_dir=self.cache_dir)
+        entry = os.path.join(self.cache_dir, self._entries()[0])
+        with open(entry, "wb") as f:
+            pickle.dump([("test.csv", [[os.getcwd]])], f)
+        array, parsed = self._get_array(cache_dir=self.cache_dir)
+        eq_(parsed, 1)
+        eq_(array, [[1, "a", 1.5], [2, "b", 2.5]])
+
+    def test_clear(self):
+        self._get_array(cache_dir=self.cache_dir)
+        cache.ParseCache(self.cache_dir).clear()
+        eq_(self._entries(), [])
+
+
+def _parse(parser, file_name, on_demand=False, **keywords):
+    from pyexcel_io import get_data
+
+    return get_data(file_name, **keywords)
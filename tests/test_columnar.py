@@ -0,0 +1,177 @@
+from array import array
+
+import pyexcel as pe
+from pyexcel.internal.sheets import Matrix
+from pyexcel.internal.sheets.columnar import TypedColumn, ColumnarStorage
+
+from nose.tools import eq_, raises
+
+
+class TestColumnarMatrix:
+    def setUp(self):
+        self.data = [[1, 2.5, "a"], [None, 3.5], [4]]
+        self.expected = [[1, 2.5, "a"], ["", 3.5, ""], [4, "", ""]]
+
+    def test_storage(self):
+        m = Matrix(self.data, storage="columnar")
+        eq_(m.storage, "columnar")
+        eq_(Matrix(self.data).storage, "row")
+
+    @raises(ValueError)
+    def test_unknown_storage(self):
+        Matrix(self.data, storage="diagonal")
+
+    def test_same_view_as_row_storage(self):
+        m = Matrix(self.data, storage="columnar")
+        eq_(m.to_array(), self.expected)
+        eq_(m.number_of_rows(), 3)
+        eq_(m.number_of_columns(), 3)
+        eq_(m.row_at(1), ["", 3.5, ""])
+        eq_(m.row_at(-1), [4, "", ""])
+        eq_(m.column_at(0), [1, "", 4])
+        eq_(m.column_at(-1), ["a", "", ""])
+        eq_(m.cell_value(0, 1), 2.5)
+        eq_(list(m.rows()), self.expected)
+        eq_(list(m.rrows()), list(reversed(self.expected)))
+        eq_(list(m.columns()), list(Matrix(self.expected).columns()))
+        eq_(list(m.enumerate()), list(Matrix(self.expected).enumerate()))
+        eq_(list(m.rvertical()), list(Matrix(self.expected).rvertical()))
+
+    def test_numbers_are_packed(self):
+        m = Matrix(self.data, storage="columnar")
+        columns = m._Matrix__store.columns
+        eq_(columns[0].data, array("q", [1, 0, 4]))
+        eq_(columns[0].nulls, bytearray([0, 1, 0]))
+        eq_(columns[1].data, array("d", [2.5, 3.5, 0]))
+        eq_(columns[2].data, ["a", "", ""])
+
+    def test_set_cell_value(self):
+        m = Matrix(self.data, storage="columnar")
+        m.cell_value(1, 0, 7)
+        m.cell_value(0, 1, "mixed")
+        m.cell_value(3, 3, 1)
+        eq_(
+            m.to_array(),
+            [
+                [1, "mixed", "a", ""],
+                [7, 3.5, "", ""],
+                [4, "", "", ""],
+                ["", "", "", 1],
+            ],
+        )
+
+    def test_mutations(self):
+        m = Matrix(self.data, storage="columnar")
+        m.extend_rows([[9, 9, 9, 9]])
+        m.extend_columns([[0, 0, 0, 0, 0]])
+        m.delete_rows([0, 2])
+        m.delete_columns([3])
+        eq_(m.to_array(), [["", 3.5, "", 0], [9, 9, 9, 0], ["", "", "", 0]])
+        m.transpose()
+        eq_(m.to_array(), [["", 9, ""], [3.5, 9, ""], ["", 9, ""], [0, 0, 0]])
+
+    def test_internal_array_is_a_snapshot(self):
+        m = Matrix(self.data, storage="columnar")
+        array = m.get_internal_array()
+        eq_(array, self.expected)
+        array[0][0] = 100
+        eq_(m.cell_value(0, 0), 1)
+
+    def test_none_is_kept(self):
+        m = Matrix([[1, "a"], [2, "b"]], storage="columnar")
+        m.set_row_at(0, [None, None])
+        m2 = Matrix([[1, "a"], [2, "b"]])
+        m2.set_row_at(0, [None, None])
+        eq_(m.get_internal_array(), [[None, None], [2, "b"]])
+        eq_(m.get_internal_array(), m2.get_internal_array())
+        eq_(m.row_at(0), [None, None])
+        eq_(m.column_at(0), [None, 2])
+
+    def test_paste_keeps_storage(self):
+        m = Matrix([[1, 2], [3, 4]], storage="columnar")
+        m.paste([1, 1], rows=[[5, 6]])
+        eq_(m.storage, "columnar")
+        eq_(m.to_array(), [[1, 2, ""], [3, 5, 6]])
+
+    def test_clone(self):
+        m = Matrix(self.data, storage="columnar")
+        m2 = m.clone()
+        m2.cell_value(0, 0, 100)
+        eq_(m.cell_value(0, 0), 1)
+        eq_(m2.storage, "columnar")
+
+    def test_format(self):
+        m = Matrix([[1, "2"], ["", 3.0]], storage="columnar")
+        m.format(float)
+        eq_(m.to_array(), [[1.0, 2.0], [0.0, 3.0]])
+
+
+def test_get_sheet_with_columnar_storage():
+    data = [["X", "Y"], [1, 2.0], [3, 4.0]]
+    sheet = pe.get_sheet(
+        array=data, name_columns_by_row=0, storage="columnar"
+    )
+    eq_(sheet.storage, "columnar")
+    eq_(sheet.colnames, ["X", "Y"])
+    eq_(sheet.column["X"], [1, 3])
+    eq_(list(sheet.to_records())[1], {"X": 3, "Y": 4.0})
+    eq_(sheet.clone().storage, "columnar")
+    sheet.column.format("X", str)
+    eq_(sheet.column["X"], ["1", "3"])
+
+
+def test_typed_column_overflow():
+    column = TypedColumn.from_values([1, 2 ** 70, ""])
+    eq_(column.is_typed(), False)
+    eq_(column.values(), [1, 2 ** 70, ""])
+    column = TypedColumn.from_values([1, 2])
+    column[0] = 2 ** 70
+    eq_(column.values(), [2 ** 70, 2])
+
+
+def test_typed_column_extend():
+    column = TypedColumn.from_values([1.0, 2.0])
+    column.extend(["", ""])
+    eq_(column.is_typed(), True)
+    eq_(column.values(), [1.0, 2.0, "", ""])
+    column.extend([True])
+    eq_(column.is_typed(), False)
+    eq_(column.values(), [1.0, 2.0, "", "", True])
+
+
+def test_rows_are_assembled_in_blocks():
+    rows = [[i, float(i)] for i in range(10000)]
+    storage = ColumnarStorage.from_rows(rows)
+    eq_(list(storage.rows()), rows)
+    eq_(list(storage.rows(reverse=True)), list(reversed(rows)))
+
+
+def test_typed_column_format():
+    column = TypedColumn.from_values([1, "", 3])
+    formatted = column.format(float)
+    eq_(formatted.data, array("d", [1.0, 0.0, 3.0]))
+    eq_(formatted.nulls, None)
+    eq_(column.format(str).values(), ["1", "", "3"])
+    eq_(TypedColumn.from_values([2.0 ** 70]).format(int).values(), [2 ** 70])
+
+
+def test_typed_column_grows_while_its_buffer_is_exported():
+    column = TypedColumn.from_values([1, 2])
+    view = memoryview(column.data)
+    column.append(3)
+    column.extend([4, ""])
+    eq_(column.values(), [1, 2, 3, 4, ""])
+    eq_(view.tolist(), [1, 2])
+
+
+def test_use_columns():
+    matrix = Matrix([["a"]])
+    columns = [
+        TypedColumn(array("q", [1, 2])),
+        TypedColumn.from_values(["x", ""]),
+    ]
+    matrix._use_columns(columns, 2)
+    eq_(matrix.storage, "columnar")
+    eq_(matrix._typed_columns(), columns)
+    eq_(matrix.to_array(), [[1, "x"], [2, ""]])
+    eq_(Matrix([[1]])._typed_columns(), None)
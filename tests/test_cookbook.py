@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 
 import pyexcel as pe
 from base import clean_up_files
@@ -29,6 +31,69 @@ class TestSpliting:
         assert os.path.exists("Sheet2_%s" % self.testfile4)
         assert os.path.exists("Sheet3_%s" % self.testfile4)
 
+    def test_split_a_sheet_by_column(self):
+        pe.save_as(
+            array=[["k", "v"], ["a", 1], ["b", 2], ["a", 3], ["c", 4]],
+            dest_file_name="rows.csv",
+        )
+        outputs = pe.cookbook.split_a_sheet_by_column(
+            "rows.csv",
+            "k",
+            "split.csv",
+            max_buffered_rows=2,
+        )
+        eq_(list(outputs.keys()), ["a", "b", "c"])
+        eq_(
+            pe.get_array(file_name="a_split.csv"),
+            [["k", "v"], ["a", 1], ["a", 3]],
+        )
+        eq_(pe.get_array(file_name="c_split.csv"), [["k", "v"], ["c", 4]])
+
+    def test_split_a_sheet_by_column_into_a_folder(self):
+        folder = tempfile.mkdtemp()
+        try:
+            rows = os.path.join(folder, "rows.csv")
+            pe.save_as(
+                array=[["../a", 1], ["b/c", 2], ["b_c", 3]],
+                dest_file_name=rows,
+            )
+            outputs = pe.cookbook.split_a_sheet_by_column(
+                rows, 0, header=False
+            )
+            eq_(
+                list(outputs.values()),
+                [
+                    os.path.join(folder, ".._a_rows.csv"),
+                    os.path.join(folder, "b_c_rows.csv"),
+                    os.path.join(folder, "b_c-2_rows.csv"),
+                ],
+            )
+            eq_(
+                sorted(os.listdir(folder)),
+                [
+                    ".._a_rows.csv",
+                    "b_c-2_rows.csv",
+                    "b_c_rows.csv",
+                    "rows.csv",
+                ],
+            )
+            eq_(pe.get_array(file_name=outputs["b/c"]), [["b/c", 2]])
+        finally:
+            shutil.rmtree(folder)
+
+    def test_split_a_sheet_by_column_to_memory(self):
+        pe.save_as(
+            array=[[1, "x"], [2, "y"], [1, "z"]], dest_file_name="rows.csv"
+        )
+        outputs = pe.cookbook.split_a_sheet_by_column(
+            "rows.csv", 0, file_type="csv", header=False
+        )
+        content = outputs[1].getvalue()
+        eq_(
+            pe.get_array(file_content=content, file_type="csv"),
+            [[1, "x"], [1, "z"]],
+        )
+
     def test_extract_a_book(self):
         pe.cookbook.extract_a_sheet_from_a_book(
             self.testfile4, "Sheet1", "extracted.csv"
@@ -49,6 +114,10 @@ class TestSpliting:
             "Sheet1_multiple_sheets.xls",
             "Sheet2_multiple_sheets.xls",
             "Sheet3_multiple_sheets.xls",
+            "rows.csv",
+            "a_split.csv",
+            "b_split.csv",
+            "c_split.csv",
         ]
         clean_up_files(file_list)
 
@@ -224,6 +293,27 @@ class TestCookbook:
         content6 = r["Sheet3"].to_array()
         assert content6 == self.content4["Sheet3"]
 
+    def test_merge_csv_files_to_a_book_in_parallel(self):
+        file_array = [self.testfile, self.testfile2, self.testfile3]
+        for executor in ["thread", "process"]:
+            pe.cookbook.merge_csv_to_a_book(
+                file_array, "merged.xlsx", workers=2, executor=executor
+            )
+            r = pe.BookReader("merged.xlsx")
+            eq_(r.sheet_names(), file_array)
+            r[self.testfile].name_columns_by_row(0)
+            eq_(r[self.testfile].to_dict(), self.content)
+            os.unlink("merged.xlsx")
+
+    def test_merge_any_files_to_a_book_in_parallel(self):
+        file_array = [self.testfile, self.testfile4]
+        pe.cookbook.merge_all_to_a_book(
+            file_array, "merged.xlsx", workers=2, executor="process"
+        )
+        r = pe.BookReader("merged.xlsx")
+        eq_(r.sheet_names(), [self.testfile, "Sheet1", "Sheet2", "Sheet3"])
+        eq_(r["Sheet2"].to_array(), self.content4["Sheet2"])
+
     def test_merge_csv_files_to_a_book(self):
         file_array = [self.testfile, self.testfile2, self.testfile3]
         pe.cookbook.merge_csv_to_a_book(file_array, "merged.xlsx")
@@ -12,16 +12,27 @@ class Attributable:
         return self.mydict[field]
 
 
+class QuerySet(list):
+    def __init__(self, objects, items):
+        list.__init__(self, items)
+        self.objects = objects
+
+    def iterator(self, chunk_size):
+        self.objects.chunk_size = chunk_size
+        return iter(self)
+
+
 class Objects:
     def __init__(self):
         self.objs = None
+        self.chunk_size = None
 
     def bulk_create(self, objs, batch_size):
         self.objs = objs
         self.batch_size = batch_size
 
     def all(self):
-        return [Attributable(o) for o in self.objs]
+        return QuerySet(self, [Attributable(o) for o in self.objs])
 
 
 class Field:
@@ -150,6 +161,14 @@ class TestSheet:
         assert sheet2.name == "test"
         eq_(list(sheet2.to_records()), list(sheet.to_records()))
 
+    def test_iget_records_from_django_model_in_batches(self):
+        model = FakeDjangoModel()
+        pe.save_as(array=self.data, name_columns_by_row=0, dest_model=model)
+        model._meta.update(["X", "Y", "Z"])
+        records = pe.iget_records(model=model, batch_size=1)
+        eq_(list(records), self.result)
+        eq_(model.objects.chunk_size, 1)
+
     def test_mapping_array(self):
         data2 = [["A", "B", "C"], [1, 2, 3], [4, 5, 6]]
         mapdict = ["X", "Y", "Z"]
@@ -24,7 +24,7 @@ class TestAllExamples:
         example_files = glob.glob(os.path.join("examples", "**", "*.py"))
         file_registry = {}
         for abs_file_path in example_files:
-            if "pyexcel_server.py" in abs_file_path:
+            if abs_file_path.endswith("_server.py"):
                 continue
             if "__init__.py" in abs_file_path:
                 continue
@@ -1,10 +1,14 @@
+import copy
 import datetime
+from decimal import Decimal
 from unittest import TestCase
 
 from base import clean_up_files
-from pyexcel import SeriesReader, save_as, get_sheet
+from pyexcel import Sheet, SeriesReader, save_as, get_sheet
 from pyexcel.internal.sheets import formatters
 
+from nose.tools import eq_
+
 
 def increase_func(x):
     return int(x) + 1
@@ -135,6 +139,44 @@ class TestToFormatFunction:
         assert d == n_d
 
 
+class TestConversionPlan:
+    def test_no_conversion(self):
+        eq_(formatters.column_formatter([1.5, 2.0], float), None)
+        eq_(formatters.column_formatter(["a", ""], str), None)
+
+    def test_builtin_conversion(self):
+        eq_(formatters.column_formatter([1, 2.5, True], float), float)
+        eq_(formatters.column_formatter([1, 2.5], str), str)
+
+    def test_general_conversion(self):
+        converter = formatters.column_formatter(["1", ""], float)
+        eq_(list(map(converter, ["1", ""])), [1.0, 0.0])
+        converter = formatters.column_formatter([True], str)
+        eq_(converter(True), "true")
+
+
+def test_format_keeps_the_types_of_to_format():
+    data = [[1, "2", "", True], [2.5, "x", Decimal("1.5"), 3]]
+    for to_type in [int, float, str]:
+        expected = [
+            [formatters.to_format(to_type, value) for value in row]
+            for row in data
+        ]
+        sheet = Sheet(copy.deepcopy(data))
+        sheet.format(to_type)
+        eq_(sheet.to_array(), expected)
+        eq_(
+            [type(value) for value in sheet.enumerate()],
+            [type(value) for row in expected for value in row],
+        )
+
+
+def test_map_leaves_cells_for_which_none_is_returned():
+    sheet = Sheet([[1, 2], [3, 4]])
+    sheet.map(lambda value: value * 10 if value % 2 else None)
+    eq_(sheet.to_array(), [[10, 2], [30, 4]])
+
+
 class TestColumnFormatter(TestCase):
     def setUp(self):
         self.data = {
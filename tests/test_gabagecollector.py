@@ -1,4 +1,5 @@
 import os
+import threading
 
 from pyexcel import iget_array
 from pyexcel.internal import garbagecollector as gc
@@ -24,3 +25,34 @@ def test_gc_custom():
     eq_(len(gc.GARBAGE), 1)
     gc.free_resources()
     assert len(gc.GARBAGE) == 0
+
+
+def test_collecting_keeps_the_garbage_of_each_thread_apart():
+    gc.free_resources()
+    started = threading.Barrier(2)
+    collected = {}
+
+    def collect(name):
+        with gc.collecting() as opened:
+            gc.append(name)
+            started.wait()
+            collected[name] = list(opened)
+
+    threads = [
+        threading.Thread(target=collect, args=(name,)) for name in "ab"
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    eq_(collected, {"a": ["a"], "b": ["b"]})
+    eq_(len(gc.GARBAGE), 0)
+
+
+def test_close():
+    f = open(os.path.join("tests", "fixtures", "bug_01.csv"), "r")
+    with gc.collecting() as opened:
+        gc.append(f)
+    gc.close(opened)
+    assert f.closed
+    eq_(opened, [])
@@ -1,9 +1,17 @@
+import os
+import shutil
+import tempfile
+import threading
 from textwrap import dedent
 from unittest import TestCase
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from unittest.mock import MagicMock, patch
 
 import pyexcel as pe
-from pyexcel._compact import PY2, BytesIO, StringIO
+from pyexcel._compact import PY2, BytesIO, StringIO, request
+from pyexcel.internal import connections
+from pyexcel.plugins.parsers.excel import ExcelParser
 
 
 class TestHttpBookSource(TestCase):
@@ -57,3 +65,150 @@ class TestHttpBookSource(TestCase):
         +---+---+---+"""
         ).strip("\n")
         self.assertEqual(str(sheet), content)
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    content = b"a,b\r\n1,2\r\n3,4\r\n"
+    etag = '"v1"'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.server.requests.append(
+            (self.path, self.headers.get("If-None-Match"))
+        )
+        self.server.agents.append(self.headers.get("User-Agent"))
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/feed.csv")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", str(len(self.content)))
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            self.wfile.write(self.content)
+
+    def log_message(self, *_):
+        pass
+
+
+class TestHttpServer(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+        self.server.connections = 0
+        self.server.requests = []
+        self.server.agents = []
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.01,)
+        )
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = "http://127.0.0.1:%d/feed.csv" % self.server.server_port
+        self.folder = tempfile.mkdtemp()
+        self.patcher = patch.dict(os.environ, {"no_proxy": "127.0.0.1"})
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        request.install_opener(None)
+        connections.POOL.clear()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.folder)
+
+    def test_connection_is_reused(self):
+        for _ in range(3):
+            array = pe.get_array(url=self.url)
+            self.assertEqual(array, [["a", "b"], [1, 2], [3, 4]])
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_installed_opener_is_used(self):
+        request.install_opener(request.build_opener())
+        pe.get_array(url=self.url)
+        opener = request.build_opener()
+        opener.addheaders = [("User-Agent", "custom")]
+        request.install_opener(opener)
+        array = pe.get_array(url=self.url)
+        self.assertEqual(array, [["a", "b"], [1, 2], [3, 4]])
+        self.assertEqual(self.server.agents, ["pyexcel", "custom"])
+
+    def test_redirect(self):
+        url = self.url.replace("feed.csv", "moved")
+        self.assertEqual(pe.get_array(url=url)[0], ["a", "b"])
+        self.assertEqual(self.server.connections, 1)
+
+    def test_stream(self):
+        records = pe.iget_records(url=self.url, url_stream=True)
+        self.assertEqual(next(records), {"a": 1, "b": 2})
+        self.assertEqual(list(records), [{"a": 3, "b": 4}])
+        pe.free_resources()
+        sheet = pe.get_sheet(url=self.url, url_stream=True)
+        self.assertEqual(sheet.to_array(), [["a", "b"], [1, 2], [3, 4]])
+        self.assertEqual(self.server.connections, 1)
+
+    def test_conditional_get(self):
+        for _ in range(3):
+            array = pe.get_array(url=self.url, url_cache=self.folder)
+            self.assertEqual(array, [["a", "b"], [1, 2], [3, 4]])
+        self.assertEqual(
+            [etag for _, etag in self.server.requests], [None, '"v1"', '"v1"']
+        )
+        self.assertEqual(len(os.listdir(self.folder)), 2)
+
+    def test_unfinished_response_is_not_cached(self):
+        cache = connections.ResponseCache(self.folder)
+        response = connections.urlopen(self.url, cache=cache)
+        response.read(3)
+        response.close()
+        self.assertEqual(os.listdir(self.folder), [])
+        response = connections.urlopen(self.url, cache=cache)
+        self.assertEqual(response.read(), FeedHandler.content)
+        response.close()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_response_is_closed_when_parsing_fails(self):
+        for method, stream in (
+            ("parse_file_content", False),
+            ("parse_file_stream", True),
+        ):
+            with self._recorded_responses() as responses, patch.object(
+                ExcelParser, method, side_effect=ValueError
+            ):
+                with self.assertRaises(ValueError):
+                    pe.get_array(url=self.url, url_stream=stream)
+            self.assertEqual(len(responses), 1)
+            self.assertTrue(responses[0].closed)
+
+    def test_streamed_response_is_closed(self):
+        with self._recorded_responses() as responses:
+            pe.get_array(url=self.url, url_stream=True)
+            self.assertTrue(responses[-1].closed)
+            records = pe.iget_records(url=self.url, url_stream=True)
+            self.assertEqual(next(records), {"a": 1, "b": 2})
+            self.assertFalse(responses[-1].closed)
+            pe.free_resources()
+            self.assertTrue(responses[-1].closed)
+
+    @contextmanager
+    def _recorded_responses(self):
+        responses = []
+        urlopen = connections.urlopen
+
+        def record(url, **keywords):
+            response = urlopen(url, **keywords)
+            responses.append(response)
+            return response
+
+        with patch.object(connections, "urlopen", side_effect=record):
+            yield responses
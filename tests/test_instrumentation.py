@@ -0,0 +1,93 @@
+import tracemalloc
+
+import pyexcel as pe
+from pyexcel import instrumentation
+
+from nose.tools import eq_
+
+
+class TestInstrumentation:
+    def setUp(self):
+        self.content = pe.save_as(
+            array=[["X", "Y"], [1, 2], [3, 4]], dest_file_type="csv"
+        ).getvalue()
+
+    def test_read_stages(self):
+        with instrumentation.observe() as aggregator:
+            pe.get_sheet(
+                file_type="csv",
+                file_content=self.content,
+                name_columns_by_row=0,
+            )
+        summary = aggregator.summary()
+        eq_(
+            list(summary.keys()),
+            [
+                ("get_sheet_stream", "source"),
+                ("get_sheet_stream", "parse"),
+                ("sheet", "uniform"),
+                ("sheet", "name_series"),
+            ],
+        )
+        eq_(summary[("sheet", "uniform")]["rows"], 3)
+        eq_(summary[("sheet", "uniform")]["cells"], 6)
+        eq_(summary[("sheet", "name_series")]["rows"], 2)
+        eq_(summary[("sheet", "uniform")]["memory"], None)
+        eq_(summary[("get_sheet_stream", "source")]["count"], 1)
+
+    def test_write_stages(self):
+        events = []
+        with instrumentation.observe(events.append):
+            pe.save_as(array=[[1, 2], [3, 4]], dest_file_type="csv")
+            pe.save_book_as(
+                bookdict={"a": [[1]], "b": [[1, 2]]}, dest_file_type="xls"
+            )
+        stages = [(event.operation, event.stage) for event in events]
+        eq_(("save_sheet", "render") in stages, True)
+        eq_(("save_book", "render") in stages, True)
+        render = [
+            event for event in events if event.operation == "save_book"
+        ][-1]
+        eq_((render.rows, render.cells), (2, 3))
+        eq_(all(event.duration >= 0 for event in events), True)
+
+    def test_trace_memory(self):
+        with instrumentation.observe(trace_memory=True) as aggregator:
+            pe.get_sheet(file_type="csv", file_content=self.content)
+        summary = aggregator.summary()
+        eq_(isinstance(summary[("sheet", "uniform")]["memory"], int), True)
+
+    def test_trace_memory_until_the_last_observer_is_removed(self):
+        first, second = [], []
+        instrumentation.add_observer(first.append, trace_memory=True)
+        instrumentation.add_observer(second.append, trace_memory=True)
+        try:
+            instrumentation.remove_observer(first.append)
+            eq_(tracemalloc.is_tracing(), True)
+            pe.get_sheet(file_type="csv", file_content=self.content)
+            eq_(all(event.memory is not None for event in second), True)
+        finally:
+            instrumentation.remove_observer(second.append)
+        eq_(tracemalloc.is_tracing(), False)
+
+    def test_global_observer(self):
+        events = []
+        instrumentation.add_observer(events.append)
+        try:
+            pe.get_array(array=[[1]])
+        finally:
+            instrumentation.remove_observer(events.append)
+        count = len(events)
+        eq_(count > 0, True)
+        pe.get_array(array=[[1]])
+        eq_(len(events), count)
+
+    def test_book_stream_stages(self):
+        with instrumentation.observe() as aggregator:
+            pe.get_book(bookdict={"a": [[1, 2]], "b": [[3]]})
+        summary = aggregator.summary()
+        eq_(summary[("get_book_stream", "parse")]["cells"], 3)
+
+
+def test_no_observer():
+    eq_(instrumentation.stage("sheet", "uniform"), instrumentation._NO_STAGE)
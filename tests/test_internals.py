@@ -1,7 +1,19 @@
-from unittest.mock import MagicMock
+import os
+import sys
+import json
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
 
+from pyexcel import constants as constants
+from pyexcel.source import AbstractSource
+from pyexcel.plugins import SourceInfo
 from pyexcel._compact import PY2
+from pyexcel.internal import SOURCE, PARSER, manifest
 from pyexcel.internal.core import _seek_at_zero
+from pyexcel.internal.partition import RowPartitioner
+
+from nose.tools import eq_, raises
 
 
 def test_seek_at_zero():
@@ -13,3 +25,141 @@ def test_seek_at_zero():
 
         stream.seek.side_effect = io.UnsupportedOperation()
     _seek_at_zero(stream)
+
+
+def test_row_partitioner_spills_to_a_file():
+    partitioner = RowPartitioner(max_buffered_rows=3)
+    for index in range(10):
+        partitioner.add(index % 4, [index])
+    eq_(partitioner.keys(), [0, 1, 2, 3])
+    eq_(list(partitioner.rows(1)), [[1], [5], [9]])
+    eq_(list(partitioner.rows(3)), [[3], [7]])
+    partitioner.close()
+
+
+def test_row_partitioner_with_many_keys():
+    partitioner = RowPartitioner(max_buffered_rows=100)
+    with patch("tempfile.TemporaryFile", wraps=tempfile.TemporaryFile) as f:
+        for index in range(1000):
+            partitioner.add(index % 300, [index])
+        eq_(f.call_count, 1)
+    eq_(len(partitioner.keys()), 300)
+    eq_(list(partitioner.rows(299)), [[299], [599], [899]])
+    eq_(list(partitioner.rows(0)), [[0], [300], [600], [900]])
+    partitioner.close()
+
+
+class TestPluginManifest:
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.manifest_file = os.path.join(self.folder, "cache", "m.json")
+        self.patcher = patch.dict(
+            os.environ,
+            {manifest.MANIFEST_ENVIRONMENT_VARIABLE: self.manifest_file},
+        )
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        shutil.rmtree(self.folder)
+
+    def test_build_and_load(self):
+        names = manifest.build_manifest()
+        eq_("pyexcel_io" in names, True)
+        eq_(manifest.load_manifest(self.manifest_file), names)
+
+    def test_stale_manifest(self):
+        manifest.build_manifest()
+        with patch("sys.path", ["", self.folder] + sys.path):
+            eq_(manifest.load_manifest(self.manifest_file), None)
+
+    def test_broken_manifest(self):
+        os.makedirs(os.path.dirname(self.manifest_file))
+        with open(self.manifest_file, "w") as broken:
+            broken.write("{")
+        eq_(manifest.load_manifest(self.manifest_file), None)
+
+    @patch("pyexcel.internal.manifest.do_import")
+    @patch("pyexcel.internal.manifest.find_plugins")
+    def test_scan_once(self, find_plugins, do_import):
+        find_plugins.return_value = ["pyexcel_fake"]
+        manifest.scan_plugins("pyexcel", [], [])
+        eq_(os.path.exists(self.manifest_file), False)
+        manifest.build_manifest()
+        manifest.scan_plugins("pyexcel", [], ["pyexcel.plugins.sources"])
+        manifest.scan_plugins("pyexcel", ["pyexcel_fake"], [])
+        eq_(find_plugins.call_count, 2)
+        imported = [call[0][0] for call in do_import.call_args_list]
+        eq_(
+            imported,
+            ["pyexcel_fake", "pyexcel_fake", "pyexcel.plugins.sources"],
+        )
+        with open(self.manifest_file) as content:
+            eq_(json.load(content)["plugins"], ["pyexcel_fake"])
+
+    @patch("pyexcel.internal.manifest.find_plugins")
+    def test_names_other_than_plugins(self, find_plugins):
+        for names in (["os"], ["pyexcel_x.os"], "pyexcel_x", [1]):
+            find_plugins.return_value = names
+            manifest.build_manifest()
+            eq_(manifest.load_manifest(self.manifest_file), None)
+
+    def test_turned_off(self):
+        os.environ[manifest.MANIFEST_ENVIRONMENT_VARIABLE] = ""
+        eq_(manifest.manifest_path(), None)
+
+
+class TestSourceResolution:
+    def setUp(self):
+        SOURCE._resolutions.clear()
+        self.patcher = patch.object(
+            SOURCE, "_find_a_source", wraps=SOURCE._find_a_source
+        )
+        self.find_a_source = self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_remembered(self):
+        first = SOURCE.get_source(file_type="csv", file_content="1,2")
+        second = SOURCE.get_source(file_type="CSV", file_content="3,4")
+        eq_(type(first), type(second))
+        eq_(first is second, False)
+        eq_(self.find_a_source.call_count, 1)
+
+    def test_by_fields_and_file_types(self):
+        SOURCE.get_source(file_type="csv", file_content="1,2")
+        SOURCE.get_source(file_type="tsv", file_content="1\t2")
+        array_source = SOURCE.get_source(array=[[1, 2]])
+        SOURCE.get_source(array=[[3, 4]], file_content=None)
+        eq_(array_source.__class__.__name__, "ArraySource")
+        eq_(self.find_a_source.call_count, 3)
+
+    def test_by_file_names(self):
+        SOURCE.get_writable_source(file_name="a.csv")
+        SOURCE.get_writable_source(file_name="b.CSV")
+        SOURCE.get_writable_source(file_name="c.csv", force_file_type="tsv")
+        eq_(self.find_a_source.call_count, 2)
+
+    @raises(IOError)
+    def test_not_a_file_name(self):
+        SOURCE.get_writable_source(file_name=["not", "a", "name"])
+
+    def test_forgotten_on_registration(self):
+        SOURCE.get_source(file_type="csv", file_content="1,2")
+
+        @SourceInfo(
+            "source",
+            fields=["resolution_fixture"],
+            targets=(constants.SHEET,),
+            actions=(constants.READ_ACTION,),
+            attributes=[],
+        )
+        class FixtureSource(AbstractSource):
+            pass
+
+        SOURCE.get_source(file_type="csv", file_content="1,2")
+        with patch.object(PARSER, "generation", PARSER.generation + 1):
+            SOURCE.get_source(file_type="csv", file_content="1,2")
+        eq_(self.find_a_source.call_count, 3)
+        eq_(type(SOURCE.get_source(resolution_fixture=1)), FixtureSource)
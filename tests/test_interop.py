@@ -0,0 +1,111 @@
+import sys
+from unittest.mock import patch
+
+import pyexcel as pe
+from pyexcel import constants
+
+from nose import SkipTest
+from nose.tools import eq_, raises
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def test_missing_numpy():
+    sheet = pe.Sheet([[1]])
+    with patch.dict(sys.modules, {"numpy": None}):
+        try:
+            sheet.to_numpy()
+        except ImportError as e:
+            eq_(str(e), constants.MESSAGE_MISSING_LIBRARY % "numpy")
+        else:
+            raise AssertionError("ImportError is expected")
+
+
+@raises(ImportError)
+def test_missing_pyarrow():
+    with patch.dict(sys.modules, {"pyarrow": None}):
+        pe.Book({"A": [[1]]}).to_arrow()
+
+
+class TestNumpy:
+    def setUp(self):
+        if numpy is None:
+            raise SkipTest("numpy is not installed")
+
+    def test_row_storage(self):
+        sheet = pe.Sheet([[1, 2], [3, 4]])
+        numbers = sheet.to_numpy()
+        eq_(numbers.tolist(), [[1, 2], [3, 4]])
+        eq_(pe.Sheet.from_numpy(numbers).to_array(), [[1, 2], [3, 4]])
+
+    def test_mixed_cells(self):
+        sheet = pe.Sheet([[1, "a"], [3, ""]])
+        eq_(sheet.to_numpy().tolist(), [[1, "a"], [3, ""]])
+
+    def test_columnar_storage(self):
+        sheet = pe.Sheet([[1, 2.5], [3, ""]], storage="columnar")
+        numbers = sheet.to_numpy()
+        eq_(str(numbers.dtype), "float64")
+        eq_(numbers[:, 0].tolist(), [1.0, 3.0])
+        eq_(numpy.isnan(numbers[1, 1]), True)
+
+    def test_from_numpy_columnar(self):
+        numbers = numpy.array([[1, 2], [3, 4]])
+        sheet = pe.Sheet.from_numpy(
+            numbers, colnames=["X", "Y"], storage="columnar"
+        )
+        eq_(sheet.storage, "columnar")
+        eq_(sheet.to_array(), [["X", "Y"], [1, 2], [3, 4]])
+
+    def test_book(self):
+        book = pe.Book.from_numpy({"A": numpy.array([1, 2])})
+        eq_(book.to_dict(), {"A": [[1], [2]]})
+        eq_(book.to_numpy()["A"].tolist(), [[1], [2]])
+
+
+class TestArrow:
+    def setUp(self):
+        if pyarrow is None:
+            raise SkipTest("pyarrow is not installed")
+        self.content = [["X", "Y"], [1, 2.5], [3, ""]]
+
+    def test_round_trip(self):
+        for storage in ["row", "columnar"]:
+            sheet = pe.Sheet(
+                self.content, name_columns_by_row=0, storage=storage
+            )
+            batch = sheet.to_arrow()
+            eq_(batch.schema.names, ["X", "Y"])
+            eq_(batch.column(1).to_pylist(), [2.5, None])
+            sheet = pe.Sheet.from_arrow(batch, storage=storage)
+            eq_(sheet.storage, storage)
+            eq_(sheet.to_array(), self.content)
+
+    def test_row_names(self):
+        sheet = pe.Sheet([["a", 1], ["b", 2]], name_rows_by_column=0)
+        sheet = pe.Sheet.from_arrow(sheet.to_arrow())
+        eq_(sheet.rownames, ["a", "b"])
+        eq_(sheet.colnames, [])
+        eq_(sheet.to_array(), [["a", 1], ["b", 2]])
+
+    def test_buffer_is_shared(self):
+        sheet = pe.Sheet([[1], [2]], storage="columnar")
+        batch = sheet.to_arrow()
+        sheet[0, 0] = 5
+        eq_(batch.column(0).to_pylist(), [5, 2])
+        sheet.row += [3]
+        eq_(sheet.column_at(0), [5, 2, 3])
+
+    def test_book(self):
+        book = pe.Book.from_arrow(
+            {"A": pyarrow.table({"X": [1, None]})}, storage="columnar"
+        )
+        eq_(book.to_dict(), {"A": [["X"], [1], [""]]})
@@ -5,6 +5,7 @@ import datetime
 from base import PyexcelIteratorBase, create_sample_file2
 from pyexcel import Reader, SeriesReader, save_as, get_sheet
 from pyexcel.internal.sheets import Matrix, _shared
+from pyexcel.internal.sheets.matrix import transpose, transpose_uniform
 
 from nose.tools import eq_, raises
 
@@ -117,6 +118,18 @@ class TestMatrixColumn:
         r.delete_columns([0, 2])
         assert r.row[0] == [2, 4, 5, 6]
 
+    def test_delete_repeated_and_invalid_columns(self):
+        r = Matrix(self.data)
+        row = r.row_at(0)
+        r.delete_columns([5, 0, 0, -1, 100, 2])
+        eq_(r.row[0], [2, 4, 5])
+        eq_(r.number_of_columns(), 3)
+        eq_(row, [1, 2, 3, 4, 5, 6])
+
+    def test_keep_mask(self):
+        mask = _shared.keep_mask(4, [3, 0, 3, -1, 4])
+        eq_(mask, bytearray(b"\x00\x01\x01\x00"))
+
     @raises(TypeError)
     def test_delete_wrong_type(self):
         r = Matrix(self.data)
@@ -238,6 +251,17 @@ class TestMatrixRow:
         del r.row[0]
         assert r.row[1] == content
 
+    def test_delete_repeated_and_invalid_rows(self):
+        data = [[index] for index in range(10)]
+        r = Matrix(data)
+        r.delete_rows([9, 0, 4, 4, -2, 10])
+        eq_(r.to_array(), [[1], [2], [3], [5], [6], [7], [8]])
+
+    def test_delete_rows_by_content(self):
+        r = Matrix([[index] for index in range(10)])
+        del r.row[lambda index, row: row[0] % 3]
+        eq_(r.to_array(), [[0], [3], [6], [9]])
+
     def test_delete_a_slice(self):
         """Delete a slice"""
         r2 = Matrix(self.data)
@@ -357,6 +381,47 @@ class TestMatrix:
         m.delete_rows("ab")  # bang, cannot delete
 
 
+class TestLazyTranspose:
+    def setUp(self):
+        self.data = [[1, 2, 3], [4, 5, 6]]
+        self.matrix = Matrix(self.data)
+        self.matrix.transpose()
+
+    def test_read_without_transposing(self):
+        m = self.matrix
+        eq_((m.number_of_rows(), m.number_of_columns()), (3, 2))
+        eq_(m[2, 1], 6)
+        eq_(m.row_at(-1), [3, 6])
+        eq_(m.column_at(1), [4, 5, 6])
+        eq_(list(m.rows()), [[1, 4], [2, 5], [3, 6]])
+        eq_(list(m.rrows()), [[3, 6], [2, 5], [1, 4]])
+        eq_(list(m.columns()), [[1, 2, 3], [4, 5, 6]])
+        eq_(list(m.rcolumns()), [[4, 5, 6], [1, 2, 3]])
+        eq_(list(m.enumerate()), [1, 4, 2, 5, 3, 6])
+        eq_(list(m.vertical()), [1, 2, 3, 4, 5, 6])
+        eq_(self.data, [[1, 2, 3], [4, 5, 6]])
+
+    def test_change_transposes(self):
+        row = self.matrix.row_at(0)
+        self.matrix[0, 1] = "x"
+        eq_(self.matrix.get_internal_array(), [[1, "x"], [2, 5], [3, 6]])
+        eq_(row, [1, 4])
+        eq_(self.data, [[1, 2, 3], [4, 5, 6]])
+
+    def test_transpose_back(self):
+        self.matrix.transpose()
+        eq_(self.matrix.get_internal_array(), self.data)
+
+    def test_transpose_uniform_in_blocks(self):
+        array = [[i, i * 10] for i in range(5)]
+        new_array = transpose_uniform(array, 2, block_size=2)
+        eq_(new_array, [[0, 1, 2, 3, 4], [0, 10, 20, 30, 40]])
+        eq_(array, [])
+
+    def test_transpose_ragged_array(self):
+        eq_(transpose([[1, 2], [3]]), [[1, 3], [2, ""]])
+
+
 class TestIteratableArray(PyexcelIteratorBase):
     def setUp(self):
         """
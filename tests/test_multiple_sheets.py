@@ -449,6 +449,63 @@ class TestAddBooks:
         b3["Sheet1"].row[0] = [3, 3, 3, 3]
         eq_(b1["Sheet1"].row[0], [1, 1, 1, 1])
 
+    def test_added_books_share_data_until_changed(self):
+        b1 = pe.Book({"Sheet1": [[1, 2], [3, 4]], "Sheet2": [[5]]})
+        b2 = pe.Book({"Sheet3": [[6, 7]]})
+        b3 = b1 + b2
+        b3["Sheet1"][0, 0] = 99
+        eq_(b1["Sheet1"].array, [[1, 2], [3, 4]])
+        b1["Sheet2"].row += [[8]]
+        eq_(b3["Sheet2"].array, [[5]])
+        b2["Sheet3"].column += [9]
+        eq_(b3["memory"].array, [[6, 7]])
+        eq_(b3["Sheet1"].array, [[99, 2], [3, 4]])
+
+    def test_arrays_of_added_books_are_not_shared(self):
+        s = pe.Sheet([[1, 2]], name="s")
+        t = pe.Sheet([[3]], name="t")
+        book = s + t
+        book["s"].get_internal_array()[0][0] = "x"
+        book["t"].array[0][0] = "x"
+        b1 = pe.Book({"s": [[1, 2]]})
+        b2 = pe.Book({"u": [[4]], "v": [[5]]})
+        book = b1 + b2
+        book["u"].get_internal_array()[0][0] = "x"
+        next(book["v"].rows())[0] = "x"
+        b1 += b2
+        b1["u"].array[0][0] = "y"
+        eq_(s.array, [[1, 2]])
+        eq_(t.array, [[3]])
+        eq_(b2["u"].array, [[4]])
+        eq_(b2["v"].array, [[5]])
+        eq_(book["u"].array, [["x"]])
+
+    def test_add_book_in_place_shares_data(self):
+        b1 = pe.Book({"Sheet1": [[1, 2]]})
+        b2 = pe.Book({"Sheet2": [[3]], "Sheet3": [[4]]})
+        b1 += b2
+        b1["Sheet2"].delete_rows([0])
+        eq_(b2["Sheet2"].array, [[3]])
+
+    def test_add_columnar_sheets(self):
+        s1 = pe.Sheet([[1, 2], [3, 4]], name="s1", storage="columnar")
+        s2 = pe.Sheet([[1.5]], name="s2", storage="columnar")
+        b3 = s1 + s2
+        b3["s1"][1, 1] = "x"
+        b3["s2"].transpose()
+        eq_(b3["s1"].storage, "columnar")
+        eq_(s1.array, [[1, 2], [3, 4]])
+        eq_(b3["s1"].array, [[1, 2], [3, "x"]])
+
+    def test_add_named_sheet(self):
+        s1 = pe.Sheet([["a", "b"], [1, 2]], name="s1", name_columns_by_row=0)
+        b3 = s1 + pe.Sheet([[3]], name="s2")
+        eq_(b3["s1"].array, [[1, 2]])
+        b3 = pe.Book({"s2": [[3]]}) + s1
+        b3["s1"][0, 0] = "c"
+        eq_(b3["s1"].array, [["c", "b"], [1, 2]])
+        eq_(s1.colnames, ["a", "b"])
+
     @raises(TypeError)
     def test_add_book_error(self):
         """
@@ -137,3 +137,142 @@ class TestPresentation(TestCase):
         +-----+-----+-----+"""
         ).strip("\n")
         self.assertEqual(str(book), content)
+
+
+class TestPreview(TestCase):
+    def setUp(self):
+        self.content = [[i * 10 + j for j in range(6)] for i in range(7)]
+
+    def test_truncated_sheet(self):
+        s = pe.Sheet(self.content)
+        s.preview_rows = 3
+        s.preview_columns = 3
+        content = dedent(
+            """
+            pyexcel sheet:
+            +-----+-----+-----+-----+
+            | 0   | 1   | ... | 5   |
+            +-----+-----+-----+-----+
+            | 10  | 11  | ... | 15  |
+            +-----+-----+-----+-----+
+            | ... | ... | ... | ... |
+            +-----+-----+-----+-----+
+            | 60  | 61  | ... | 65  |
+            +-----+-----+-----+-----+
+            [7 rows x 6 columns]"""
+        ).strip("\n")
+        self.assertEqual(str(s), content)
+
+    def test_truncated_named_sheet(self):
+        s = pe.Sheet(
+            self.content, name_columns_by_row=0, name_rows_by_column=0
+        )
+        self.assertEqual(
+            s.get_texttable(max_rows=2, max_columns=2),
+            dedent(
+                """
+                pyexcel sheet:
+                +-----+-----+-----+-----+
+                |     |  1  | ... |  5  |
+                +=====+=====+=====+=====+
+                | 10  | 11  | ... | 15  |
+                +-----+-----+-----+-----+
+                | ... | ... | ... | ... |
+                +-----+-----+-----+-----+
+                | 60  | 61  | ... | 65  |
+                +-----+-----+-----+-----+
+                [6 rows x 5 columns]"""
+            ).strip("\n"),
+        )
+        self.assertEqual(len(s.colnames), 5)
+
+    def test_unknown_keyword(self):
+        s = pe.Sheet(self.content)
+        with self.assertRaises(TypeError):
+            s.get_texttable(max_row=2)
+        with self.assertRaises(TypeError):
+            pe.Book({"s": self.content}).get_texttable(max_row=2)
+
+    def test_no_limits(self):
+        s = pe.Sheet(self.content)
+        s.preview_rows = None
+        s.preview_columns = None
+        self.assertEqual(str(s), s.texttable)
+
+    def test_sheet_within_limits(self):
+        s = pe.Sheet(self.content)
+        self.assertEqual(str(s), s.texttable)
+        self.assertEqual(s._repr_html_(), s.html)
+
+    def test_truncated_html(self):
+        s = pe.Sheet([["<a>", "b"], [1, 2], [3, 4], [5, 6]])
+        s.name_columns_by_row(0)
+        s.preview_rows = 2
+        content = dedent(
+            """
+            pyexcel sheet:
+            <table>
+            <thead>
+            <tr><th>&lt;a&gt;</th><th>b</th></tr>
+            </thead>
+            <tbody>
+            <tr><td>1</td><td>2</td></tr>
+            <tr><td>...</td><td>...</td></tr>
+            <tr><td>5</td><td>6</td></tr>
+            </tbody>
+            </table>
+            <p>[3 rows x 2 columns]</p>"""
+        ).strip("\n")
+        self.assertEqual(s._repr_html_(), content)
+
+    def test_truncated_book(self):
+        book = pe.Book({"A": [[1]], "B": self.content})
+        book.preview_rows = 2
+        book.preview_columns = 2
+        content = dedent(
+            """
+            A:
+            +---+
+            | 1 |
+            +---+
+            B:
+            +-----+-----+-----+
+            | 0   | ... | 5   |
+            +-----+-----+-----+
+            | ... | ... | ... |
+            +-----+-----+-----+
+            | 60  | ... | 65  |
+            +-----+-----+-----+
+            [7 rows x 6 columns]"""
+        ).strip("\n")
+        self.assertEqual(str(book), content)
+
+    def test_multiple_lines_and_tabs(self):
+        s = pe.Sheet([["a\nbb", "c\td"], ["", "  e  "]])
+        content = dedent(
+            """
+            pyexcel sheet:
+            +----+-----------+
+            | a  | c       d |
+            | bb |           |
+            +----+-----------+
+            |    |   e       |
+            +----+-----------+"""
+        ).strip("\n")
+        self.assertEqual(str(s), content)
+
+    def test_plain_text(self):
+        from pyexcel.plugins.renderers._texttable import _is_plain
+
+        self.assertTrue(_is_plain("abc 123"))
+        self.assertFalse(_is_plain("café"))
+        self.assertFalse(_is_plain("a\tb"))
+        s = pe.Sheet([["café", "中"]])
+        content = dedent(
+            """
+            pyexcel sheet:
+            +------+----+
+            | café | 中 |
+            +------+----+"""
+        ).strip("\n")
+        self.assertEqual(str(s), content)
@@ -1,3 +1,6 @@
+import json
+
+from pyexcel import Sheet
 from pyexcel.internal.sheets.extended_list import PyexcelList
 
 from nose.tools import eq_
@@ -12,3 +15,55 @@ def test_pyexcel_list():
         ["counts", 1, 1, 1, 1],
     ]
     eq_(expected, result)
+
+
+def test_rows_are_list_alike():
+    row = Sheet([[1, 2, 3]]).row[0]
+    eq_(row, [1, 2, 3])
+    eq_([1, 2, 3], row)
+    eq_(row[1:], [2, 3])
+    eq_(row + [4], [1, 2, 3, 4])
+    eq_([0] + row, [0, 1, 2, 3])
+    eq_(list(reversed(row)), [3, 2, 1])
+    eq_(repr(row), "[1, 2, 3]")
+    eq_(row != [1, 2], True)
+
+
+def test_rows_are_lists():
+    sheet = Sheet([[1, "a"], [2, "b"]], storage="columnar")
+    sheet2 = Sheet([[1, "a"], [2, "b"]])
+    sheet2.transpose()
+    for row in (Sheet([[1, "a"]]).row[0], sheet.row[1], sheet2.row[1]):
+        eq_(isinstance(row, list), True)
+        eq_(json.loads(json.dumps(row)), list(row))
+    eq_(isinstance(sheet.row[0:2], list), True)
+    eq_(json.dumps(sheet.row[0:2]), '[[1, "a"], [2, "b"]]')
+
+
+def test_sheet_does_not_see_the_changes_of_its_rows():
+    sheet = Sheet([[1, 2], [3, 4]])
+    row = sheet.row[0]
+    row[0] = 100
+    eq_(sheet.row[0], [1, 2])
+    rows = sheet.row[0:2]
+    del rows[1][0]
+    eq_(sheet.to_array(), [[1, 2], [3, 4]])
+
+
+def test_rows_do_not_see_the_changes_of_the_sheet():
+    sheet = Sheet([[1, 2], [3, 4]])
+    first, second = sheet.row[0], sheet.row[1]
+    sheet[0, 0] = 100
+    sheet.extend_columns([[5, 6]])
+    eq_(first, [1, 2])
+    eq_(second, [3, 4])
+    eq_(sheet.to_array(), [[100, 2, 5], [3, 4, 6]])
+
+
+def test_rows_can_be_put_back():
+    sheet = Sheet([[1, 2], [3, 4]])
+    sheet.row[1] = sheet.row[0]
+    sheet.row += sheet.row[0:1]
+    sheet[1, 1] = 20
+    eq_(sheet.to_array(), [[1, 2], [1, 20], [1, 2]])
+    eq_(isinstance(sheet.to_array()[1], list), True)
@@ -1,8 +1,9 @@
 from textwrap import dedent
 
 from pyexcel import Sheet
+from pyexcel._compact import OrderedDict
 
-from nose.tools import eq_
+from nose.tools import eq_, raises
 
 
 def test_project():
@@ -69,3 +70,277 @@ def test_project_for_exclusion():
     ).strip()
     sheet = sheet.project(["B", "C"], exclusion=True)
     eq_(expected, str(sheet))
+
+
+class TestNameIndices:
+    def setUp(self):
+        self.sheet = Sheet(
+            [["", "A", "B", "C"], ["X", 1, 2, 3], ["Y", 4, 5, 6]],
+            name_columns_by_row=0,
+            name_rows_by_column=0,
+        )
+
+    def test_look_up(self):
+        eq_(self.sheet.column_index_of("B"), 1)
+        eq_(self.sheet.row_index_of("Y"), 1)
+        eq_(self.sheet["Y", "C"], 6)
+        eq_(self.sheet.column.B, [2, 5])
+        eq_(self.sheet.row.X, [1, 2, 3])
+
+    @raises(ValueError)
+    def test_unknown_name(self):
+        self.sheet.column_index_of("D")
+
+    def test_after_deletes(self):
+        self.sheet.delete_columns([0, 0])
+        eq_(self.sheet.column_index_of("C"), 1)
+        del self.sheet.column["B"]
+        eq_(self.sheet.column_index_of("C"), 0)
+        self.sheet.delete_rows([0])
+        eq_(self.sheet.row_index_of("Y"), 0)
+        eq_(self.sheet["Y", "C"], 6)
+
+    def test_after_extend_and_transpose(self):
+        self.sheet.extend_columns(OrderedDict([("D", [7, 8])]))
+        eq_(self.sheet.column["D"], [7, 8])
+        self.sheet.transpose()
+        eq_(self.sheet.row_index_of("D"), 3)
+        eq_(self.sheet.column_index_of("Y"), 1)
+        eq_(self.sheet.row["D"], [7, 8])
+
+    def test_unknown_name_does_not_rebuild_the_positions(self):
+        self.sheet.column_index_of("B")
+        positions = self.sheet._Sheet__column_positions
+        names = positions.names
+        for _ in range(2):
+            try:
+                self.sheet.column_index_of("D")
+            except ValueError:
+                pass
+        eq_(positions.names is names, True)
+        self.sheet.colnames.append("D")
+        eq_(self.sheet.column_index_of("D"), 3)
+
+    def test_names_changed_in_place(self):
+        self.sheet.colnames[2] = "Z"
+        eq_(self.sheet.column_index_of("Z"), 2)
+        eq_(self.sheet.column["Z"], [3, 6])
+
+    def test_select_by_names(self):
+        self.sheet.column.select(["C", "A"])
+        eq_(self.sheet.colnames, ["A", "C"])
+        eq_(self.sheet.column_index_of("C"), 1)
+
+
+class TestValueIndexes:
+    def setUp(self):
+        self.sheet = Sheet(
+            [
+                ["id", "city", "score"],
+                [1, "Leeds", 3.5],
+                [2, "York", ""],
+                [3, "Leeds", 7],
+                [4, "Hull", 1],
+            ],
+            name_columns_by_row=0,
+        )
+
+    def test_lookup(self):
+        eq_(
+            self.sheet.lookup("city", "Leeds"),
+            [[1, "Leeds", 3.5], [3, "Leeds", 7]],
+        )
+        eq_(self.sheet.lookup(0, 2), [[2, "York", ""]])
+        eq_(self.sheet.lookup("city", "Bath"), [])
+
+    def test_index_is_kept_until_a_change(self):
+        index = self.sheet.create_index("city")
+        eq_(self.sheet.create_index(1) is index, True)
+        self.sheet.cell_value(0, 1, "Bath")
+        eq_(self.sheet.create_index("city") is index, False)
+        eq_(self.sheet.lookup("city", "Leeds"), [[3, "Leeds", 7]])
+        self.sheet.row += [[5, "Leeds", 2]]
+        eq_(len(self.sheet.lookup("city", "Leeds")), 2)
+        del self.sheet.row[0]
+        self.sheet.column.format("id", str)
+        eq_(self.sheet.lookup("id", "3"), [["3", "Leeds", 7]])
+
+    def test_index_is_dropped_when_rows_are_handed_out(self):
+        sheet = Sheet([[1, "a"], [2, "b"]])
+        sheet.create_index(0)
+        sheet.get_internal_array()[0][0] = 7
+        eq_(sheet.lookup(0, 7), [[7, "a"]])
+        eq_(sheet.lookup(0, 1), [])
+        sheet.to_array()[1][0] = 8
+        eq_(sheet.lookup(0, 8), [[8, "b"]])
+        next(sheet.rows())[0] = 9
+        eq_(sheet.lookup(0, 9), [[9, "a"]])
+
+    def test_where(self):
+        eq_(
+            self.sheet.where("score", ">", 2).to_array(),
+            [["id", "city", "score"], [1, "Leeds", 3.5], [3, "Leeds", 7]],
+        )
+        eq_(self.sheet.where("score", "<=", 3.5).column["id"], [1, 4])
+        eq_(self.sheet.where("score", "==", 7).column["id"], [3])
+        eq_(self.sheet.where("score", "!=", 7).column["id"], [1, 2, 4])
+        eq_(self.sheet.where("city", ">=", "Leeds").column["id"], [1, 2, 3])
+        eq_(self.sheet.where("score", "<", "a").number_of_rows(), 1)
+
+    def test_where_gives_a_copy(self):
+        selected = self.sheet.where("id", "<", 2)
+        selected.cell_value(0, 1, "Bath")
+        eq_(self.sheet.cell_value(0, 1), "Leeds")
+
+    @raises(ValueError)
+    def test_unknown_operator(self):
+        self.sheet.where("id", "~", 1)
+
+    @raises(ValueError)
+    def test_unknown_index(self):
+        self.sheet.create_index("id", "bitmap")
+
+    def test_join(self):
+        cities = Sheet(
+            [["name", "county"], ["Leeds", "West"], ["York", "North"]],
+            name_columns_by_row=0,
+        )
+        joined = self.sheet.join(cities, "city", "name")
+        eq_(joined.colnames, ["id", "city", "score", "county"])
+        eq_(
+            joined.to_array()[1:],
+            [
+                [1, "Leeds", 3.5, "West"],
+                [2, "York", "", "North"],
+                [3, "Leeds", 7, "West"],
+            ],
+        )
+        joined = self.sheet.join(cities, 1, 0, how="left")
+        eq_(joined.column["county"], ["West", "North", "West", ""])
+
+    def test_join_skips_empty_keys(self):
+        other = Sheet(
+            [["score", "note"], ["", "none"], [7, "seven"]],
+            name_columns_by_row=0,
+        )
+        joined = self.sheet.join(other, "score")
+        eq_(
+            joined.to_array(),
+            [["id", "city", "score", "note"], [3, "Leeds", 7, "seven"]],
+        )
+
+    @raises(ValueError)
+    def test_unknown_join(self):
+        self.sheet.join(self.sheet, "id", how="outer")
+
+
+class TestAppendRows:
+    def setUp(self):
+        self.sheet = Sheet([[1, 2], [3, 4]])
+
+    def test_append_from_a_generator(self):
+        self.sheet.append_rows(([i, i * 2] for i in range(5, 7)))
+        eq_(self.sheet.to_array(), [[1, 2], [3, 4], [5, 10], [6, 12]])
+
+    def test_pad_new_rows(self):
+        self.sheet.append_rows([[5], (None, 6)])
+        eq_(self.sheet.to_array(), [[1, 2], [3, 4], [5, ""], ["", 6]])
+
+    def test_wider_rows_pad_the_others(self):
+        row = self.sheet.row[0]
+        self.sheet.append_rows([[5, 6, 7]])
+        eq_(self.sheet.number_of_columns(), 3)
+        eq_(self.sheet.to_array(), [[1, 2, ""], [3, 4, ""], [5, 6, 7]])
+        eq_(row, [1, 2])
+
+    def test_rows_are_copied(self):
+        row = [5, 6]
+        self.sheet.append_rows([row])
+        row.append(7)
+        eq_(self.sheet.row[2], [5, 6])
+
+    def test_after_all_rows_are_deleted(self):
+        del self.sheet.row[0:]
+        self.sheet.append_rows([[1]])
+        eq_(self.sheet.to_array(), [[1]])
+
+    def test_columnar_storage(self):
+        sheet = Sheet([[1, 2]], storage="columnar")
+        sheet.append_rows(iter([[3], [4, 5, 6]]))
+        eq_(sheet.to_array(), [[1, 2, ""], [3, "", ""], [4, 5, 6]])
+
+    @raises(TypeError)
+    def test_sheet_with_row_names(self):
+        sheet = Sheet([["a", 1]], name_rows_by_column=0)
+        sheet.append_rows([["b", 2]])
+
+
+def test_incremental_changes_keep_the_sheet_uniform():
+    sheet = Sheet([[1, 2], [3, 4]])
+    sheet.cell_value(3, 1, 9)
+    eq_(sheet.to_array(), [[1, 2], [3, 4], ["", ""], ["", 9]])
+    sheet.set_row_at(0, [1])
+    eq_(sheet.row[0], [1, ""])
+    sheet.set_row_at(1, [3, 4, 5])
+    eq_(sheet.to_array()[1:], [[3, 4, 5], ["", "", ""], ["", 9, ""]])
+    sheet.row += [[None]]
+    eq_(sheet.row[-1], ["", "", ""])
+    sheet.set_column_at(0, [7, 7, 7, 7, 7, 7], 1)
+    eq_(sheet.column[0], [1, 7, 7, 7, 7, 7, 7])
+    eq_(sheet.row[-1], [7, "", ""])
+
+
+class TestClone:
+    def setUp(self):
+        self.sheet = Sheet(
+            [["a", "b"], [1, 2], [3, 4]], name="s", name_columns_by_row=0
+        )
+
+    def test_names_are_kept(self):
+        clone = self.sheet.clone()
+        eq_(clone.name, "s")
+        eq_(clone.colnames, ["a", "b"])
+        eq_(clone.column["b"], [2, 4])
+        clone.colnames[0] = "c"
+        eq_(self.sheet.colnames, ["a", "b"])
+
+    def test_changed_rows_are_copied(self):
+        clone = self.sheet.clone()
+        clone[0, 0] = 9
+        eq_(self.sheet.to_array(), [["a", "b"], [1, 2], [3, 4]])
+        self.sheet[1, "b"] = 5
+        self.sheet.row += [[6, 7]]
+        eq_(clone.to_array(), [["a", "b"], [9, 2], [3, 4]])
+        eq_(self.sheet.to_array(), [["a", "b"], [1, 2], [3, 5], [6, 7]])
+
+    def test_whole_sheet_changes(self):
+        clone = self.sheet.clone()
+        clone.format(str)
+        self.sheet.transpose()
+        eq_(clone.to_array(), [["a", "b"], ["1", "2"], ["3", "4"]])
+        eq_(self.sheet.to_array(), [["a", 1, 3], ["b", 2, 4]])
+
+    def test_clone_of_a_clone(self):
+        clone = self.sheet.clone()
+        clone2 = clone.clone()
+        clone.delete_columns([0])
+        clone2[0, 1] = 0
+        eq_(self.sheet.to_array(), [["a", "b"], [1, 2], [3, 4]])
+        eq_(clone.to_array(), [["b"], [2], [4]])
+        eq_(clone2.to_array(), [["a", "b"], [1, 0], [3, 4]])
+
+    def test_rows_handed_out_are_not_shared(self):
+        expected = [["a", "b"], [1, 2], [3, 4]]
+        clone = self.sheet.clone()
+        clone.array[0][0] = "x"
+        clone = self.sheet.clone()
+        clone.get_internal_array()[0][1] = "x"
+        clone = self.sheet.clone()
+        next(clone.rows())[0] = "x"
+        eq_(self.sheet.to_array(), expected)
+        clone = self.sheet.clone()
+        clone[1, 0] = 0
+        clone.get_internal_array()[0][0] = "x"
+        self.sheet.get_internal_array()[1][1] = "y"
+        eq_(clone.to_array(), [["a", "b"], ["x", 2], [0, 4]])
+        eq_(self.sheet.to_array(), [["a", "b"], [1, 2], [3, "y"]])
@@ -1,10 +1,12 @@
 from textwrap import dedent
 
+import pyexcel as pe
+
 from pyexcel.internal.common import get_sheet_headers
 from pyexcel.internal.generators import SheetStream
 from pyexcel.plugins.sources.output_to_memory import WriteSheetToMemory
 
-from nose.tools import eq_
+from nose.tools import eq_, raises
 from pyexcel_io import manager as manager
 
 
@@ -32,3 +34,54 @@ def test_get_sheet_headers():
     sheet_stream = SheetStream("test", data)
     colnames_array = get_sheet_headers(sheet_stream)
     eq_(colnames_array, ["a", "b", "c"])
+
+
+class TestLazyOperators:
+    def setUp(self):
+        self.data = [["a", "b", "c"], [1, 2, 3], [4, 5, 6], [7, 8]]
+        self.consumed = 0
+
+    def _rows(self):
+        for row in self.data:
+            self.consumed += 1
+            yield row
+
+    def test_operators_are_lazy(self):
+        stream = pe.iget_sheet(array=self._rows(), header=True)
+        stream = stream.filter(lambda row: row[0] > 1).map(str).limit(1)
+        eq_(self.consumed, 0)
+        eq_(list(stream), [["a", "b", "c"], ["4", "5", "6"]])
+        eq_(self.consumed, 3)
+
+    def test_project_and_rename(self):
+        stream = pe.iget_sheet(array=self._rows(), header=True)
+        stream = stream.project(["c", 0]).rename({"c": "C"})
+        eq_(list(stream), [["C", "a"], [3, 1], [6, 4], ["", 7]])
+
+    def test_without_header(self):
+        stream = pe.iget_sheet(array=self._rows())
+        stream = stream.skip(1).map_rows(lambda row: row[::-1]).head(2)
+        eq_(stream.array, [[3, 2, 1], [6, 5, 4]])
+
+    @raises(ValueError)
+    def test_project_by_name_without_header(self):
+        pe.iget_sheet(array=self._rows()).project(["a"])
+
+    def test_save_as(self):
+        stream = pe.iget_sheet(array=self._rows(), header=True)
+        stream = stream.project(["b"]).rename(["B"])
+        io = pe.isave_as(
+            sheet_stream=stream, dest_file_type="csv", dest_lineterminator="\n"
+        )
+        eq_(io.getvalue(), "B\n2\n5\n8\n")
+        eq_(self.consumed, 4)
+
+    def test_save_a_file_stream(self):
+        io = pe.isave_as(array=self.data, dest_file_type="csv")
+        stream = pe.iget_sheet(
+            file_type="csv", file_content=io.getvalue(), header=True
+        )
+        stream = stream.filter(lambda row: row[0] > 1).project(["b"])
+        io = stream.save_to_memory("csv", lineterminator="\n")
+        eq_(io.getvalue(), "b\n5\n8\n")
+        pe.free_resources()
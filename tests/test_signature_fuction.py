@@ -1,7 +1,9 @@
 import os
 from types import GeneratorType
+from unittest.mock import patch
 
 import pyexcel as pe
+from pyexcel import instrumentation
 from db import Base, Session, Signature, Signature2, engine
 from _compact import OrderedDict
 
@@ -292,6 +294,46 @@ class TestiGetRecords:
         result = pe.iget_records(records=data)
         eq_(list(result), [{"X": 1, "Y": 2, "Z": 3}, {"X": 4, "Y": 5, "Z": 6}])
 
+    def test_get_typed_records_with_inferred_schema(self):
+        data = [["X", "Y", "Z"], [1, 2.5, "a"], [4, 5, ""], ["7", "", 8]]
+        result = list(pe.iget_records(array=data, schema="infer"))
+        eq_(result, [(1, 2.5, "a"), (4, 5.0, ""), ("7", "", 8)])
+        eq_(result[1].Y, 5.0)
+        eq_(result[0]._fields, ("X", "Y", "Z"))
+
+    def test_get_typed_records_from_a_sample(self):
+        data = [["X"], [1], ["2"]]
+        result = pe.iget_records(array=data, schema="infer", sample_size=1)
+        eq_([record.X for record in result], [1, 2])
+
+    def test_get_typed_records_with_given_schema(self):
+        data = [["X", "Y", "Z"], ["1", "2", "3"], ["4", "5"]]
+        result = pe.iget_records(
+            array=data,
+            schema={"X": int, "Z": float},
+            custom_headers=["Z", "X"],
+        )
+        eq_(list(result), [(3.0, 1), ("", 4)])
+
+    def test_get_records_with_empty_custom_headers(self):
+        data = [["X", "Y"], [1, 2]]
+        result = pe.iget_records(array=data, schema={}, custom_headers=[])
+        eq_(list(result), [(1, 2)])
+        result = pe.iget_records(array=data, custom_headers=[])
+        eq_(list(result), [{"X": 1, "Y": 2}])
+        result = pe.get_records(array=data, custom_headers=[])
+        eq_(result, [{"X": 1, "Y": 2}])
+
+    def test_get_typed_records_with_odd_column_names(self):
+        data = [["a b", 1, "a b"], [1, 2, 3]]
+        record = next(pe.iget_records(array=data, schema={}))
+        eq_(record._fields, ("_0", "_1", "_2"))
+        eq_(record._asdict(), {"_0": 1, "_1": 2, "_2": 3})
+
+    @raises(ValueError)
+    def test_get_typed_records_with_invalid_schema(self):
+        list(pe.iget_records(array=[["X"], [1]], schema=[int]))
+
 
 class TestSavingToDatabase:
     def setUp(self):
@@ -434,6 +476,83 @@ class TestSavingToDatabase:
         result = pe.get_dict(session=self.session, table=Signature2)
         assert result == {"A": [1, 4], "B": [2, 5], "C": [3, 6]}
 
+    def test_save_in_batches(self):
+        data = [["X", "Y", "Z"]] + [[i, i * 2, ""] for i in range(5)]
+        sheet = pe.Sheet(data, name_columns_by_row=0)
+        with instrumentation.observe() as aggregator:
+            sheet.save_to_database(self.session, Signature, batch_size=2)
+        summary = aggregator.summary()[("save_to_database", "insert")]
+        eq_(summary["count"], 3)
+        eq_(summary["rows"], 5)
+        result = pe.get_dict(session=self.session, table=Signature)
+        eq_(result["Y"], [0, 2, 4, 6, 8])
+        eq_(result["Z"], [""] * 5)
+
+    def test_isave_as_in_batches(self):
+        rows = iter([["A", "B", "C"], [1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        mapdict = {"A": "X", "B": "Y", "C": "Z"}
+        pe.isave_as(
+            array=rows,
+            dest_session=self.session,
+            dest_table=Signature,
+            dest_mapdict=mapdict,
+            dest_batch_size=2,
+        )
+        result = pe.get_dict(session=self.session, table=Signature)
+        eq_(result, {"X": [1, 4, 7], "Y": [2, 5, 8], "Z": [3, 6, 9]})
+
+    def test_save_in_batches_with_initializer(self):
+        data = [["X", "Y", "Z"], [1, 2, 3], [4, 5, 6]]
+        sheet = pe.Sheet(data, name_columns_by_row=0)
+
+        def make_signature(row):
+            return Signature(X=row["X"], Y=row["Y"] * 10, Z=row["Z"])
+
+        sheet.save_to_database(
+            self.session, Signature, initializer=make_signature, batch_size=1
+        )
+        result = pe.get_dict(session=self.session, table=Signature)
+        eq_(result, {"X": [1, 4], "Y": [20, 50], "Z": [3, 6]})
+
+    def test_failed_batch_is_rolled_back(self):
+        data = [["X", "Y", "Z"], [1, 2, 3], [4, 5, 6], [4, 7, 8]]
+        sheet = pe.Sheet(data, name_columns_by_row=0)
+        try:
+            sheet.save_to_database(self.session, Signature, batch_size=2)
+        except Exception:
+            pass
+        else:
+            raise AssertionError("duplicated key is expected to fail")
+        result = pe.get_dict(session=self.session, table=Signature)
+        eq_(result, {"X": [1, 4], "Y": [2, 5], "Z": [3, 6]})
+
+    def test_save_book_in_batches(self):
+        data = [["X", "Y", "Z"], [1, 2, 3], [4, 5, 6]]
+        data1 = [["A", "B", "C"], [1, 2, 3]]
+        sheet_dict = {
+            Signature.__tablename__: data,
+            Signature2.__tablename__: data1,
+        }
+        pe.save_book_as(
+            bookdict=sheet_dict,
+            dest_session=self.session,
+            dest_tables=[Signature, Signature2],
+            dest_batch_size=1,
+        )
+        result = pe.get_dict(session=self.session, table=Signature)
+        eq_(result, {"X": [1, 4], "Y": [2, 5], "Z": [3, 6]})
+        result = pe.get_dict(session=self.session, table=Signature2)
+        eq_(result, {"A": [1], "B": [2], "C": [3]})
+
+    @raises(pe.exceptions.NoMatchingTable)
+    def test_save_book_in_batches_without_a_table(self):
+        pe.save_book_as(
+            bookdict={"unknown": [["X"], [1]]},
+            dest_session=self.session,
+            dest_tables=[Signature],
+            dest_batch_size=1,
+        )
+
 
 class TestSQL:
     def setUp(self):
@@ -461,6 +580,34 @@ class TestSQL:
         sheet = pe.get_sheet(session=Session(), table=Signature)
         assert sheet.to_array() == [["X", "Y", "Z"], [1, 2, 3], [4, 5, 6]]
 
+    def test_get_sheet_from_sql_in_batches(self):
+        sheet = pe.get_sheet(session=Session(), table=Signature, batch_size=1)
+        eq_(sheet.to_array(), [["X", "Y", "Z"], [1, 2, 3], [4, 5, 6]])
+
+    def test_iget_array_from_sql_in_batches(self):
+        rows = pe.iget_array(
+            session=Session(),
+            table=Signature,
+            export_columns=["Z", "X"],
+            batch_size=1,
+        )
+        assert isinstance(rows, GeneratorType)
+        eq_(list(rows), [["Z", "X"], [3, 1], [6, 4]])
+
+    def test_iget_records_from_query_sets_in_batches(self):
+        query = Session().query(Signature).order_by(Signature.X.desc())
+        records = pe.iget_records(
+            column_names=["X", "Y"], query_sets=query, batch_size=1
+        )
+        assert isinstance(records, GeneratorType)
+        eq_(list(records), [{"X": 4, "Y": 5}, {"X": 1, "Y": 2}])
+
+    def test_get_empty_table_in_batches(self):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        array = pe.get_array(session=Session(), table=Signature, batch_size=1)
+        eq_(array, pe.get_array(session=Session(), table=Signature))
+
     def test_get_array_from_sql(self):
         array = pe.get_array(session=Session(), table=Signature)
         assert array == [["X", "Y", "Z"], [1, 2, 3], [4, 5, 6]]
@@ -542,6 +689,47 @@ class TestGetBook:
         assert book2.to_dict() == content
         os.unlink(test_file)
 
+    def test_get_book_with_a_thread_pool(self):
+        content = _produce_ordered_dict()
+        book = pe.get_book(bookdict=content, workers=2)
+        eq_(book.to_dict(), content)
+
+    def test_get_book_with_a_process_pool(self):
+        test_file = "test_get_book.xls"
+        content = _produce_ordered_dict()
+        pe.save_book_as(dest_file_name=test_file, bookdict=content)
+        book = pe.get_book(file_name=test_file, workers=2, executor="process")
+        eq_(book.to_dict(), content)
+        eq_(book.filename, test_file)
+        os.unlink(test_file)
+
+    def test_sheets_are_read_in_the_threads(self):
+        test_file = "test_get_book.xls"
+        content = _produce_ordered_dict()
+        pe.save_book_as(dest_file_name=test_file, bookdict=content)
+        get_sheet_stream = pe.internal.core.get_sheet_stream
+        with patch(
+            "pyexcel.internal.core.get_sheet_stream",
+            side_effect=get_sheet_stream,
+        ) as read_sheet:
+            book = pe.get_book(file_name=test_file, workers=2)
+        eq_(book.to_dict(), content)
+        names = [call[1]["sheet_name"] for call in read_sheet.call_args_list]
+        eq_(sorted(names), list(content.keys()))
+        os.unlink(test_file)
+
+    def test_get_book_from_a_dict_with_a_process_pool(self):
+        content = _produce_ordered_dict()
+        content["Sheet4"] = [[1, 2], [3]]
+        book = pe.get_book(bookdict=content, workers=2, executor="process")
+        eq_(book["Sheet4"].to_array(), [[1, 2], [3, ""]])
+        book["Sheet4"][1, 1] = 4
+        eq_(book["Sheet4"].to_array(), [[1, 2], [3, 4]])
+
+    @raises(ValueError)
+    def test_get_book_with_unknown_executor(self):
+        pe.get_book(bookdict=_produce_ordered_dict(), workers=2, executor="x")
+
     def test_get_book_from_memory(self):
         content = _produce_ordered_dict()
         io = pe.save_book_as(dest_file_type="xls", bookdict=content)